@@ -1,12 +1,23 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-import plotly.graph_objects as go
-import requests
 import json
+import re
+import uuid
 from datetime import datetime
 import time
 
+from utils import advisor
+from utils.advisor import OFFLINE_MESSAGE, QUICK_QUESTIONS
+from utils.assessment_store import profile_key
+from utils.async_advisor import ask_many, field_prompt
+from utils.scoring_session import ScoringSession
+from components.services import (engine_version, get_assessment_store, get_cohort_cube, get_course_search,
+                                 get_http_client, get_industry_ranker, get_industry_skills, get_response_cache)
+from components.figure_cache import show_figure
+from config import ASSESSMENT_STORE, FUTURE_INDUSTRIES, STEM_FIELDS
+from utils.cohort_cubes import DIMENSIONS, MEASURES
+
 # Page configuration
 st.set_page_config(
     page_title="Career Shift to Future STEM Industry",
@@ -106,11 +117,27 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Initialize session state
+# Returning visitors are recognised by the ?user= id kept in their URL. It is a bearer
+# key, not a login: whoever has the link can read that user's stored history
+if 'user_id' not in st.session_state:
+    user_id = st.query_params.get("user", "")
+    st.session_state.user_id = user_id if re.fullmatch(r"[0-9a-f]{32}", user_id) else uuid.uuid4().hex
+if st.query_params.get("user") != st.session_state.user_id:
+    st.query_params["user"] = st.session_state.user_id
+
+# Initialize session state from the user's stored history, so a refresh loses nothing
+store = get_assessment_store()
 if 'chat_history' not in st.session_state:
-    st.session_state.chat_history = []
+    st.session_state.chat_history = [
+        {"question": turn["question"], "answer": turn["answer"],
+         "timestamp": datetime.fromtimestamp(turn["created_at"]).strftime("%H:%M")}
+        for turn in store.chat_history(st.session_state.user_id, ASSESSMENT_STORE["history_limit"])
+    ]
 if 'assessment_done' not in st.session_state:
-    st.session_state.assessment_done = False
+    st.session_state.last_self_assessment = store.latest_self_assessment(st.session_state.user_id)
+    st.session_state.assessment_done = st.session_state.last_self_assessment is not None
+if 'saved_assessment' not in st.session_state:
+    st.session_state.saved_assessment = store.load_assessment(st.session_state.user_id)
 
 # Market data
 MARKET_DATA = {
@@ -121,164 +148,34 @@ MARKET_DATA = {
     'total_jobs': 56360
 }
 
-# STEM fields configuration
-STEM_FIELDS = {
-    'AI & Machine Learning 🤖': {
-        'courses': ['Python for AI', 'Machine Learning Fundamentals', 'Deep Learning with TensorFlow', 'Natural Language Processing'],
-        'salary_range': '$95K - $190K',
-        'growth_rate': '+25%',
-        'description': 'Build intelligent systems that transform industries',
-        'skills': ['Python', 'TensorFlow', 'Scikit-learn', 'Statistics'],
-        'timeline': '8-12 months'
-    },
-    'Data Science 📊': {
-        'courses': ['Python for Data Analysis', 'Statistical Modeling', 'Data Visualization', 'Big Data Analytics'],
-        'salary_range': '$85K - $170K',
-        'growth_rate': '+18%', 
-        'description': 'Extract insights from complex data',
-        'skills': ['Python', 'SQL', 'Tableau', 'R'],
-        'timeline': '6-10 months'
-    },
-    'Cybersecurity 🔒': {
-        'courses': ['Network Security', 'Ethical Hacking', 'Security Architecture', 'Digital Forensics'],
-        'salary_range': '$75K - $155K',
-        'growth_rate': '+15%',
-        'description': 'Protect digital assets and infrastructure', 
-        'skills': ['Networking', 'Linux', 'Security Tools', 'Risk Assessment'],
-        'timeline': '6-9 months'
-    },
-    'Cloud Computing ☁️': {
-        'courses': ['AWS Fundamentals', 'Azure Architecture', 'DevOps with Docker', 'Kubernetes Orchestration'],
-        'salary_range': '$90K - $185K',
-        'growth_rate': '+28%',
-        'description': 'Scale applications globally with cloud infrastructure',
-        'skills': ['AWS', 'Docker', 'Kubernetes', 'DevOps'],
-        'timeline': '5-8 months'
-    }
-}
-
 # AI Integration with OpenRouter
-def get_ai_response(prompt, context="career_advice"):
-    """Enhanced AI response using OpenRouter Qwen QwQ 32B"""
+def stream_ai_response(prompt, context="career_advice", status=None):
+    """Stream an AI response from OpenRouter Qwen QwQ 32B, token by token"""
     try:
         api_key = st.secrets["OPENROUTER_API_KEY"]
         model = st.secrets["OPENROUTER_MODEL"]
-        
-        url = "https://openrouter.ai/api/v1/chat/completions"
-        
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://career-shift-analyzer.streamlit.app",
-            "X-Title": "STEM Career Advisor"
-        }
-        
-        system_prompt = """You are an expert STEM career advisor with 15+ years of experience helping professionals transition into technology careers. 
-
-Provide practical, actionable advice that is:
-- Specific and detailed
-- Based on current market trends
-- Includes realistic timelines
-- Mentions specific tools/skills/certifications
-- Encouraging but honest about challenges
-
-Keep responses under 300 words and well-structured."""
-
-        payload = {
-            "model": model,
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt}
-            ],
-            "max_tokens": 400,
-            "temperature": 0.7,
-            "top_p": 0.9
-        }
-        
-        response = requests.post(url, headers=headers, json=payload, timeout=15)
-        
-        if response.status_code == 200:
-            result = response.json()
-            return result['choices'][0]['message']['content']
-        else:
-            return "I'm here to help with your STEM career questions! The AI service is temporarily busy, but I can still provide guidance through our interactive features."
-            
-    except Exception as e:
-        return f"I'm ready to assist with your STEM career journey! While the AI connects, explore our course catalog and market analysis features."
+    except Exception:
+        yield OFFLINE_MESSAGE
+        return
+    
+    yield from advisor.stream_ai_response(prompt, api_key, model, cache=get_response_cache(),
+                                          client=get_http_client(api_key), status=status)
 
-# Enhanced visualizations
-def create_interactive_growth_chart():
-    """Create enhanced growth projections"""
-    years = list(range(2023, 2031))
-    
-    data = {
-        'Year': years,
-        'AI/ML': [100 * (1.25 ** (i/4)) for i in range(len(years))],
-        'Cloud Computing': [100 * (1.28 ** (i/4)) for i in range(len(years))],
-        'Data Science': [100 * (1.18 ** (i/4)) for i in range(len(years))],
-        'Cybersecurity': [100 * (1.15 ** (i/4)) for i in range(len(years))]
-    }
+def get_ai_responses(prompts):
+    """Answer several prompts concurrently, in order"""
+    try:
+        api_key = st.secrets["OPENROUTER_API_KEY"]
+        model = st.secrets["OPENROUTER_MODEL"]
+    except Exception:
+        return [OFFLINE_MESSAGE] * len(prompts)
     
-    df = pd.DataFrame(data)
-    fig = px.line(df, x='Year', y=['AI/ML', 'Cloud Computing', 'Data Science', 'Cybersecurity'],
-                  title='📈 STEM Career Growth Projections (2023-2030)',
-                  color_discrete_map={
-                      'AI/ML': '#00f0ff',
-                      'Cloud Computing': '#b347d9', 
-                      'Data Science': '#00d4aa',
-                      'Cybersecurity': '#ff6b6b'
-                  })
-    
-    fig.update_layout(
-        height=500,
-        font=dict(color='#ffffff', size=12),
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        title_font_size=18,
-        legend=dict(bgcolor='rgba(0,0,0,0)', bordercolor='rgba(255,255,255,0.1)', borderwidth=1),
-        xaxis=dict(gridcolor='rgba(255,255,255,0.1)'),
-        yaxis=dict(gridcolor='rgba(255,255,255,0.1)')
-    )
-    return fig
+    return ask_many(prompts, api_key, model, cache=get_response_cache(), client=get_http_client(api_key))
 
-def create_salary_comparison_chart():
-    """Enhanced salary comparison"""
-    fields = ['AI/ML', 'Cloud Computing', 'Data Science', 'Cybersecurity']
-    min_salaries = [95000, 90000, 85000, 75000]
-    max_salaries = [190000, 185000, 170000, 155000]
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Bar(
-        name='Starting Range',
-        x=fields,
-        y=min_salaries,
-        marker_color='rgba(0, 240, 255, 0.7)',
-        text=[f'${x//1000}K' for x in min_salaries],
-        textposition='auto'
-    ))
-    
-    fig.add_trace(go.Bar(
-        name='Senior Range',
-        x=fields,
-        y=max_salaries,
-        marker_color='rgba(179, 71, 217, 0.8)',
-        text=[f'${x//1000}K' for x in max_salaries],
-        textposition='auto'
-    ))
-    
-    fig.update_layout(
-        title='💰 STEM Salary Ranges (USD)',
-        barmode='group',
-        height=450,
-        font=dict(color='#ffffff'),
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        title_font_size=18,
-        xaxis=dict(gridcolor='rgba(255,255,255,0.1)'),
-        yaxis=dict(gridcolor='rgba(255,255,255,0.1)')
-    )
-    return fig
+def format_course(course):
+    """One-line catalog course summary with link, platform, duration, price and rating"""
+    price = "Free" if course['price_usd'] == 0 else f"${course['price_usd']:,.2f}"
+    return (f"[{course['course_name']}]({course['url']}) — {course['platform']}, {course['difficulty']}, "
+            f"{course['duration_weeks']} weeks, {price}, ⭐ {course['rating']}")
 
 # Main application
 def main():
@@ -290,13 +187,15 @@ def main():
     st.sidebar.title("🎯 Navigation")
     page = st.sidebar.selectbox("Choose your path:", 
                                ["🏠 Home", "📈 Market Intelligence", "📚 Course Catalog", 
-                                "🤖 AI Career Advisor", "🎯 Skill Assessment"])
+                                "🤖 AI Career Advisor", "🎯 Skill Assessment", "👥 Cohort Analytics"])
     
     # Live metrics in sidebar
     st.sidebar.markdown("### 📊 Live Market Data")
     st.sidebar.metric("🔥 Total STEM Jobs", f"{MARKET_DATA['total_jobs']:,}")
     st.sidebar.metric("🚀 AI/ML Positions", f"{MARKET_DATA['ai_ml_jobs']:,}")
     st.sidebar.metric("☁️ Cloud Jobs", f"{MARKET_DATA['cloud_jobs']:,}")
+    st.sidebar.caption("🔗 Your progress is saved under this page's link. Anyone who has the link "
+                       "can see your saved assessments and advisor chats, so keep it private.")
     
     # Page content
     if page == "🏠 Home":
@@ -353,13 +252,12 @@ def main():
         # Enhanced charts
         col1, col2 = st.columns(2)
         
+        # Static charts are built once per process and replayed on reruns
         with col1:
-            fig1 = create_interactive_growth_chart()
-            st.plotly_chart(fig1, use_container_width=True)
+            show_figure("growth_projections")
         
         with col2:
-            fig2 = create_salary_comparison_chart()
-            st.plotly_chart(fig2, use_container_width=True)
+            show_figure("salary_ranges")
         
         # Market insights
         st.markdown("### 📊 Key Market Insights")
@@ -378,7 +276,8 @@ def main():
     elif page == "📚 Course Catalog":
         st.header("📚 STEM Learning Catalog")
         
-        selected_field = st.selectbox("Select STEM Field:", list(STEM_FIELDS.keys()))
+        selected_field = st.selectbox("Select STEM Field:", list(STEM_FIELDS.keys()),
+                                      format_func=lambda field: f"{field} {STEM_FIELDS[field]['icon']}")
         
         if selected_field:
             field_data = STEM_FIELDS[selected_field]
@@ -387,7 +286,7 @@ def main():
             
             with col1:
                 # Field header
-                st.markdown(f"## {selected_field}")
+                st.markdown(f"## {selected_field} {field_data['icon']}")
                 st.write(f"**Description:** {field_data['description']}")
                 
                 # Field details in organized sections
@@ -397,15 +296,24 @@ def main():
                 with info_col1:
                     st.metric("💵 Salary Range", field_data['salary_range'])
                 with info_col2:
-                    st.metric("📈 Growth Rate", field_data['growth_rate'])
+                    st.metric("📈 Growth Rate", field_data['growth'])
                 with info_col3:
                     st.metric("⏱️ Timeline", field_data['timeline'])
                 
                 # Recommended courses
                 st.markdown("### 📚 Recommended Courses")
                 
-                for i, course in enumerate(field_data['courses'], 1):
-                    st.write(f"**{i}.** {course}")
+                course_search = get_course_search()
+                if field_data['industry']:
+                    catalog_courses = course_search.search(industry=field_data['industry'], k=4)
+                else:
+                    catalog_courses = course_search.search(skills=field_data['skills'], k=4)
+                if catalog_courses:
+                    for i, course in enumerate(catalog_courses, 1):
+                        st.write(f"**{i}.** {format_course(course)}")
+                else:
+                    for i, course in enumerate(field_data['courses'], 1):
+                        st.write(f"**{i}.** {course}")
                 
                 # Key skills section
                 st.markdown("### 🛠️ Essential Skills to Master")
@@ -440,7 +348,7 @@ def main():
                     st.markdown("### 🎉 Your Learning Plan is Ready!")
                     
                     st.info(f"""
-                    **🎯 Field:** {selected_field}
+                    **🎯 Field:** {selected_field} {field_data['icon']}
                     
                     **⏱️ Timeline:** {field_data['timeline']}
                     
@@ -461,6 +369,9 @@ def main():
                     st.write("4. **Join community** - Connect with learners")
                     st.write("5. **Stay consistent** - Track your progress")
                 
+                if st.button("🤖 Ask AI Advisor About This Field", use_container_width=True):
+                    st.write_stream(stream_ai_response(field_prompt(selected_field)))
+                
                 # Additional resources
                 st.markdown("### 📖 Additional Resources")
                 
@@ -478,8 +389,7 @@ def main():
                 # Market demand indicator
                 st.markdown("### 📊 Market Demand")
                 
-                demand_score = {"AI & Machine Learning 🤖": 95, "Data Science 📊": 88, "Cybersecurity 🔒": 82, "Cloud Computing ☁️": 97}
-                field_demand = demand_score.get(selected_field, 85)
+                field_demand = field_data.get('demand_score', 85)
                 
                 st.progress(field_demand / 100)
                 st.write(f"**Demand Level:** {field_demand}/100")
@@ -490,6 +400,33 @@ def main():
                     st.info("📈 **High Demand** - Strong job market")
                 else:
                     st.warning("📊 **Moderate Demand** - Steady opportunities")
+        
+        # Search the full catalog for skill gaps
+        st.markdown("---")
+        st.markdown("### 🔎 Find Courses for Your Skill Gaps")
+        
+        course_search = get_course_search()
+        search_col1, search_col2, search_col3 = st.columns([2, 1, 1])
+        with search_col1:
+            gap_skills = st.multiselect("Skills to learn:", course_search.skills)
+            keywords = st.text_input("Keywords:", placeholder="e.g. security, energy storage")
+        with search_col2:
+            max_price = st.slider("Max price (USD):", 0, 200, 200, step=10)
+            max_weeks = st.slider("Max duration (weeks):", 1, 26, 26)
+        with search_col3:
+            max_level = st.selectbox("Up to level:", ["Beginner", "Intermediate", "Advanced"], index=2)
+            platforms = st.multiselect("Platforms:", course_search.platforms)
+        
+        results = course_search.search(skills=gap_skills or None, text=keywords or None,
+                                       platform=platforms or None, max_difficulty=max_level,
+                                       max_price=max_price, max_weeks=max_weeks, k=10)
+        if results:
+            st.caption("Ranked by rating per week of study")
+            for i, course in enumerate(results, 1):
+                covers = f" — covers {', '.join(course['covers'])}" if course['covers'] else ""
+                st.write(f"**{i}.** {format_course(course)}{covers}")
+        else:
+            st.info("No courses match these filters. Try raising the price or duration limits.")
     
     elif page == "🤖 AI Career Advisor":
         st.header("🤖 AI Career Advisor")
@@ -497,22 +434,20 @@ def main():
         
         # Quick questions with enhanced styling
         st.subheader("🚀 Popular Career Questions")
-        quick_questions = [
-            "How do I transition from marketing to data science?",
-            "What programming language should I learn first for AI?",
-            "Which cloud certification offers the best ROI?",
-            "How to build a portfolio with no tech experience?",
-            "What's the realistic timeline to land a STEM job?"
-        ]
-        
         cols = st.columns(2)
-        for i, question in enumerate(quick_questions):
+        for i, question in enumerate(QUICK_QUESTIONS):
             with cols[i % 2]:
                 if st.button(f"❓ {question}", key=f"quick_{i}"):
-                    with st.spinner("🤖 AI analyzing your question..."):
-                        response = get_ai_response(question)
-                        st.success(f"**Question:** {question}")
-                        st.info(f"**AI Expert Advice:**\n\n{response}")
+                    st.success(f"**Question:** {question}")
+                    st.markdown("**AI Expert Advice:**")
+                    st.write_stream(stream_ai_response(question))
+        
+        if st.button("⚡ Answer All Popular Questions"):
+            with st.spinner("🤖 AI answering all questions in parallel..."):
+                answers = get_ai_responses(QUICK_QUESTIONS)
+            for question, answer in zip(QUICK_QUESTIONS, answers):
+                with st.expander(f"❓ {question}", expanded=False):
+                    st.write(answer)
         
         # Custom question
         st.subheader("💬 Ask Your Custom Question")
@@ -522,17 +457,22 @@ def main():
         
         if st.button("🚀 Get Expert AI Advice", type="primary"):
             if user_question:
-                with st.spinner("🤖 AI thinking deeply about your situation..."):
-                    response = get_ai_response(user_question)
-                    
-                    st.session_state.chat_history.append({
+                st.success(f"**Your Question:** {user_question}")
+                st.markdown("**AI Expert Analysis:**")
+                status = {}
+                response = st.write_stream(stream_ai_response(user_question, status=status))
+                
+                st.session_state.chat_history.append({
+                    "question": user_question,
+                    "answer": response,
+                    "timestamp": datetime.now().strftime("%H:%M")
+                })
+                # Fallback messages and cut-off streams are shown once but never kept as consultations
+                if status.get("complete"):
+                    store.add_chat_turns(st.session_state.user_id, [{
                         "question": user_question,
-                        "answer": response,
-                        "timestamp": datetime.now().strftime("%H:%M")
-                    })
-                    
-                    st.success(f"**Your Question:** {user_question}")
-                    st.info(f"**AI Expert Analysis:**\n\n{response}")
+                        "answer": response if isinstance(response, str) else "".join(map(str, response))
+                    }])
         
         # Chat history
         if st.session_state.chat_history:
@@ -606,6 +546,9 @@ def main():
                 level_color = "🔴"
             
             st.session_state.assessment_done = True
+            st.session_state.last_self_assessment = {"overall_score": overall_score, "level": level,
+                                                     "skills": skills}
+            store.save_self_assessment(st.session_state.user_id, st.session_state.last_self_assessment)
             
             # Display results using native Streamlit components
             st.success("✅ Assessment Complete!")
@@ -647,6 +590,209 @@ def main():
             st.warning(f"📅 **{timeline_months} months** based on your current skill level and target goals")
             
             st.balloons()
+        
+        elif st.session_state.last_self_assessment:
+            last = st.session_state.last_self_assessment
+            when = datetime.fromtimestamp(last.get("created_at", time.time())).strftime("%Y-%m-%d %H:%M")
+            st.caption(f"Your last assessment ({when}): **{last['overall_score']:.1f}/10**, {last['level']}")
+        
+        # Best-fit industries: one profile ranked against all eight industries at once
+        st.markdown("---")
+        st.subheader("🏆 Find Your Best-Fit Industry")
+        st.write("Describe your background to rank every future industry by readiness and transition fit.")
+        
+        # Returning users start from the profile they last assessed
+        saved = (st.session_state.saved_assessment or {}).get("profile", {})
+        education_levels = ["High School", "Associate", "Bachelors", "Masters", "PhD"]
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            current_role = st.text_input("Current job title:", saved.get("current_role", "Data Analyst"))
+        with col2:
+            experience_years = st.number_input("Years of experience:", 0, 50, int(saved.get("experience_years", 3)))
+        with col3:
+            education_level = st.selectbox("Highest education:", education_levels,
+                                           index=education_levels.index(saved.get("education_level", "Bachelors"))
+                                           if saved.get("education_level") in education_levels else 2)
+        
+        dataset_skills = sorted(get_industry_skills()["skill_name"].astype(str).unique())
+        saved_skills = saved.get("skills", {}).get("technical", ["Python", "Statistics"])
+        user_skills = st.multiselect("Skills you already have:", dataset_skills,
+                                     default=[s for s in saved_skills if s in dataset_skills])
+        col1, col2 = st.columns(2)
+        with col1:
+            project_count = st.number_input("Completed portfolio projects:", 0, 20,
+                                            len(saved["projects"]) if "projects" in saved else 1)
+        with col2:
+            certifications = st.text_input("Certifications (comma-separated):",
+                                           ", ".join(saved.get("certifications", [])))
+        
+        ranker = get_industry_ranker()
+        role_match = ranker.mapper.resolver.resolve(current_role)
+        if role_match["role"]:
+            st.caption(f"Matched your title to **{role_match['title']}** "
+                       f"(confidence {role_match['confidence']:.0%})")
+        
+        profile = {
+            "skills": {"technical": user_skills},
+            "experience_years": experience_years,
+            "education_level": education_level,
+            "current_role": current_role,
+            "projects": [f"Project {i + 1}" for i in range(project_count)],
+            "certifications": [c.strip() for c in certifications.split(",") if c.strip()]
+        }
+        
+        # Unchanged inputs reuse this session's ranking, or one stored on an earlier visit
+        key = profile_key(profile, engine_version())
+        if st.session_state.get('ranking_key') != key:
+            stored = store.load_assessment(st.session_state.user_id, key)
+            if stored is not None and stored["ranking"]:
+                ranking, transitions = stored["ranking"], stored["transitions"]
+            else:
+                # Reruns only recompute the components fed by inputs that changed since the last run
+                session = st.session_state.get('scoring_session')
+                if session is None or session.calculator is not ranker.calculator:
+                    # New session, or the shared engines were rebuilt since it was created
+                    st.session_state.scoring_session = ScoringSession(ranker.calculator, ranker.industries)
+                session = st.session_state.scoring_session
+                session.update(profile)
+                ranking = ranker.rank_industries(profile, session.scores())
+                
+                best_industry = ranking[0]['industry']
+                transitions = {best_industry: ranker.mapper.map_career_transition(current_role, best_industry).to_dict()}
+                store.save_assessment(st.session_state.user_id, profile, key, ranking, transitions)
+            st.session_state.ranking_key = key
+            st.session_state.ranking = ranking
+            st.session_state.transitions = transitions
+        ranking = st.session_state.ranking
+        
+        best = ranking[0]
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric(f"{best['icon']} Best Fit", best['name'], f"{best['fit_score']:.1f} fit")
+        with col2:
+            st.metric("📊 Readiness", f"{best['overall_score']:.1f}%", best['readiness_level'])
+        with col3:
+            st.metric("⏱️ Time to Ready", best['time_to_ready'], best['difficulty'], delta_color="off")
+        
+        transition = st.session_state.transitions.get(best['industry'])
+        if transition:
+            with st.expander(f"🗺️ Transition map to {best['name']} ({transition['estimated_duration']})"):
+                for step in transition['career_path']:
+                    st.write(f"**{step['step']}. {step['title']}** ({step['duration']}): {', '.join(step['skills'])}")
+        
+        fig = px.bar(
+            x=[entry['fit_score'] for entry in ranking][::-1],
+            y=[f"{entry['icon']} {entry['name']}" for entry in ranking][::-1],
+            orientation='h',
+            labels={'x': 'Fit Score', 'y': ''},
+            color=[entry['fit_score'] for entry in ranking][::-1],
+            color_continuous_scale='Viridis'
+        )
+        fig.update_layout(
+            title="Industry Fit Ranking",
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            font=dict(color='white'),
+            coloraxis_showscale=False,
+            height=400
+        )
+        st.plotly_chart(fig, use_container_width=True)
+        
+        st.dataframe(pd.DataFrame([
+            {"Rank": entry['rank'], "Industry": f"{entry['icon']} {entry['name']}",
+             "Fit": entry['fit_score'], "Readiness": entry['overall_score'],
+             "Skill Match": entry['component_scores']['skill_match'],
+             "Experience": entry['component_scores']['experience'],
+             "Learning Curve": entry['component_scores']['learning_curve'],
+             "Transition": entry['difficulty'], "Time to Ready": entry['time_to_ready']}
+            for entry in ranking
+        ]), use_container_width=True, hide_index=True)
+    
+    elif page == "👥 Cohort Analytics":
+        st.header("👥 Cohort Analytics")
+        
+        # Every view below is a sum over pre-aggregated cube cells; no profile is rescored
+        cube = get_cohort_cube()
+        if cube is None:
+            st.info("No cohort data yet. Build it from a population of profiles with "
+                    "`python cli.py cohorts --input profiles.jsonl`.")
+        else:
+            def member_label(dimension, member):
+                if dimension == "industry" and member in FUTURE_INDUSTRIES:
+                    return f"{FUTURE_INDUSTRIES[member]['icon']} {FUTURE_INDUSTRIES[member]['name']}"
+                return member.replace("_", " ").title()
+            
+            measure_labels = {measure: measure.replace("_", " ").title() for measure in MEASURES}
+            measures_by_label = {label: measure for measure, label in measure_labels.items()}
+            
+            filters = {}
+            for col, dimension in zip(st.columns(3), DIMENSIONS):
+                with col:
+                    chosen = st.multiselect(f"{dimension.title()}:", cube.members[dimension],
+                                            format_func=lambda member, d=dimension: member_label(d, member),
+                                            placeholder="All")
+                    filters[dimension] = chosen or None
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                measure = measures_by_label[st.selectbox("Score:", list(measures_by_label))]
+            with col2:
+                drill = st.selectbox("Break down by:", [dimension.title() for dimension in DIMENSIONS]).lower()
+            
+            cohort = cube.slice(**filters)
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("👥 Assessments", f"{cohort['count']:,}")
+            with col2:
+                st.metric("📊 Mean", f"{cohort['mean'][measure]:.1f}%" if cohort['count'] else "–")
+            with col3:
+                st.metric("📏 Std Dev", f"{cohort['std'][measure]:.1f}" if cohort['count'] else "–")
+            
+            if cohort['count']:
+                edges = cohort['bin_edges']
+                fig = px.bar(
+                    x=(edges[:-1] + edges[1:]) / 2,
+                    y=cohort['histogram'][measure],
+                    labels={'x': f"{measure_labels[measure]} (%)", 'y': 'Assessments'}
+                )
+                fig.update_traces(width=edges[1] - edges[0], marker_color='#1E88E5')
+                fig.update_layout(
+                    title=f"{measure_labels[measure]} Distribution",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='white'),
+                    height=350
+                )
+                st.plotly_chart(fig, use_container_width=True)
+                
+                breakdown = cube.breakdown(drill, **filters)
+                breakdown[drill] = [member_label(drill, member) for member in breakdown[drill]]
+                breakdown = breakdown.sort_values(measure, ascending=False)
+                fig = px.bar(
+                    x=breakdown[measure],
+                    y=breakdown[drill],
+                    orientation='h',
+                    labels={'x': f"Mean {measure_labels[measure]} (%)", 'y': ''},
+                    color=breakdown[measure],
+                    color_continuous_scale='Viridis'
+                )
+                fig.update_layout(
+                    title=f"{measure_labels[measure]} by {drill.title()}",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='white'),
+                    coloraxis_showscale=False,
+                    yaxis=dict(autorange='reversed'),
+                    height=max(300, 40 * len(breakdown) + 100)
+                )
+                st.plotly_chart(fig, use_container_width=True)
+                
+                st.dataframe(
+                    breakdown.rename(columns={drill: drill.title(), "count": "Assessments", **measure_labels}).round(1),
+                    use_container_width=True, hide_index=True
+                )
+            else:
+                st.warning("No assessments match these filters.")
     
     # Clean Footer Section
     st.markdown("---")
@@ -0,0 +1,58 @@
+"""
+Benchmark: Streamlit rerun latency with shared cached services vs rebuilding them per rerun
+
+Usage: python benchmarks/bench_app_rerun.py [reruns]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from components import services
+
+APP = os.path.join(ROOT, "app.py")
+PAGE = "🎯 Skill Assessment"
+
+
+def open_page() -> AppTest:
+    app = AppTest.from_file(APP, default_timeout=120).run()
+    app.sidebar.selectbox[0].set_value(PAGE).run()
+    assert not app.exception, app.exception
+    return app
+
+
+def rerun_ms(app: AppTest, reruns: int, before=None) -> float:
+    """Median milliseconds for a widget edit and the rerun it triggers"""
+    samples = []
+    for step in range(reruns):
+        if before is not None:
+            before()
+        start = time.perf_counter()
+        app.number_input[0].set_value(step % 15).run()
+        samples.append((time.perf_counter() - start) * 1000)
+        assert not app.exception, app.exception
+    return float(np.median(samples))
+
+
+def main(reruns):
+    services.clear_all()
+    start = time.perf_counter()
+    app = open_page()
+    print(f"first run + page switch (cold services): {(time.perf_counter() - start) * 1000:7.0f}ms")
+
+    cached = rerun_ms(app, reruns)
+    rebuilt = rerun_ms(app, reruns, before=services.clear_engines)
+    reloaded = rerun_ms(app, reruns, before=services.clear_datasets)
+    print(f"rerun, shared engines:                   {cached:7.1f}ms")
+    print(f"rerun, engines rebuilt each time:        {rebuilt:7.1f}ms  (+{rebuilt - cached:.1f}ms)")
+    print(f"rerun, datasets + engines reloaded:      {reloaded:7.1f}ms  (+{reloaded - cached:.1f}ms)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
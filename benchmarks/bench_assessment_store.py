@@ -0,0 +1,132 @@
+"""
+Benchmark: assessment store writes (per-row commits vs batched), indexed history reads and concurrent sessions
+
+Usage: python benchmarks/bench_assessment_store.py [users]
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from synthetic import make_profiles
+from utils.assessment_store import (SELECT_CHAT_TURNS, SELECT_LATEST_PROFILE, SELECT_READINESS,
+                                    SQLiteAssessmentStore, profile_key)
+from utils.career_mapper import CareerMapper
+from utils.industry_ranker import IndustryRanker
+from utils.readiness_score import ReadinessCalculator
+
+ASSESSMENTS_PER_USER = 5
+SESSIONS = 8
+
+
+def per_row_commits(path: str, rows):
+    """Baseline: one connection per call and a commit per row (no batching, no pool)"""
+    for user_id, key, entry, payload in rows:
+        conn = sqlite3.connect(path, timeout=5)
+        conn.execute("INSERT OR REPLACE INTO readiness_results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                     (user_id, key, entry["industry"], entry["rank"], float(entry["overall_score"]),
+                      time.time(), payload))
+        conn.commit()
+        conn.close()
+
+
+def percentiles(samples):
+    return f"p50 {np.median(samples):.3f}ms, p99 {np.percentile(samples, 99):.3f}ms"
+
+
+def main(users: int):
+    calculator = ReadinessCalculator()
+    ranker = IndustryRanker(calculator, CareerMapper())
+    profiles = make_profiles(200)
+    rankings = [ranker.rank_industries(profile) for profile in profiles]
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = SQLiteAssessmentStore(os.path.join(directory, "assessments.db"), pool_size=SESSIONS)
+        user_ids = [f"{i:032x}" for i in range(users)]
+
+        start = time.perf_counter()
+        saved = 0
+        for i, user_id in enumerate(user_ids):
+            for j in range(ASSESSMENTS_PER_USER):
+                index = (i * ASSESSMENTS_PER_USER + j) % len(profiles)
+                profile, ranking = profiles[index], rankings[index]
+                store.save_assessment(user_id, profile, profile_key(profile, j), ranking)
+                saved += 1
+            store.add_chat_turns(user_id, [{"question": f"Question {k}", "answer": "Answer " * 50}
+                                           for k in range(10)])
+        batched = time.perf_counter() - start
+        print(f"{users:,} users: {saved:,} assessments ({saved * 8:,} readiness rows) + {users * 10:,} chat turns "
+              f"in {batched:.2f}s, {batched / saved * 1000:.3f}ms per batched assessment")
+
+        rows = [(user_ids[0], "baseline", entry, json.dumps(entry, default=str)) for entry in rankings[0]] * 25
+        start = time.perf_counter()
+        per_row_commits(store.path, rows)
+        per_row = (time.perf_counter() - start) / len(rows) * 8 * 1000
+        print(f"same readiness rows with a connection and commit each: {per_row:.3f}ms per assessment")
+
+        # Every history query is served by a (user_id, ...) index
+        with store.pool.connection() as conn:
+            for sql, params in ((SELECT_LATEST_PROFILE, (user_ids[0],)), (SELECT_READINESS, (user_ids[0], "k")),
+                                (SELECT_CHAT_TURNS, (user_ids[0], 20))):
+                plan = " | ".join(row[-1] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, params))
+                assert "USING" in plan and "SCAN" not in plan.split("USING")[0], plan
+                print(f"  plan: {plan}")
+
+        rng = np.random.default_rng(1)
+        latest, history = [], []
+        for user_id in rng.choice(user_ids, 2000):
+            start = time.perf_counter()
+            assert store.load_assessment(user_id)["ranking"]
+            latest.append((time.perf_counter() - start) * 1000)
+            start = time.perf_counter()
+            store.chat_history(user_id)
+            history.append((time.perf_counter() - start) * 1000)
+        print(f"returning user, last assessment: {percentiles(latest)} | chat history: {percentiles(history)}")
+        rescoring = []
+        for profile in profiles[:200]:
+            start = time.perf_counter()
+            ranker.rank_industries(profile)
+            rescoring.append((time.perf_counter() - start) * 1000)
+        print(f"recomputing the ranking instead: {percentiles(rescoring)}")
+
+        # Concurrent sessions: each thread mixes reads and writes through the shared pool
+        errors, samples = [], []
+        lock = threading.Lock()
+
+        def session(seed: int):
+            local = np.random.default_rng(seed)
+            try:
+                for _ in range(200):
+                    user_id = user_ids[local.integers(len(user_ids))]
+                    start = time.perf_counter()
+                    if local.random() < 0.2:
+                        store.add_chat_turns(user_id, [{"question": "Concurrent?", "answer": "Yes"}])
+                    else:
+                        store.load_assessment(user_id)
+                    with lock:
+                        samples.append((time.perf_counter() - start) * 1000)
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=session, args=(seed,)) for seed in range(SESSIONS)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        assert not errors, errors
+        print(f"{SESSIONS} concurrent sessions: {len(samples) / elapsed:,.0f} ops/s, {percentiles(samples)}")
+        store.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
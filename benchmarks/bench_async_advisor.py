@@ -0,0 +1,40 @@
+"""
+Benchmark: sequential vs concurrent advisor calls for every canned prompt,
+against the local stub server with simulated model latency
+
+Usage: python benchmarks/bench_async_advisor.py [latency seconds]
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from stub_openrouter import StubOpenRouter
+from utils.advisor import create_client, get_ai_response
+from utils.async_advisor import ask_many, canned_prompts
+
+
+def main(latency: float):
+    prompts = canned_prompts()
+    with StubOpenRouter(latency=latency) as stub:
+        client = create_client("test-key", base_url=stub.url)
+
+        start = time.perf_counter()
+        sequential = [get_ai_response(p, "test-key", "stub/model", client=client) for p in prompts]
+        sequential_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        concurrent = ask_many(prompts, "test-key", "stub/model", client=client, concurrency=8)
+        concurrent_time = time.perf_counter() - start
+
+    assert concurrent == sequential
+    print(f"{len(prompts)} canned prompts at {latency * 1000:.0f} ms each: "
+          f"sequential {sequential_time:.2f}s, concurrent {concurrent_time:.2f}s "
+          f"({sequential_time / concurrent_time:.1f}x), answers identical and in order")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 0.5)
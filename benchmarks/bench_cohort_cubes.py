@@ -0,0 +1,126 @@
+"""
+Benchmark: cohort cube build, Parquet round trip and slice/drill latency vs rescoring the population
+
+Usage: python benchmarks/bench_cohort_cubes.py [profiles]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.cohort_cubes import DIMENSIONS, MEASURES, build_cohort_cube, read_cohort_cube, write_cohort_cube
+from utils.readiness_score import ReadinessCalculator
+from utils.skill_matrix import SkillMatrix, SkillMatrixWriter
+
+CHUNK = 100_000
+
+
+def write_population(path: str, count: int, seed: int = 42):
+    """Random packed population written record by record (skips per-profile encoding)"""
+    rng = np.random.default_rng(seed)
+    with SkillMatrixWriter(path) as writer:
+        for start in range(0, count, CHUNK):
+            rows = min(CHUNK, count - start)
+            records = np.zeros(rows, dtype=writer.dtype)
+            bits = rng.random((rows, writer.width)) < 0.12
+            records["skills"] = np.packbits(bits, axis=1, bitorder="little")
+            cert_bits = rng.random((rows, len(writer.cert_keywords))) < 0.05
+            records["certifications"] = (cert_bits.astype(np.uint64) <<
+                                         np.arange(len(writer.cert_keywords), dtype=np.uint64)).sum(axis=1)
+            records["experience_years"] = rng.integers(0, 21, rows)
+            records["projects"] = rng.integers(0, 7, rows)
+            records["role"] = rng.integers(-1, len(writer.roles), rows)
+            records["education"] = rng.integers(0, len(writer.education_levels) + 1, rows)
+            writer.write_records(records)
+
+
+def random_filters(cube, rng):
+    """Random slice: each axis unfiltered, one member or a few members"""
+    filters = {}
+    for dimension in DIMENSIONS:
+        members = cube.members[dimension]
+        kind = rng.integers(3)
+        if kind:
+            filters[dimension] = list(rng.choice(members, 1 if kind == 1 else min(3, len(members)), replace=False))
+    return filters
+
+
+def direct_slice(matrix, calculator, cube, filters, chunk_rows=8192):
+    """Reference: rescore everything and aggregate the selected rows"""
+    industries = cube.members["industry"]
+    wanted = {d: set(filters.get(d, cube.members[d])) for d in DIMENSIONS}
+    columns = [i for i, industry in enumerate(industries) if industry in wanted["industry"]]
+    role_ok = np.array([m in wanted["role"] for m in cube.members["role"]])
+    education_ok = np.array([m in wanted["education"] for m in cube.members["education"]])
+    total, sums = 0, np.zeros(len(MEASURES))
+    for start, scores in calculator.score_skill_matrix(matrix, industries, chunk_rows):
+        records = matrix.records[start:start + len(scores["overall"])]
+        role = records["role"].astype(np.intp)
+        role[role < 0] = len(cube.members["role"]) - 1
+        rows = role_ok[role] & education_ok[records["education"].astype(np.intp)]
+        total += int(rows.sum()) * len(columns)
+        for m, measure in enumerate(MEASURES):
+            values = scores["overall" if measure == "overall_score" else measure]
+            sums[m] += values[rows][:, columns].sum() * 100
+    return total, sums / max(total, 1)
+
+
+def main(count: int):
+    calculator = ReadinessCalculator()
+    rng = np.random.default_rng(7)
+    with tempfile.TemporaryDirectory() as directory:
+        population = os.path.join(directory, "population.skm")
+        cube_path = os.path.join(directory, "cohorts.parquet")
+        write_population(population, count)
+        matrix = SkillMatrix(population)
+
+        start = time.perf_counter()
+        cube = build_cohort_cube(matrix, calculator)
+        build = time.perf_counter() - start
+        start = time.perf_counter()
+        cells = write_cohort_cube(cube, cube_path)
+        write = time.perf_counter() - start
+        start = time.perf_counter()
+        loaded = read_cohort_cube(cube_path)
+        read = time.perf_counter() - start
+        for name in ("counts", "sums", "sums_sq", "histograms"):
+            assert np.allclose(getattr(cube, name), getattr(loaded, name)), name
+        print(f"{count:,} profiles: cube build {build:.2f}s ({count / build:,.0f} profiles/s), "
+              f"{cells} cells, Parquet {os.path.getsize(cube_path) / 1024:.1f}KB "
+              f"(write {write * 1000:.1f}ms, read {read * 1000:.1f}ms)")
+
+        # Parity: cube slices against a full rescore for a few random filters
+        for _ in range(3):
+            filters = random_filters(loaded, rng)
+            expected_count, expected_means = direct_slice(matrix, calculator, loaded, filters)
+            cohort = loaded.slice(**filters)
+            assert cohort["count"] == expected_count, (filters, cohort["count"], expected_count)
+            if expected_count:
+                assert np.allclose([cohort["mean"][m] for m in MEASURES], expected_means), filters
+
+        start = time.perf_counter()
+        direct_slice(matrix, calculator, loaded, random_filters(loaded, rng))
+        rescore = (time.perf_counter() - start) * 1000
+
+        slices, drills = [], []
+        for _ in range(500):
+            filters = random_filters(loaded, rng)
+            start = time.perf_counter()
+            loaded.slice(**filters)
+            slices.append((time.perf_counter() - start) * 1000)
+            start = time.perf_counter()
+            loaded.breakdown(DIMENSIONS[rng.integers(len(DIMENSIONS))], **filters)
+            drills.append((time.perf_counter() - start) * 1000)
+        print(f"slice: p50 {np.median(slices):.3f}ms, p99 {np.percentile(slices, 99):.3f}ms | "
+              f"drill-down: p50 {np.median(drills):.3f}ms, p99 {np.percentile(drills, 99):.3f}ms | "
+              f"rescoring one slice: {rescore:.0f}ms")
+        del matrix
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
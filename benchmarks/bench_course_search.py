@@ -0,0 +1,97 @@
+"""
+Benchmark: indexed CourseSearchEngine vs a pandas filter-and-sort over a synthetic catalog
+
+Usage: python benchmarks/bench_course_search.py [course count]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.course_search import CourseSearchEngine
+from utils.data_loader import COURSE_DIFFICULTY_LEVELS
+from utils.skill_vocabulary import normalize_skill
+from synthetic import make_course_catalog
+
+QUERIES = {
+    "3 skill gaps, under $50": dict(skills=["Machine Learning", "Python", "Deep Learning"], max_price=50),
+    "gaps + beginner..intermediate": dict(skills=["Solidity", "Cryptography"], max_difficulty="Intermediate",
+                                          max_weeks=8),
+    "gaps + rare filter": dict(skills=["GIS"], platform="DataCamp", max_price=15, min_rating=4.8),
+    "free text": dict(text="mastering energy storage"),
+    "industry + platform": dict(industry="SPACETECH", platform="edX", max_price=100),
+    "free courses only": dict(max_price=0),
+}
+
+
+def pandas_search(frame, k=10, skills=None, text=None, industry=None, platform=None,
+                  max_difficulty=None, max_price=None, max_weeks=None, min_rating=None):
+    """Reference: boolean masks over the whole frame, then sort"""
+    mask = np.ones(len(frame), dtype=bool)
+    if skills:
+        mask &= frame["skill_norm"].isin([normalize_skill(s) for s in skills]).to_numpy()
+    if text:
+        haystack = (frame["course_name"] + " " + frame["skill_focus"]).str.lower()
+        for token in text.lower().split():
+            mask &= haystack.str.contains(token, regex=False).to_numpy()
+    if industry:
+        mask &= (frame["industry"].astype(str).str.upper() == industry).to_numpy()
+    if platform:
+        mask &= (frame["platform"] == platform).to_numpy()
+    if max_difficulty:
+        allowed = COURSE_DIFFICULTY_LEVELS[:COURSE_DIFFICULTY_LEVELS.index(max_difficulty) + 1]
+        mask &= frame["difficulty"].isin(allowed).to_numpy()
+    if max_price is not None:
+        mask &= (frame["price32"] <= np.float32(max_price)).to_numpy()
+    if max_weeks is not None:
+        mask &= (frame["duration_weeks"] <= max_weeks).to_numpy()
+    if min_rating is not None:
+        mask &= (frame["rating"] >= np.float32(min_rating)).to_numpy()
+    hits = frame[mask].sort_values(["score", "price32"], ascending=[False, True], kind="stable")
+    return hits.head(k)
+
+
+def timed(fn, repeat):
+    """Latencies in milliseconds"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return np.array(samples)
+
+
+def main(count):
+    start = time.perf_counter()
+    catalog = make_course_catalog(count)
+    print(f"generated {count:,} courses in {time.perf_counter() - start:.1f}s")
+
+    start = time.perf_counter()
+    engine = CourseSearchEngine(catalog)
+    print(f"index build: {time.perf_counter() - start:.2f}s")
+
+    reference = catalog.copy()
+    weeks = reference["duration_weeks"].to_numpy(dtype=np.float32)
+    reference["score"] = reference["rating"].to_numpy(dtype=np.float32) / weeks
+    reference["price32"] = reference["price_usd"].to_numpy(dtype=np.float32)
+    reference["skill_norm"] = reference["skill_focus"].astype(str).map(normalize_skill)
+
+    print(f"{'query':32} {'engine p50':>11} {'p95':>8} {'pandas p50':>11} {'speedup':>8}")
+    for label, query in QUERIES.items():
+        expected = pandas_search(reference, **query)
+        got = engine.search(**query)
+        assert [r["course_name"] for r in got] == expected["course_name"].tolist(), label
+        assert [r["price_usd"] for r in got] == expected["price_usd"].tolist(), label
+
+        engine_ms = timed(lambda: engine.search(**query), 200)
+        pandas_ms = timed(lambda: pandas_search(reference, **query), 3)
+        print(f"{label:32} {np.median(engine_ms):9.3f}ms {np.percentile(engine_ms, 95):6.3f}ms "
+              f"{np.median(pandas_ms):9.1f}ms {np.median(pandas_ms) / np.median(engine_ms):7.0f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,80 @@
+"""
+Benchmark: Market Intelligence reruns with cached/replayed figures vs rebuilding them each rerun
+
+Usage: python benchmarks/bench_figure_cache.py [reruns]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import plotly.io as pio
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from components import figure_cache
+from config import FIGURE_CACHE
+
+APP = os.path.join(ROOT, "app.py")
+PAGE = "📈 Market Intelligence"
+
+
+def cpu_ms(fn, repeat: int = 20) -> float:
+    """Median process CPU milliseconds per call"""
+    samples = []
+    for _ in range(repeat):
+        start = time.process_time()
+        fn()
+        samples.append((time.process_time() - start) * 1000)
+    return float(np.median(samples))
+
+
+def page_rerun_ms(app: AppTest, reruns: int, before=None) -> float:
+    samples = []
+    for _ in range(reruns):
+        if before is not None:
+            before()
+        start = time.process_time()
+        app.run()
+        samples.append((time.process_time() - start) * 1000)
+        assert not app.exception, app.exception
+    return float(np.median(samples))
+
+
+def main(reruns):
+    print("per chart, CPU ms: build + serialize | memoized figure + serialize | memoized JSON")
+    for name, builder in figure_cache.STATIC_FIGURES.items():
+        figure = figure_cache.get_figure(name)
+        figure_cache.figure_json(name)
+        print(f"  {name:20} {cpu_ms(lambda: pio.to_json(builder(), validate=False)):7.2f} | "
+              f"{cpu_ms(lambda: pio.to_json(figure, validate=False)):7.2f} | "
+              f"{cpu_ms(lambda: figure_cache.figure_json(name)):7.4f}")
+
+    # Cold process start: build from code vs load the pre-rendered JSON
+    with tempfile.TemporaryDirectory() as directory:
+        built = cpu_ms(lambda: [builder() for builder in figure_cache.STATIC_FIGURES.values()], 5)
+        figure_cache.build_static_figures(directory)
+        FIGURE_CACHE["directory"], previous = directory, FIGURE_CACHE["directory"]
+
+        def load_all():
+            figure_cache.clear_cache()
+            [figure_cache.get_figure(name) for name in figure_cache.STATIC_FIGURES]
+        loaded = cpu_ms(load_all, 5)
+        FIGURE_CACHE["directory"] = previous
+        figure_cache.clear_cache()
+    print(f"cold start, all static figures: built {built:.1f}ms, pre-rendered {loaded:.1f}ms")
+
+    app = AppTest.from_file(APP, default_timeout=120).run()
+    app.sidebar.selectbox[0].set_value(PAGE).run()
+    assert len(app.get("plotly_chart")) == 2
+    cached = page_rerun_ms(app, reruns)
+    uncached = page_rerun_ms(app, reruns, before=figure_cache.clear_cache)
+    print(f"page rerun CPU: cached {cached:.1f}ms, rebuilt {uncached:.1f}ms (-{uncached - cached:.1f}ms per rerun)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,53 @@
+"""
+Benchmark: peak RSS of the streaming bulk report stays flat as input grows
+
+Usage: python benchmarks/bench_ingest_memory.py [profile counts...]
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic import iter_profiles
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs one report in a fresh interpreter and prints its peak RSS (KiB) and
+# the largest peak among its worker processes
+PROBE = """
+import json, resource, sys
+sys.path.insert(0, {root!r})
+import cli
+cli.main(["report", "--input", {input!r}, "--output", {output!r}, "--workers", "1", "--quiet"])
+print(json.dumps({{"parent_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                  "worker_kib": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss}}))
+"""
+
+
+def main(counts):
+    with tempfile.TemporaryDirectory() as workdir:
+        for count in counts:
+            input_path = os.path.join(workdir, f"profiles_{count}.jsonl")
+            output_path = os.path.join(workdir, f"results_{count}.jsonl")
+            with open(input_path, "w", encoding="utf-8") as handle:
+                for profile in iter_profiles(count):
+                    handle.write(json.dumps(profile) + "\n")
+
+            probe = PROBE.format(root=ROOT, input=input_path, output=output_path)
+            completed = subprocess.run([sys.executable, "-c", probe], capture_output=True,
+                                       text=True, check=True)
+            usage = json.loads(completed.stdout.strip().splitlines()[-1])
+            input_mb = os.path.getsize(input_path) / 1e6
+            output_mb = os.path.getsize(output_path) / 1e6
+            print(f"{count:>9,} profiles  input {input_mb:8.1f} MB  output {output_mb:8.1f} MB  "
+                  f"peak RSS parent {usage['parent_kib'] / 1024:6.1f} MiB  "
+                  f"worker {usage['worker_kib'] / 1024:6.1f} MiB")
+            os.remove(output_path)
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10_000, 100_000])
@@ -0,0 +1,94 @@
+"""
+Benchmark: greedy and exact LearningPlanner covers on synthetic skill/course universes
+
+Usage: python benchmarks/bench_learning_planner.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.learning_planner import LearningPlanner
+
+LEVELS = np.array(["Beginner", "Intermediate", "Advanced"], dtype=object)
+IMPORTANCE = np.array(["Essential", "Important", "Optional"], dtype=object)
+
+
+def make_universe(skill_count: int, course_count: int, seed: int = 42):
+    """Skills in the industry_skills.csv layout and courses naming 1-3 of them in their titles"""
+    rng = np.random.default_rng(seed)
+    names = np.array([f"Skill{i:05d}" for i in range(skill_count)], dtype=object)
+    skills = pd.DataFrame({
+        "industry": "AI",
+        "skill_name": names,
+        "skill_category": "Core Knowledge",
+        "importance": IMPORTANCE[rng.integers(0, 3, skill_count)],
+        "difficulty": "High",
+        "learning_hours": rng.integers(100, 500, skill_count)
+    })
+
+    focus = rng.integers(0, skill_count, course_count)
+    extra = rng.integers(0, skill_count, (course_count, 2))
+    width = rng.integers(0, 3, course_count)
+    titles = [" and ".join([names[f]] + [names[e] for e in extra[i, :width[i]]]) + " Course"
+              for i, f in enumerate(focus)]
+    courses = pd.DataFrame({
+        "course_name": titles,
+        "platform": "Coursera",
+        "industry": "AI",
+        "skill_focus": names[focus],
+        "duration_weeks": rng.integers(2, 20, course_count),
+        "difficulty": LEVELS[rng.integers(0, 3, course_count)],
+        "price_usd": np.where(rng.random(course_count) < 0.15, 0.0, rng.uniform(10, 300, course_count)),
+        "rating": 4.5,
+        "url": ""
+    })
+    return skills, courses, names
+
+
+def scale(sizes):
+    print(f"{'skills':>7} {'courses':>8} {'gaps':>6} {'build':>8} {'greedy':>9} {'courses':>8} {'coverage':>9}")
+    for skill_count, course_count, gap_count in sizes:
+        skills, courses, names = make_universe(skill_count, course_count)
+        start = time.perf_counter()
+        planner = LearningPlanner(courses, skills)
+        build = time.perf_counter() - start
+
+        gaps = list(np.random.default_rng(1).choice(names, gap_count, replace=False))
+        start = time.perf_counter()
+        plan = planner.plan(gaps, "AI")
+        greedy = time.perf_counter() - start
+        print(f"{skill_count:7,} {course_count:8,} {gap_count:6,} {build:7.2f}s {greedy * 1000:7.1f}ms "
+              f"{len(plan['courses']):8,} {plan['coverage']:9.3f}")
+
+
+def greedy_vs_exact(skill_count=120, course_count=600, gap_count=30, trials=10):
+    skills, courses, names = make_universe(skill_count, course_count, seed=7)
+    planner = LearningPlanner(courses, skills)
+    ratios, greedy_ms, exact_ms, proven = [], [], [], 0
+    for trial in range(trials):
+        gaps = list(np.random.default_rng(trial).choice(names, gap_count, replace=False))
+        start = time.perf_counter()
+        greedy = planner.plan(gaps, "AI")
+        greedy_ms.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        exact = planner.plan(gaps, "AI", exact=True)
+        exact_ms.append((time.perf_counter() - start) * 1000)
+        assert set(exact["covered"]) == set(greedy["covered"])
+        assert exact["total_cost"] <= greedy["total_cost"] + 1e-6
+        ratios.append(greedy["total_cost"] / exact["total_cost"] if exact["total_cost"] else 1.0)
+        proven += exact["optimal"]
+    print(f"\n{gap_count} gaps over {course_count} courses, {trials} trials:")
+    print(f"  greedy {np.median(greedy_ms):.2f}ms  exact {np.median(exact_ms):.1f}ms (median)")
+    print(f"  greedy/optimal cost: mean {np.mean(ratios):.3f}, worst {np.max(ratios):.3f}; "
+          f"{proven}/{trials} proven optimal")
+
+
+if __name__ == "__main__":
+    scale([(500, 2_000, 200), (2_000, 10_000, 1_000), (5_000, 25_000, 3_000)])
+    greedy_vs_exact()
@@ -0,0 +1,71 @@
+"""
+Benchmark: pooled OpenRouterClient vs a fresh requests.post per call, plus retry
+and circuit-breaker behaviour, all against the local stub server
+
+Usage: python benchmarks/bench_llm_client.py [calls]
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from stub_openrouter import StubOpenRouter
+from utils.advisor import build_payload
+from utils.llm_client import CircuitBreaker, CircuitOpenError, LLMHTTPError, OpenRouterClient
+
+
+def main(calls: int):
+    payload = build_payload("How do I move into data science?", "stub/model")
+
+    with StubOpenRouter() as stub:
+        start = time.perf_counter()
+        for _ in range(calls):
+            requests.post(stub.url, json=payload, timeout=15).json()
+        fresh = (time.perf_counter() - start) / calls
+        fresh_connections = len(stub.connections)
+
+    with StubOpenRouter() as stub:
+        client = OpenRouterClient("test-key", base_url=stub.url)
+        start = time.perf_counter()
+        for _ in range(calls):
+            client.chat(payload)
+        pooled = (time.perf_counter() - start) / calls
+        print(f"sequential: fresh requests.post {fresh * 1000:.2f} ms/call ({fresh_connections} connections), "
+              f"pooled session {pooled * 1000:.2f} ms/call ({len(stub.connections)} connections)")
+
+    with StubOpenRouter(latency=0.02) as stub:
+        client = OpenRouterClient("test-key", base_url=stub.url, pool_size=8)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: client.chat(payload), range(calls)))
+        elapsed = time.perf_counter() - start
+        print(f"8 threads, 20 ms server latency: {calls / elapsed:,.0f} calls/s over "
+              f"{len(stub.connections)} pooled connections; metrics {client.metrics.snapshot()}")
+
+    with StubOpenRouter(fail_first=2) as stub:
+        client = OpenRouterClient("test-key", base_url=stub.url, backoff_base=0.01)
+        answer = client.chat(payload)
+        print(f"two 429s then success: answered={bool(answer)} metrics {client.metrics.snapshot()}")
+
+    with StubOpenRouter(fail_first=10 ** 6, fail_status=503) as stub:
+        client = OpenRouterClient("test-key", base_url=stub.url, max_retries=1, backoff_base=0.001,
+                                  breaker=CircuitBreaker(failure_threshold=3, reset_timeout=60))
+        outcomes = []
+        for _ in range(5):
+            try:
+                client.chat(payload)
+            except CircuitOpenError:
+                outcomes.append("short-circuited")
+            except LLMHTTPError as exc:
+                outcomes.append(f"HTTP {exc.status_code}")
+        print(f"persistent 503s: {outcomes}; server saw {stub.requests} requests; breaker {client.breaker.state}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
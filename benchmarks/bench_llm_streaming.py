@@ -0,0 +1,43 @@
+"""
+Benchmark: time to first token of streamed advisor answers vs waiting for the
+full completion, against the local stub SSE server
+
+Usage: python benchmarks/bench_llm_streaming.py [token delay seconds]
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from stub_openrouter import StubOpenRouter
+from utils.advisor import build_payload, create_client
+
+
+def main(token_delay: float):
+    answer = " ".join(f"token{i}" for i in range(200))
+    payload = build_payload("What's the realistic timeline to land a STEM job?", "stub/model")
+
+    with StubOpenRouter(answer=answer, token_delay=token_delay) as stub:
+        client = create_client("test-key", base_url=stub.url)
+
+        start = time.perf_counter()
+        ttft = None
+        text = []
+        for chunk in client.stream_chat(payload):
+            if ttft is None:
+                ttft = time.perf_counter() - start
+            text.append(chunk)
+        streamed_total = time.perf_counter() - start
+        assert "".join(text).strip() == answer
+
+        print(f"200 tokens at {token_delay * 1000:.0f} ms/token: "
+              f"TTFT {ttft * 1000:.1f} ms, full answer {streamed_total * 1000:.1f} ms "
+              f"(a blocking call shows nothing for the whole {streamed_total * 1000:.0f} ms)")
+        print(f"client metrics: {client.metrics.snapshot()}")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 0.01)
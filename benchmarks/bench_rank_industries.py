@@ -0,0 +1,62 @@
+"""
+Benchmark: IndustryRanker.rank_industries vs one readiness and transition call per industry
+
+Usage: python benchmarks/bench_rank_industries.py [profile count]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.industry_ranker import IndustryRanker
+from synthetic import make_profiles
+
+
+def per_industry(ranker: IndustryRanker, profile):
+    """The pre-ranker way: score each industry separately, then sort"""
+    results = []
+    for industry in ranker.industries:
+        readiness = ranker.calculator.calculate_readiness_score(profile, industry)
+        transition = ranker.mapper.map_career_transition(profile.get("current_role", ""), industry)
+        results.append((readiness.overall_score, transition.transition_score, industry))
+    return sorted(results, reverse=True)
+
+
+def timed_ms(fn, profiles):
+    samples = []
+    for profile in profiles:
+        start = time.perf_counter()
+        fn(profile)
+        samples.append((time.perf_counter() - start) * 1000)
+    return np.array(samples)
+
+
+def main(count):
+    ranker = IndustryRanker()
+    profiles = make_profiles(count, seed=11)
+
+    for profile in profiles[:500]:
+        for entry in ranker.rank_industries(profile):
+            readiness = ranker.calculator.calculate_readiness_score(profile, entry["industry"])
+            assert entry["overall_score"] == readiness.overall_score
+            assert entry["component_scores"] == readiness.component_scores.to_dict()
+    print(f"rank_industries matches calculate_readiness_score on {min(count, 500)} profiles")
+
+    # Warm both paths' caches before timing
+    for profile in profiles[:50]:
+        per_industry(ranker, profile)
+        ranker.rank_industries(profile)
+
+    loop = timed_ms(lambda p: per_industry(ranker, p), profiles)
+    ranked = timed_ms(ranker.rank_industries, profiles)
+    print(f"{'per-industry calls':22} p50 {np.median(loop):6.3f}ms  p95 {np.percentile(loop, 95):6.3f}ms")
+    print(f"{'rank_industries':22} p50 {np.median(ranked):6.3f}ms  p95 {np.percentile(ranked, 95):6.3f}ms  "
+          f"({np.median(loop) / np.median(ranked):.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
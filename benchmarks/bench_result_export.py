@@ -0,0 +1,91 @@
+"""
+Benchmark: JSONL vs Parquet vs Arrow IPC export of bulk readiness/transition results
+
+Usage: python benchmarks/bench_result_export.py [profile count]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.career_mapper import CareerMapper
+from utils.readiness_score import ReadinessCalculator
+from utils.result_export import ArrowResultWriter, build_record_batch, read_results
+from synthetic import make_profiles
+
+BATCH_ROWS = 4000
+
+
+def score(count):
+    """(profile_id, industry, readiness, transition) rows for count profiles x every industry"""
+    calculator, mapper = ReadinessCalculator(), CareerMapper()
+    industries = list(calculator.industry_requirements)
+    return [(index, industry, calculator.calculate_readiness_score(profile, industry),
+             mapper.map_career_transition(profile["current_role"], industry))
+            for index, profile in enumerate(make_profiles(count)) for industry in industries]
+
+
+def write_jsonl(rows, path):
+    with open(path, "w", encoding="utf-8") as handle:
+        for profile_id, industry, readiness, transition in rows:
+            handle.write(json.dumps({"profile_id": profile_id, "industry": industry,
+                                     "readiness": readiness.to_dict(), "transition": transition.to_dict()}))
+            handle.write("\n")
+
+
+def read_jsonl(path):
+    with open(path, encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle]
+
+
+def write_columnar(rows, path, output_format):
+    with ArrowResultWriter(path, output_format) as writer:
+        for start in range(0, len(rows), BATCH_ROWS):
+            batch = rows[start:start + BATCH_ROWS]
+            writer.write(build_record_batch(*zip(*batch)))
+
+
+def main(count):
+    start = time.perf_counter()
+    rows = score(count)
+    print(f"scored {len(rows):,} profile x industry pairs in {time.perf_counter() - start:.1f}s")
+
+    with tempfile.TemporaryDirectory() as directory:
+        formats = {
+            "jsonl": (lambda p: write_jsonl(rows, p), read_jsonl),
+            "parquet": (lambda p: write_columnar(rows, p, "parquet"), lambda p: read_results(p).to_pandas()),
+            "arrow": (lambda p: write_columnar(rows, p, "arrow"),
+                      lambda p: read_results(p).to_pandas(split_blocks=True)),
+        }
+        print(f"{'format':8} {'size':>9} {'write':>8} {'read':>8} {'scores only':>12}")
+        sizes = {}
+        for name, (write, read) in formats.items():
+            path = os.path.join(directory, f"results.{name}")
+            start = time.perf_counter()
+            write(path)
+            write_s = time.perf_counter() - start
+            start = time.perf_counter()
+            read(path)
+            read_s = time.perf_counter() - start
+
+            # Analytics typically pull a few numeric columns
+            start = time.perf_counter()
+            if name == "jsonl":
+                [(r["readiness"]["overall_score"], r["readiness"]["component_scores"]["skill_match"])
+                 for r in read_jsonl(path)]
+            else:
+                table = read_results(path, columns=["overall_score", "skill_match"])
+                [column.to_numpy() for column in table.columns]
+            column_s = time.perf_counter() - start
+
+            sizes[name] = os.path.getsize(path)
+            print(f"{name:8} {sizes[name] / 1e6:7.1f}MB {write_s:7.2f}s {read_s:7.2f}s {column_s:11.3f}s")
+        print(f"parquet is {sizes['jsonl'] / sizes['parquet']:.0f}x smaller than JSONL")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
@@ -0,0 +1,57 @@
+"""
+Benchmark: retained memory per result, nested dicts vs ReadinessResult/TransitionResult (tracemalloc)
+
+Usage: python benchmarks/bench_result_memory.py [profile count]
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.career_mapper import CareerMapper
+from utils.readiness_score import ReadinessCalculator
+from synthetic import make_profiles
+
+
+def retained_per_item(build) -> float:
+    """Bytes still allocated per kept item after build() returns its list"""
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    retained = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    return retained / len(kept)
+
+
+def report(label, as_dict, as_object):
+    print(f"{label:12} dicts {as_dict:8,.0f} B/result   objects {as_object:8,.0f} B/result   "
+          f"({as_dict / as_object:.1f}x smaller)")
+
+
+def main(count):
+    calculator = ReadinessCalculator()
+    mapper = CareerMapper()
+    industries = list(calculator.industry_requirements)
+    profiles = make_profiles(count)
+    pairs = [(profile, industry) for profile in profiles for industry in industries]
+
+    # Warm shared caches (schedules, interned tuples) so only per-result memory is measured
+    for profile, industry in pairs:
+        calculator.calculate_readiness_score(profile, industry)
+        mapper._map_transition(profile["current_role"], industry)
+
+    report("readiness",
+           retained_per_item(lambda: [calculator.calculate_readiness_score(p, i).to_dict() for p, i in pairs]),
+           retained_per_item(lambda: [calculator.calculate_readiness_score(p, i) for p, i in pairs]))
+    report("transition",
+           retained_per_item(lambda: [mapper._map_transition(p["current_role"], i).to_dict() for p, i in pairs]),
+           retained_per_item(lambda: [mapper._map_transition(p["current_role"], i) for p, i in pairs]))
+    print("dict figures reuse the result strings, so they understate the old per-call cost")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
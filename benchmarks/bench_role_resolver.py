@@ -0,0 +1,80 @@
+"""
+Benchmark: RoleResolver latency and accuracy against a 100k-title synonym list
+
+Usage: python benchmarks/bench_role_resolver.py [synonym count]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.role_resolver import ROLE_SYNONYMS, RoleResolver
+
+SYLLABLES = ["ka", "lo", "mi", "ne", "ru", "sa", "ti", "vo", "xe", "zu", "bra", "cor", "del", "fin", "gar"]
+
+
+def make_synonyms(count: int, seed: int = 42):
+    """ROLE_SYNONYMS padded with "<domain> <title>" variants up to count titles"""
+    rng = np.random.default_rng(seed)
+    synonyms = {role: list(titles) for role, titles in ROLE_SYNONYMS.items()}
+    bases = [(role, title) for role, titles in ROLE_SYNONYMS.items() for title in titles]
+    seen = set()
+    while len(seen) < count:
+        role, title = bases[rng.integers(len(bases))]
+        domain = "".join(SYLLABLES[i] for i in rng.integers(0, len(SYLLABLES), rng.integers(2, 4)))
+        variant = f"{domain} {title}"
+        if variant not in seen:
+            seen.add(variant)
+            synonyms[role].append(variant)
+    return synonyms
+
+
+def misspell(title: str, rng) -> str:
+    """Drop or swap one character"""
+    i = int(rng.integers(1, len(title) - 1))
+    if rng.random() < 0.5:
+        return title[:i] + title[i + 1:]
+    return title[:i - 1] + title[i] + title[i - 1] + title[i + 1:]
+
+
+def main(count):
+    synonyms = make_synonyms(count)
+    start = time.perf_counter()
+    resolver = RoleResolver(synonyms)
+    print(f"indexed {len(resolver):,} titles in {time.perf_counter() - start:.2f}s")
+
+    rng = np.random.default_rng(7)
+    bases = [(role, title) for role, titles in ROLE_SYNONYMS.items() for title in titles if len(title) > 5]
+    picks = [bases[i] for i in rng.integers(0, len(bases), 2000)]
+    queries = {
+        "exact synonym": [(role, f"Senior {title.title()}") for role, title in picks],
+        "misspelled": [(role, misspell(title, rng)) for role, title in picks],
+        "unknown title": [(None, title) for title in ["Lawyer", "Airline Pilot", "Chef", "Barista"] * 50],
+    }
+
+    print(f"{'query':16} {'cold p50':>9} {'p95':>8} {'cached p50':>11} {'accuracy':>9}")
+    for label, cases in queries.items():
+        cold, correct = [], 0
+        for role, title in cases:
+            resolver.clear_cache()
+            start = time.perf_counter()
+            match = resolver.resolve(title)
+            cold.append((time.perf_counter() - start) * 1000)
+            correct += match["role"] == role
+        for _, title in cases:
+            resolver.resolve(title)
+        warm = []
+        for _, title in cases:
+            start = time.perf_counter()
+            resolver.resolve(title)
+            warm.append((time.perf_counter() - start) * 1000)
+        print(f"{label:16} {np.median(cold):7.3f}ms {np.percentile(cold, 95):6.3f}ms "
+              f"{np.median(warm):9.4f}ms {correct / len(cases):9.3f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,60 @@
+"""
+Benchmark: vectorized ReadinessCalculator.score_batch vs the per-call path
+
+Usage: python benchmarks/bench_score_batch.py [profile counts...]
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.readiness_score import COMPONENT_NAMES, ReadinessCalculator
+from synthetic import make_profiles
+
+
+def per_call_rate(calculator: ReadinessCalculator, profiles, industries) -> float:
+    """Pairs per second through calculate_readiness_score"""
+    start = time.perf_counter()
+    for profile in profiles:
+        for industry in industries:
+            calculator.calculate_readiness_score(profile, industry)
+    return len(profiles) * len(industries) / (time.perf_counter() - start)
+
+
+def check_identical(calculator: ReadinessCalculator, profiles, industries):
+    """Assert score_batch matches the per-call path row for row"""
+    frame = calculator.score_batch(profiles, industries)
+    for row in frame.itertuples(index=False):
+        expected = calculator.calculate_readiness_score(profiles[row.profile_index], row.industry).to_dict()
+        assert row.overall_score == expected["overall_score"], (row, expected)
+        assert row.readiness_level == expected["readiness_level"]
+        assert row.time_to_ready == expected["time_to_ready"]
+        assert row.months_to_ready == expected["months_to_ready"]
+        for name in COMPONENT_NAMES:
+            assert getattr(row, name) == expected["component_scores"][name], (name, row, expected)
+
+
+def main(counts):
+    calculator = ReadinessCalculator()
+    industries = list(calculator.industry_requirements)
+
+    check_identical(calculator, make_profiles(2000, seed=7), industries)
+    print("score_batch matches calculate_readiness_score on 2,000 profiles x 8 industries")
+
+    baseline = per_call_rate(calculator, make_profiles(1000), industries)
+    print(f"per-call baseline: {baseline:,.0f} pairs/s")
+
+    for count in counts:
+        profiles = make_profiles(count)
+        start = time.perf_counter()
+        calculator.score_batch(profiles, industries)
+        elapsed = time.perf_counter() - start
+        pairs = count * len(industries)
+        print(f"score_batch {count:>9,} profiles: {elapsed:7.2f}s  "
+              f"{pairs / elapsed:12,.0f} pairs/s  ({pairs / elapsed / baseline:5.1f}x per-call)")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10_000, 100_000])
@@ -0,0 +1,59 @@
+"""
+Benchmark: incremental ScoringSession updates vs rescoring the whole profile after each edit
+
+Usage: python benchmarks/bench_scoring_session.py [edits]
+Parity with a full recompute is covered by benchmarks/test_scoring_session.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.industry_ranker import IndustryRanker
+from utils.scoring_session import ScoringSession
+from synthetic import make_profile, random_session_edit
+
+
+def main(edits):
+    ranker = IndustryRanker()
+    calculator = ranker.calculator
+    session = ScoringSession(calculator, ranker.industries)
+    session.update(make_profile(random.Random(1)))
+    rng = random.Random(3)
+
+    start = time.perf_counter()
+    for _ in range(edits):
+        random_session_edit(rng, session)
+        session.scores()
+    incremental = (time.perf_counter() - start) / edits * 1e6
+
+    profile = session.profile
+    start = time.perf_counter()
+    for _ in range(edits):
+        calculator.score_matrices([profile], session.industries)
+    matrices = (time.perf_counter() - start) / edits * 1e6
+
+    start = time.perf_counter()
+    for _ in range(edits // 10):
+        for industry in session.industries:
+            calculator.calculate_readiness_score(profile, industry)
+    per_call = (time.perf_counter() - start) / (edits // 10) * 1e6
+
+    changed = dict(profile, experience_years=profile["experience_years"] + 1)
+    start = time.perf_counter()
+    for step in range(edits):
+        session.update(changed if step % 2 else profile)
+        session.scores()
+    rerun = (time.perf_counter() - start) / edits * 1e6
+
+    print(f"{'edit + scores() (incremental)':34} {incremental:8.1f}us")
+    print(f"{'rerun: update(profile) + scores()':34} {rerun:8.1f}us")
+    print(f"{'score_matrices full rescore':34} {matrices:8.1f}us  ({matrices / incremental:.0f}x)")
+    print(f"{'calculate_readiness_score x8':34} {per_call:8.1f}us  ({per_call / incremental:.0f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
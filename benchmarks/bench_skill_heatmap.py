@@ -0,0 +1,97 @@
+"""
+Benchmark: skill heatmap matrix build and payload, nested-loop cells vs the vectorized requirement matrix
+
+Usage: python benchmarks/bench_skill_heatmap.py [profiles]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from synthetic import make_profiles
+from components.visualizations import create_match_heatmap
+from utils.data_loader import load_industry_skills
+from utils.skill_heatmap import get_requirement_matrix
+
+
+def loop_matrix(user_skills, industry_requirements):
+    """The previous per-cell build: list scans for every industry x skill"""
+    industries = list(industry_requirements.keys())
+    all_skills = set()
+    for skills in industry_requirements.values():
+        all_skills.update(skills)
+    all_skills = sorted(list(all_skills))
+    matrix = []
+    for industry in industries:
+        row = []
+        for skill in all_skills:
+            if skill in user_skills and skill in industry_requirements[industry]:
+                row.append(2)
+            elif skill in industry_requirements[industry]:
+                row.append(1)
+            else:
+                row.append(0)
+        matrix.append(row)
+    return all_skills, industries, matrix
+
+
+def loop_figure(all_skills, industries, matrix) -> go.Figure:
+    """The previous figure: nested-list z plus a text mark per cell"""
+    return go.Figure(data=go.Heatmap(
+        z=matrix, x=all_skills, y=industries,
+        colorscale=[[0, '#f5f5f5'], [0.5, '#FFE082'], [1, '#4CAF50']],
+        text=[[f"{'✓' if val == 2 else '✗' if val == 1 else ''}" for val in row] for row in matrix],
+        texttemplate="%{text}", textfont={"size": 12}, showscale=False
+    ))
+
+
+def timed_ms(fn, repeat: int = 5) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return float(np.median(samples))
+
+
+def main(count: int):
+    frame = load_industry_skills()
+    requirements = {industry: group["skill_name"].tolist()
+                    for industry, group in frame.groupby("industry", observed=True, sort=False)}
+    matrix = get_requirement_matrix()
+    profiles = [[name for names in p["skills"].values() for name in names] for p in make_profiles(count)]
+    print(f"requirement matrix: {matrix.shape[0]} industries x {matrix.shape[1]} skills, "
+          f"{int(matrix.required.sum())} required cells")
+
+    # Parity with the loop for exact-name matches (the engine also honours aliases and composites)
+    for skills in profiles[:200]:
+        names, industries, expected = loop_matrix(skills, requirements)
+        codes = matrix.match([skills])
+        order = [matrix.skills.index(name) for name in names]
+        got = codes[[matrix.industries.index(i) for i in industries]][:, order]
+        expected = np.array(expected)
+        exact = np.array([name in skills for name in names])
+        assert np.array_equal(got[:, exact] == 1, expected[:, exact] == 2)
+        assert np.array_equal(got != 0, expected != 0)
+
+    for size in sorted({1, min(100, count), count}):
+        subset = profiles[:size]
+        loop = timed_ms(lambda: [loop_matrix(skills, requirements) for skills in subset], 3)
+        vectorized = timed_ms(lambda: matrix.match(subset, weighted=True))
+        print(f"{size:6} profiles: loop {loop:9.2f}ms, vectorized overlay {vectorized:7.2f}ms")
+
+    legacy = len(pio.to_json(loop_figure(*loop_matrix(profiles[0], requirements)), validate=False))
+    single = len(pio.to_json(create_match_heatmap(profiles[:1]), validate=False))
+    overlay = len(pio.to_json(create_match_heatmap(profiles, weighted=True), validate=False))
+    print(f"payload: previous {legacy / 1024:.1f}KB, one profile {single / 1024:.1f}KB, "
+          f"{count} overlaid {overlay / 1024:.1f}KB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
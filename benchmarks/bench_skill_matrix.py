@@ -0,0 +1,87 @@
+"""
+Benchmark: scoring a memory-mapped packed skill matrix vs profile dicts
+
+Usage: python benchmarks/bench_skill_matrix.py [population rows] [distinct profiles]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.readiness_score import ReadinessCalculator
+from utils.skill_matrix import SkillMatrix, SkillMatrixWriter
+from synthetic import make_profiles
+
+CHUNK_ROWS = 8192
+
+
+def score_file(calculator, matrix, industries):
+    """Mean overall score per industry and count of ready pairs over the whole file"""
+    totals = np.zeros(len(industries))
+    ready = 0
+    for _, scores in calculator.score_skill_matrix(matrix, industries, CHUNK_ROWS):
+        totals += scores["overall"].sum(axis=0)
+        ready += int((scores["overall"] >= 0.8).sum())
+    return totals / len(matrix), ready
+
+
+def read_file(matrix):
+    """Touch every mapped byte once: the I/O floor for a full scoring pass"""
+    checksum = 0
+    for _, records in matrix.chunks(CHUNK_ROWS):
+        checksum ^= int(np.bitwise_xor.reduce(records.view(np.uint8).ravel()))
+    return checksum
+
+
+def main(rows, distinct):
+    calculator = ReadinessCalculator()
+    industries = list(calculator.industry_requirements)
+    profiles = make_profiles(distinct)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "population.skm")
+        start = time.perf_counter()
+        with SkillMatrixWriter(path) as writer:
+            # Pack the distinct profiles once, then tile the records up to the population size
+            records = writer.encode(profiles)
+            print(f"packed {distinct:,} profiles in {time.perf_counter() - start:.2f}s "
+                  f"({records.dtype.itemsize} bytes each)")
+            while writer.rows < rows:
+                writer.write_records(records[:rows - writer.rows])
+        print(f"wrote {rows:,} rows: {os.path.getsize(path) / 1e6:,.0f}MB in {time.perf_counter() - start:.1f}s")
+
+        matrix = SkillMatrix(path)
+
+        # Dict path on the distinct profiles for reference throughput
+        start = time.perf_counter()
+        calculator.score_matrices(profiles, industries)
+        dict_rate = distinct / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        read_file(matrix)
+        read_s = time.perf_counter() - start
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        means, ready = score_file(calculator, matrix, industries)
+        score_s = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"score_matrices on dicts:   {dict_rate:12,.0f} profiles/s")
+        print(f"score_skill_matrix (mmap): {rows / score_s:12,.0f} profiles/s  "
+              f"{score_s:6.2f}s for {rows:,}  peak {peak / 1e6:.0f}MB traced")
+        print(f"read-only pass over file:  {rows / read_s:12,.0f} profiles/s  {read_s:6.2f}s")
+        print(f"ready pairs: {ready:,}  mean overall: "
+              + ", ".join(f"{industry} {mean * 100:.1f}" for industry, mean in zip(industries, means)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 100_000)
@@ -0,0 +1,84 @@
+"""
+Benchmark: skill-network layout time and figure payload at thousands of nodes
+
+Graphs are industry_skills.csv-shaped co-occurrence graphs over a synthetic
+skill universe (the bundled dataset has well under a hundred distinct skills).
+
+Usage: python benchmarks/bench_skill_network.py [max_nodes]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.visualizations import create_network_figure
+from utils.skill_network import clear_cache, cooccurrence_network, force_layout, get_layout, get_skill_network
+
+SKILLS_PER_INDUSTRY = 12
+
+
+def synthetic_skills(nodes: int, seed: int = 42) -> pd.DataFrame:
+    """industry_skills.csv-shaped frame: one industry per ~nodes/4 skills, popular skills shared widely"""
+    rng = np.random.default_rng(seed)
+    industries = max(1, nodes // 4)
+    # Zipf-like popularity so a few skills bridge many industries
+    popularity = 1.0 / np.arange(1, nodes + 1) ** 0.8
+    popularity /= popularity.sum()
+    rows = []
+    for industry in range(industries):
+        members = rng.choice(nodes, SKILLS_PER_INDUSTRY, replace=False, p=popularity)
+        rows.extend((f"Industry {industry}", f"Skill {member}") for member in members)
+    return pd.DataFrame(rows, columns=["industry", "skill_name"])
+
+
+def per_edge_payload(network, positions) -> int:
+    """JSON size of the previous one-trace-per-edge drawing of the same graph"""
+    traces = [go.Scatter(x=[positions[a, 0], positions[b, 0], None], y=[positions[a, 1], positions[b, 1], None],
+                         mode='lines', line=dict(width=1, color='#888'), hoverinfo='none')
+              for a, b in zip(network.source, network.target)]
+    return len(pio.to_json(go.Figure(data=traces), validate=False))
+
+
+def main(max_nodes: int):
+    network = get_skill_network()
+    start = time.perf_counter()
+    get_layout(network)
+    print(f"industry_skills.csv: {len(network)} nodes, {network.edge_count} edges, "
+          f"layout {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    print(f"{'nodes':>6} {'edges':>7} {'graph ms':>9} {'layout ms':>10} {'cached ms':>10} "
+          f"{'payload KB':>11} {'per-edge KB':>12}")
+    nodes = 500
+    while nodes <= max_nodes:
+        frame = synthetic_skills(nodes)
+        start = time.perf_counter()
+        network = cooccurrence_network(frame)
+        graph_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        positions = get_layout(network)
+        layout_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        get_layout(network)
+        cached_ms = (time.perf_counter() - start) * 1000
+        # Same seed, same layout
+        assert np.array_equal(positions, force_layout(network))
+
+        payload = len(pio.to_json(create_network_figure(network), validate=False))
+        # Building tens of thousands of go.Scatter objects takes minutes; skip the comparison there
+        legacy = per_edge_payload(network, positions) if network.edge_count <= 20000 else float("nan")
+        print(f"{len(network):6} {network.edge_count:7} {graph_ms:9.1f} {layout_ms:10.1f} {cached_ms:10.3f} "
+              f"{payload / 1024:11.1f} {legacy / 1024:12.1f}")
+        nodes *= 2
+    clear_cache()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 4000)
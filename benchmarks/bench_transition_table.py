@@ -0,0 +1,56 @@
+"""
+Benchmark: precomputed CareerMapper transition table vs computing each transition per call
+
+Usage: python benchmarks/bench_transition_table.py [calls per pair]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.career_mapper import CareerMapper
+
+UNKNOWN_ROLES = ["Lawyer", "Airline Pilot", "Chef"]
+
+
+def per_call_us(fn, pairs, repeat):
+    """Median microseconds per call over all pairs"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for role, industry in pairs:
+            fn(role, industry)
+        samples.append((time.perf_counter() - start) / len(pairs) * 1e6)
+    return float(np.median(samples))
+
+
+def main(repeat):
+    start = time.perf_counter()
+    mapper = CareerMapper()
+    print(f"CareerMapper() with {len(mapper.transitions)} precomputed pairs: "
+          f"{(time.perf_counter() - start) * 1000:.0f}ms")
+
+    pairs = list(mapper.transitions)
+    for role, industry in pairs:
+        served = mapper.map_career_transition(role, industry)
+        assert served.resolved_role == role
+        assert served.with_role_match(None, None, 0.0) == mapper._compute_transition(role, industry)
+    print(f"table lookups match the computed path for all {len(pairs)} pairs")
+
+    computed = per_call_us(mapper._compute_transition, pairs, repeat)
+    table = per_call_us(mapper._map_transition, pairs, repeat)
+    cached = per_call_us(mapper.map_career_transition, pairs, repeat)
+    industries = sorted({industry for _, industry in pairs})
+    unknown = per_call_us(mapper._map_transition,
+                          [(role, industry) for role in UNKNOWN_ROLES for industry in industries], repeat)
+    print(f"{'computed per call':28} {computed:8.2f}us")
+    print(f"{'precomputed table':28} {table:8.2f}us  ({computed / table:.0f}x)")
+    print(f"{'table + per-title LRU':28} {cached:8.2f}us  ({computed / cached:.0f}x)")
+    print(f"{'unknown role (fallback)':28} {unknown:8.2f}us")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
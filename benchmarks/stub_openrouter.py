@@ -0,0 +1,128 @@
+"""
+Local stub of the OpenRouter chat completions endpoint (JSON and SSE streaming)
+for benchmarks and manual testing
+
+Usage: python benchmarks/stub_openrouter.py [port]
+"""
+
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubOpenRouter:
+    def __init__(self, latency: float = 0.0, fail_first: int = 0, fail_status: int = 429,
+                 answer: str = "Start with Python and statistics, then build two portfolio projects.",
+                 token_delay: float = 0.0):
+        """
+        Serve canned chat completions on localhost
+
+        Args:
+            latency: Seconds to wait before answering each request
+            fail_first: Number of initial requests answered with fail_status
+            fail_status: Status code used for the injected failures
+            answer: Content returned in choices[0].message.content
+            token_delay: Seconds between streamed tokens when the request sets "stream": true
+        """
+        self.latency = latency
+        self.fail_first = fail_first
+        self.fail_status = fail_status
+        self.answer = answer
+        self.token_delay = token_delay
+        self.requests = 0
+        self.connections = set()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/v1/chat/completions"
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                with stub._lock:
+                    stub.requests += 1
+                    stub.connections.add(self.client_address)
+                    failing = stub.requests <= stub.fail_first
+                if stub.latency:
+                    time.sleep(stub.latency)
+                if failing:
+                    self._send(stub.fail_status, {"error": {"message": "injected failure"}})
+                elif payload.get("stream"):
+                    self._stream(stub.answer)
+                else:
+                    self._send(200, {"choices": [{"message": {
+                        "role": "assistant",
+                        "content": f"{stub.answer} ({payload.get('messages', [{}])[-1].get('content', '')})"
+                    }}]})
+
+            def _stream(self, answer: str):
+                """Emit the answer as OpenRouter-style SSE deltas over chunked encoding"""
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                self._chunk(": OPENROUTER PROCESSING\n\n")
+                for token in answer.split(" "):
+                    if stub.token_delay:
+                        time.sleep(stub.token_delay)
+                    event = {"choices": [{"delta": {"content": token + " "}}]}
+                    self._chunk(f"data: {json.dumps(event)}\n\n")
+                self._chunk("data: [DONE]\n\n")
+                self.wfile.write(b"0\r\n\r\n")
+
+            def _chunk(self, text: str):
+                data = text.encode("utf-8")
+                self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+                self.wfile.flush()
+
+            def _send(self, status: int, body: dict):
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                if status == 429:
+                    self.send_header("Retry-After", "0")
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+    def start(self) -> "StubOpenRouter":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+if __name__ == "__main__":
+    stub = StubOpenRouter()
+    if len(sys.argv) > 1:
+        stub._server.server_close()
+        stub._server = ThreadingHTTPServer(("127.0.0.1", int(sys.argv[1])), stub._handler())
+    print(f"Stub OpenRouter listening on {stub.url}")
+    stub._server.serve_forever()
@@ -0,0 +1,114 @@
+"""
+Synthetic profile generator shared by the benchmark scripts
+"""
+
+import random
+from typing import Dict, Iterator, List
+
+SKILL_POOL = [
+    "Python", "Machine Learning", "Mathematics", "Statistics", "TensorFlow", "PyTorch",
+    "Deep Learning", "NLP", "Computer Vision", "Programming", "Cryptography",
+    "Distributed Systems", "Solidity", "Web3", "Smart Contracts", "DeFi", "Ethereum",
+    "Networking", "Security Fundamentals", "Linux", "Penetration Testing", "SIEM",
+    "Cloud Security", "Biology", "Data Analysis", "Research Methods", "Bioinformatics",
+    "Genomics", "R/Python", "Lab Techniques", "Agriculture Knowledge", "IoT",
+    "Precision Agriculture", "GIS", "Sustainability", "Automation", "Marine Science",
+    "Environmental Science", "Aquaculture Systems", "Water Quality", "Engineering",
+    "Physics", "Aerospace Engineering", "Systems Engineering", "MATLAB", "Simulation",
+    "Energy Systems", "Solar/Wind Technology", "Grid Systems", "Energy Storage",
+    "Problem Solving", "Excel", "SQL", "Tableau", "Project Management", "Communication"
+]
+
+ROLES = ["Software Developer", "Data Analyst", "Engineer", "Researcher", "Teacher",
+         "Healthcare Professional", "Accountant", "Marketing Professional", "Product Manager"]
+
+EDUCATION = ["High School", "Associate Degree", "Bachelors", "Masters", "PhD", "Bootcamp"]
+
+CERTIFICATIONS = ["AWS ML Specialty", "Security+", "CISSP", "Certified Blockchain Expert",
+                  "GIS Professional", "LEED Green Associate", "PMP", "Google Data Analytics"]
+
+
+def make_profile(rng: random.Random) -> Dict:
+    """Build one random profile in the calculate_readiness_score shape"""
+    skills = rng.sample(SKILL_POOL, rng.randint(2, 14))
+    split = len(skills) // 2
+    return {
+        "skills": {"technical": skills[:split], "domain": skills[split:]},
+        "experience_years": rng.randint(0, 20),
+        "education_level": rng.choice(EDUCATION),
+        "current_role": rng.choice(ROLES),
+        "projects": [f"Project {i}" for i in range(rng.randint(0, 6))],
+        "certifications": rng.sample(CERTIFICATIONS, rng.randint(0, 3))
+    }
+
+
+def iter_profiles(count: int, seed: int = 42) -> Iterator[Dict]:
+    """Yield `count` reproducible random profiles"""
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield make_profile(rng)
+
+
+def make_profiles(count: int, seed: int = 42) -> List[Dict]:
+    """Return `count` reproducible random profiles"""
+    return list(iter_profiles(count, seed))
+
+
+def random_session_edit(rng: random.Random, session):
+    """Apply one UI-style edit to a ScoringSession: a skill toggled or one input changed"""
+    kind = rng.choice(["add", "add", "remove", "remove", "experience_years", "current_role",
+                       "education_level", "projects", "certifications"])
+    if kind == "add":
+        session.add_skill(rng.choice(SKILL_POOL + ["python", "Unknown Skill"]))
+    elif kind == "remove":
+        held = session.profile["skills"]["general"]
+        session.remove_skill(rng.choice(held) if held else "Python")
+    elif kind == "experience_years":
+        session.set_field(kind, rng.randint(0, 20))
+    elif kind == "current_role":
+        session.set_field(kind, rng.choice(ROLES + ["Sr. Data Scientist", "Chef"]))
+    elif kind == "education_level":
+        session.set_field(kind, rng.choice(EDUCATION))
+    elif kind == "projects":
+        session.set_field(kind, [f"Project {i}" for i in range(rng.randint(0, 6))])
+    else:
+        session.set_field(kind, rng.sample(CERTIFICATIONS, rng.randint(0, 3)))
+
+
+COURSE_PLATFORMS = ["Coursera", "Udemy", "edX", "Pluralsight", "LinkedIn Learning", "DataCamp"]
+COURSE_PREFIXES = ["Intro to", "Applied", "Mastering", "Practical", "Advanced", "Hands-on", "Foundations of"]
+COURSE_SUFFIXES = ["Bootcamp", "Specialization", "Essentials", "Certificate", "Workshop", "in Practice"]
+COURSE_INDUSTRIES = ["AI", "Blockchain", "Cybersecurity", "BioTech", "AgriTech", "AquaTech", "SpaceTech",
+                     "Renewable"]
+
+
+def make_course_catalog(count: int, seed: int = 42):
+    """Random catalog in the course_catalog.csv layout, built column-wise"""
+    import numpy as np
+    import pandas as pd
+    from utils.data_loader import COURSE_CATALOG_DTYPES, load_industry_skills
+
+    rng = np.random.default_rng(seed)
+    skills = load_industry_skills()
+    skill_names = skills["skill_name"].to_numpy(dtype=object)
+    skill_industries = skills["industry"].astype(str).to_numpy(dtype=object)
+
+    skill = rng.integers(0, len(skill_names), count)
+    prefix = rng.integers(0, len(COURSE_PREFIXES), count)
+    suffix = rng.integers(0, len(COURSE_SUFFIXES), count)
+    names = np.array([f"{p} {s} {x}" for p in COURSE_PREFIXES for s in skill_names for x in COURSE_SUFFIXES],
+                     dtype=object)
+    name_index = (prefix * len(skill_names) + skill) * len(COURSE_SUFFIXES) + suffix
+
+    frame = pd.DataFrame({
+        "course_name": names[name_index],
+        "platform": np.array(COURSE_PLATFORMS, dtype=object)[rng.integers(0, len(COURSE_PLATFORMS), count)],
+        "industry": skill_industries[skill],
+        "skill_focus": skill_names[skill],
+        "duration_weeks": rng.integers(2, 26, count),
+        "difficulty": np.array(["Beginner", "Intermediate", "Advanced"], dtype=object)[rng.integers(0, 3, count)],
+        "price_usd": np.where(rng.random(count) < 0.2, 0.0, np.round(rng.uniform(9.99, 299.0, count), 2)),
+        "rating": np.round(rng.uniform(3.0, 5.0, count), 1),
+        "url": "https://example.com/course"
+    })
+    return frame.astype(COURSE_CATALOG_DTYPES)
@@ -0,0 +1,74 @@
+"""
+Tests: assessment store pruning and connection pool lifecycle
+
+Usage: python -m pytest benchmarks/test_assessment_store.py
+"""
+
+import os
+import sqlite3
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.assessment_store import MemoryAssessmentStore, SQLiteAssessmentStore
+
+RANKING = [{"industry": "AI", "rank": 1, "overall_score": 61.5}, {"industry": "RENEWABLE", "rank": 2,
+                                                                  "overall_score": 40.0}]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteAssessmentStore(str(tmp_path / "assessments.db"), pool_size=2, max_profiles=3)
+    yield store
+    store.close()
+
+
+def row_counts(store):
+    with store.pool.connection() as conn:
+        return [conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("profiles", "readiness_results", "transitions")]
+
+
+def test_only_latest_profiles_are_kept(store):
+    for i in range(8):
+        store.save_assessment("user", {"experience_years": i}, f"key{i}", RANKING, {"AI": {"step": i}})
+    store.save_assessment("other", {"experience_years": 0}, "key0", RANKING)
+
+    assert row_counts(store) == [3 + 1, (3 + 1) * len(RANKING), 3]
+    assert store.load_assessment("user")["profile"] == {"experience_years": 7}
+    assert store.load_assessment("user", "key4") is None
+    assert store.load_assessment("user", "key5")["transitions"] == {"AI": {"step": 5}}
+    assert store.load_assessment("other", "key0") is not None
+
+
+def test_resaving_a_profile_keeps_it(store):
+    for i in range(3):
+        store.save_assessment("user", {"experience_years": i}, f"key{i}", RANKING)
+    store.save_assessment("user", {"experience_years": 0}, "key0", RANKING)
+    store.save_assessment("user", {"experience_years": 3}, "key3", RANKING)
+    assert store.load_assessment("user", "key0") is not None
+    assert store.load_assessment("user", "key1") is None
+
+
+def test_memory_store_keeps_latest_profiles():
+    store = MemoryAssessmentStore(max_profiles=3)
+    for i in range(8):
+        store.save_assessment("user", {"experience_years": i}, f"key{i}", RANKING)
+    assert store.load_assessment("user", "key4") is None
+    assert store.load_assessment("user")["profile_key"] == "key7"
+
+
+def test_closed_pool_raises_and_accounts_for_borrowed_connections(store):
+    pool = store.pool
+    with pool.connection():
+        with pool.connection():
+            assert pool._created == 2
+            store.close()
+        assert pool._created == 1
+    assert pool._created == 0
+    assert pool._idle.empty()
+    with pytest.raises(sqlite3.ProgrammingError):
+        with pool.connection():
+            pass
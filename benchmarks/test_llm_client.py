@@ -0,0 +1,98 @@
+"""
+Tests: OpenRouterClient retry, circuit breaker and 4xx handling against the local stub server
+
+Usage: python -m pytest benchmarks/test_llm_client.py
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from stub_openrouter import StubOpenRouter
+from utils.advisor import build_payload
+from utils.llm_client import CircuitBreaker, CircuitOpenError, LLMHTTPError, OpenRouterClient
+
+PAYLOAD = build_payload("How do I move into data science?", "stub/model")
+
+
+def test_retries_429_then_succeeds():
+    with StubOpenRouter(fail_first=2, fail_status=429) as stub:
+        client = OpenRouterClient("test-key", base_url=stub.url, max_retries=3, backoff_base=0.001)
+        answer = client.chat(PAYLOAD)
+        assert answer.startswith(stub.answer)
+        assert stub.requests == 3
+    metrics = client.metrics.snapshot()
+    assert metrics["retries"] == 2
+    assert metrics["calls"] == 1 and metrics["successes"] == 1 and metrics["failures"] == 0
+    assert client.breaker.state == "closed"
+
+
+def test_persistent_503_opens_breaker():
+    with StubOpenRouter(fail_first=10 ** 6, fail_status=503) as stub:
+        client = OpenRouterClient("test-key", base_url=stub.url, max_retries=1, backoff_base=0.001,
+                                  breaker=CircuitBreaker(failure_threshold=3, reset_timeout=60))
+        for _ in range(3):
+            with pytest.raises(LLMHTTPError) as excinfo:
+                client.chat(PAYLOAD)
+            assert excinfo.value.status_code == 503
+        assert client.breaker.state == "open"
+        seen = stub.requests
+        assert seen == 3 * (client.max_retries + 1)
+
+        for _ in range(5):
+            with pytest.raises(CircuitOpenError):
+                client.chat(PAYLOAD)
+        assert stub.requests == seen
+    assert client.metrics.snapshot()["short_circuited"] == 5
+
+
+@pytest.mark.parametrize("status", [400, 401, 404])
+def test_client_errors_are_not_retried(status):
+    with StubOpenRouter(fail_first=1, fail_status=status) as stub:
+        client = OpenRouterClient("test-key", base_url=stub.url, max_retries=3, backoff_base=0.001,
+                                  breaker=CircuitBreaker(failure_threshold=1, reset_timeout=60))
+        with pytest.raises(LLMHTTPError) as excinfo:
+            client.chat(PAYLOAD)
+        assert excinfo.value.status_code == status
+        assert stub.requests == 1
+        # A client error says nothing about service health, so the breaker stays closed
+        assert client.breaker.state == "closed"
+    assert client.metrics.snapshot()["retries"] == 0
+
+
+def test_client_errors_do_not_reset_failure_count():
+    with StubOpenRouter(fail_first=10 ** 6, fail_status=503) as stub:
+        client = OpenRouterClient("test-key", base_url=stub.url, max_retries=0,
+                                  breaker=CircuitBreaker(failure_threshold=3, reset_timeout=60))
+        for status in (503, 503, 400, 401, 503):
+            stub.fail_status = status
+            with pytest.raises(LLMHTTPError):
+                client.chat(PAYLOAD)
+        assert client.breaker.state == "open"
+        with pytest.raises(CircuitOpenError):
+            client.chat(PAYLOAD)
+        assert stub.requests == 5
+
+
+def test_client_error_in_half_open_only_frees_the_trial():
+    with StubOpenRouter(fail_first=10 ** 6, fail_status=503) as stub:
+        client = OpenRouterClient("test-key", base_url=stub.url, max_retries=0,
+                                  breaker=CircuitBreaker(failure_threshold=1, reset_timeout=0.05))
+        with pytest.raises(LLMHTTPError):
+            client.chat(PAYLOAD)
+        assert client.breaker.state == "open"
+        time.sleep(0.06)
+
+        stub.fail_status = 400
+        with pytest.raises(LLMHTTPError):
+            client.chat(PAYLOAD)
+        # Not closed by the 400, but the next call may still be tried
+        assert client.breaker.state == "half_open"
+        stub.fail_first = 0
+        assert client.chat(PAYLOAD).startswith(stub.answer)
+        assert client.breaker.state == "closed"
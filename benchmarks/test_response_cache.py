@@ -0,0 +1,45 @@
+"""
+Tests: SQLiteCache hits stay read-only between recency refreshes
+
+Usage: python -m pytest benchmarks/test_response_cache.py
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.response_cache import SQLiteCache
+
+
+def test_hits_do_not_write_within_touch_interval(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "responses.db"), touch_interval_seconds=3600)
+    cache.set("key", "answer")
+    writes = cache._conn.total_changes
+    for _ in range(100):
+        assert cache.get("key") == "answer"
+    assert cache._conn.total_changes == writes
+    cache.close()
+
+
+def test_stale_recency_is_refreshed_and_drives_eviction(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "responses.db"), max_entries=2, touch_interval_seconds=0)
+    cache.set("old", "a")
+    cache.set("new", "b")
+    writes = cache._conn.total_changes
+    assert cache.get("old") == "a"
+    assert cache._conn.total_changes == writes + 1
+
+    # "old" was read after "new" was written, so "new" is the least recently used
+    cache.set("newest", "c")
+    assert cache.get("new") is None
+    assert cache.get("old") == "a" and cache.get("newest") == "c"
+    cache.close()
+
+
+def test_expired_entries_are_dropped(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "responses.db"))
+    cache.set("key", "answer", ttl_seconds=-1)
+    assert cache.get("key") is None
+    assert len(cache) == 0
+    cache.close()
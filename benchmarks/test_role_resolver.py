@@ -0,0 +1,53 @@
+"""
+Tests: RoleResolver rejects matches that rest only on generic or seniority words
+
+Usage: python -m pytest benchmarks/test_role_resolver.py
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.role_resolver import RoleResolver, within_one_edit
+
+
+@pytest.fixture(scope="module")
+def resolver():
+    return RoleResolver()
+
+
+@pytest.mark.parametrize("title", [
+    "Intern", "HR Manager", "Project Manager", "Program Manager", "Senior Manager", "Senior",
+    "Associate", "Lead", "Manager", "Specialist", "Lawyer", "Chef", ""
+])
+def test_generic_or_unrelated_titles_are_unknown(resolver, title):
+    assert resolver.resolve(title)["role"] is None
+    assert resolver.canonical_role(title) == title.lower().replace(" ", "_")
+
+
+@pytest.mark.parametrize("title, role", [
+    ("Sr. Software Engineer", "software_developer"),
+    ("Sr. Sofware Engneer", "software_developer"),
+    ("Data Analyts", "data_analyst"),
+    ("dataanalyst", "data_analyst"),
+    ("Accountnat", "accountant"),
+    ("Marketing Mgr", "marketing_professional"),
+    ("Finance Mgr", "accountant"),
+    ("Projct Engineer", "engineer"),
+    ("Nures", "healthcare_professional"),
+    ("CPA", "accountant")
+])
+def test_titles_sharing_a_distinctive_word_resolve(resolver, title, role):
+    assert resolver.resolve(title)["role"] == role
+
+
+def test_within_one_edit():
+    assert within_one_edit("nurse", "nures")
+    assert within_one_edit("sofware", "software")
+    assert within_one_edit("software", "softwares")
+    assert within_one_edit("engineer", "enginear")
+    assert not within_one_edit("project", "product")
+    assert not within_one_edit("intern", "internal")
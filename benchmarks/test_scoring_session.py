@@ -0,0 +1,92 @@
+"""
+Tests: ScoringSession results always equal a full score_matrices recompute
+
+Usage: python -m pytest benchmarks/test_scoring_session.py
+"""
+
+import os
+import random
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic import CERTIFICATIONS, EDUCATION, ROLES, SKILL_POOL, make_profile, random_session_edit
+from utils.industry_ranker import IndustryRanker
+from utils.readiness_score import COMPONENT_NAMES
+from utils.scoring_session import SCALAR_FIELDS, ScoringSession
+
+
+@pytest.fixture(scope="module")
+def ranker():
+    return IndustryRanker()
+
+
+@pytest.fixture
+def session(ranker):
+    return ScoringSession(ranker.calculator, ranker.industries)
+
+
+def check_identical(session: ScoringSession, ranker: IndustryRanker):
+    """Assert the session matches a full recompute of its current profile"""
+    expected = session.calculator.score_matrices([session.profile], session.industries)
+    scores = session.scores()
+    for name in ("overall", "skills", *COMPONENT_NAMES):
+        assert np.array_equal(scores[name], expected[name]), (name, session.profile)
+    assert ranker.rank_industries(session.profile, scores) == ranker.rank_industries(session.profile)
+
+
+def test_add_and_remove_skills(session, ranker):
+    for name in SKILL_POOL + ["python", "PYTHON", "Unknown Skill"]:
+        session.add_skill(name)
+        check_identical(session, ranker)
+    for name in reversed(SKILL_POOL + ["python", "Unknown Skill", "Not Held"]):
+        session.remove_skill(name)
+        check_identical(session, ranker)
+    session.remove_skill("PYTHON")
+    assert session.profile["skills"]["general"] == []
+    check_identical(session, ranker)
+
+
+@pytest.mark.parametrize("field, values", [
+    ("experience_years", [0, 3, 7.5, 20]),
+    ("current_role", ROLES + ["Sr. Data Scientist", "Chef", ""]),
+    ("education_level", EDUCATION + [""]),
+    ("projects", [[], ["Project 0"], [f"Project {i}" for i in range(6)]]),
+    ("certifications", [[], CERTIFICATIONS[:1], CERTIFICATIONS])
+])
+def test_set_field(session, ranker, field, values):
+    session.update(make_profile(random.Random(5)))
+    for value in values:
+        session.set_field(field, value)
+        check_identical(session, ranker)
+
+
+def test_set_field_rejects_unknown_fields(session):
+    with pytest.raises(ValueError):
+        session.set_field("skills", [])
+
+
+def test_update_whole_profiles(session, ranker):
+    rng = random.Random(11)
+    for _ in range(100):
+        profile = make_profile(rng)
+        changed = session.update(profile)
+        assert changed <= {"skills", *SCALAR_FIELDS}
+        check_identical(session, ranker)
+        assert session.update(profile) == set()
+        check_identical(session, ranker)
+
+
+def test_random_edits_match_full_recompute(session, ranker):
+    """2,000 random edits, with whole-profile updates interleaved as the app applies them"""
+    rng = random.Random(7)
+    for step in range(2000):
+        if step % 50 == 0:
+            session.update(make_profile(rng))
+        else:
+            random_session_edit(rng, session)
+        check_identical(session, ranker)
@@ -0,0 +1,60 @@
+"""
+Tests: LearningSchedule re-planning keeps the progress of skills learned in parallel
+
+Usage: python -m pytest benchmarks/test_skill_graph.py
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.industry_ranker import IndustryRanker
+from utils.skill_graph import get_skill_graph
+
+INDUSTRIES = list(IndustryRanker().industries)
+
+
+def end_week(schedule) -> float:
+    return round(schedule.start_week + schedule.total_weeks, 1)
+
+
+def test_on_plan_completion_keeps_parallel_progress():
+    schedule = get_skill_graph("AI").schedule_for_skills([])
+    planned = {entry["skill"]: entry for entry in schedule.entries}
+    # Statistics and Mathematics are learned side by side from week 0
+    assert planned["Statistics"]["end_week"] < planned["Mathematics"]["end_week"]
+
+    replanned = schedule.complete("Statistics", planned["Statistics"]["end_week"])
+    mathematics = next(entry for entry in replanned.entries if entry["skill"] == "Mathematics")
+    assert mathematics["start_week"] == planned["Mathematics"]["start_week"]
+    assert mathematics["end_week"] == planned["Mathematics"]["end_week"]
+    assert end_week(replanned) == end_week(schedule)
+
+
+@pytest.mark.parametrize("industry", INDUSTRIES)
+def test_completing_each_skill_on_plan_keeps_end_week(industry):
+    schedule = get_skill_graph(industry).schedule_for_skills([])
+    for entry in schedule.entries:
+        assert end_week(schedule.complete(entry["skill"], entry["end_week"])) == end_week(schedule), entry
+
+
+@pytest.mark.parametrize("industry", INDUSTRIES)
+def test_completing_the_whole_plan_in_order_keeps_end_week(industry):
+    schedule = get_skill_graph(industry).schedule_for_skills([])
+    expected = end_week(schedule)
+    current = schedule
+    while current.entries:
+        first = min(current.entries, key=lambda entry: entry["end_week"])
+        current = current.complete(first["skill"])
+        assert end_week(current) == expected, first
+    assert current.remaining == set()
+
+
+def test_early_completion_never_delays():
+    schedule = get_skill_graph("AI").schedule_for_skills([])
+    statistics = next(entry for entry in schedule.entries if entry["skill"] == "Statistics")
+    early = schedule.complete("Statistics", statistics["end_week"] / 2)
+    assert end_week(early) <= end_week(schedule)
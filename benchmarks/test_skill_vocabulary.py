@@ -0,0 +1,49 @@
+"""
+Tests: SkillVocabulary composite interning is safe across threads
+
+Usage: python -m pytest benchmarks/test_skill_vocabulary.py
+"""
+
+import os
+import sys
+import threading
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.skill_vocabulary import SkillVocabulary
+
+
+def test_composites_sharing_a_part_keep_every_bit():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for _ in range(20):
+            vocabulary = SkillVocabulary(["Python"])
+            composites = [f"Skill{i}/Python" for i in range(64)]
+            barrier = threading.Barrier(8)
+
+            def intern_some(offset: int):
+                barrier.wait()
+                for name in composites[offset::8]:
+                    vocabulary.intern(name)
+
+            threads = [threading.Thread(target=intern_some, args=(offset,)) for offset in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            python = vocabulary.mask(["Python"])
+            for name in composites:
+                assert SkillVocabulary.has(python, vocabulary.lookup(name)), name
+            assert len(vocabulary) == 1 + 2 * len(composites)
+    finally:
+        sys.setswitchinterval(interval)
+
+
+def test_composite_is_satisfied_by_each_part():
+    vocabulary = SkillVocabulary(["R/Python"])
+    composite = vocabulary.lookup("R/Python")
+    for part in ("R", "python", "PYTHON"):
+        assert SkillVocabulary.has(vocabulary.mask([part]), composite)
+    assert not SkillVocabulary.has(vocabulary.mask(["SQL"]), composite)
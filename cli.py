@@ -0,0 +1,330 @@
+"""
+Headless Command-Line Interface
+Bulk career-transition and readiness reports outside the Streamlit app
+
+Usage:
+    python cli.py report --input profiles.jsonl --output results.jsonl --workers 8
+    python cli.py pack --input profiles.jsonl --output population.skm
+    python cli.py warmup --cache-path advisor_cache.db
+    python cli.py figures
+    python cli.py cohorts --input population.skm
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterator, List, Tuple
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from config import FUTURE_INDUSTRIES
+from utils.profile_ingest import ProfileValidationError, iter_profiles, open_result_writer
+from utils.result_export import build_record_batch, infer_format
+
+# Per-process engines, created once by the pool initializer
+_calculator = None
+_mapper = None
+
+
+def _init_worker():
+    """Build the scoring engines once per worker process"""
+    global _calculator, _mapper
+    from utils.career_mapper import CareerMapper
+    from utils.readiness_score import ReadinessCalculator
+
+    _calculator = ReadinessCalculator()
+    _mapper = CareerMapper()
+
+
+def _process_chunk(chunk: List[Tuple[object, Dict]], industries: List[str], output_format: str):
+    """Score one chunk of profiles in a worker process"""
+    # Transition results depend only on (role, industry), so reuse them within the chunk
+    transitions = {}
+    columnar = output_format != "jsonl"
+    ids, targets, readiness_results, transition_results = [], [], [], []
+    results = []
+    for profile_id, profile in chunk:
+        role = profile.get("current_role", "")
+        for industry in industries:
+            readiness = _calculator.calculate_readiness_score(profile, industry)
+            key = (role, industry)
+            if key not in transitions:
+                transition = _mapper.map_career_transition(role, industry)
+                transitions[key] = (transition, None if columnar else json.dumps(transition.to_dict()))
+            transition, transition_json = transitions[key]
+
+            if columnar:
+                ids.append(profile_id)
+                targets.append(industry)
+                readiness_results.append(readiness)
+                transition_results.append(transition)
+            else:
+                # Splice the pre-serialized transition instead of re-encoding it per profile
+                results.append(f'{{"profile_id": {json.dumps(profile_id)}, "industry": {json.dumps(industry)}, '
+                               f'"readiness": {json.dumps(readiness.to_dict())}, "transition": {transition_json}}}')
+    if columnar:
+        # One Arrow record batch per chunk: a Parquet row group or IPC batch when written
+        return build_record_batch(ids, targets, readiness_results, transition_results)
+    return results
+
+
+def _chunks(profiles: Iterator[Dict], size: int) -> Iterator[List[Tuple[object, Dict]]]:
+    """Group profiles into (id, profile) chunks"""
+    chunk = []
+    for index, profile in enumerate(profiles):
+        profile_id = profile.get("id")
+        chunk.append((index if profile_id is None else profile_id, profile))
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def run_report(args) -> Dict:
+    """Fan profile chunks out over a process pool and stream results in input order"""
+    industries = args.industry or list(FUTURE_INDUSTRIES)
+    output_format = args.format or infer_format(args.output)
+    workers = args.workers or os.cpu_count() or 1
+
+    invalid = []
+
+    def record_error(number: int, error: Exception):
+        invalid.append(number)
+        if not args.quiet and len(invalid) <= 10:
+            print(f"[report] skipping record {number}: {error}", file=sys.stderr)
+
+    # Profiles are parsed lazily and only a bounded number of chunks is in
+    # flight, so memory stays flat whatever the input size
+    max_in_flight = workers * 2
+    profiles = iter_profiles(args.input, on_error=args.on_error, error_callback=record_error)
+    chunks = _chunks(profiles, args.chunk_size)
+    pending = {}
+    ready = {}
+    next_to_write = 0
+    submitted = 0
+    profiles_done = 0
+    start = last_report = time.perf_counter()
+
+    try:
+        writer = open_result_writer(args.output, output_format)
+    except ImportError as exc:
+        raise SystemExit(str(exc))
+
+    # A Parquet/Arrow file is only readable once its footer is written, so close on every exit
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            exhausted = False
+            while True:
+                while not exhausted and len(pending) < max_in_flight:
+                    try:
+                        chunk = next(chunks, None)
+                    except ProfileValidationError as exc:
+                        raise SystemExit(f"Invalid profile in {args.input}: {exc}")
+                    if chunk is None:
+                        exhausted = True
+                        break
+                    future = executor.submit(_process_chunk, chunk, industries, output_format)
+                    pending[future] = (submitted, len(chunk))
+                    submitted += 1
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    sequence, size = pending.pop(future)
+                    ready[sequence] = (future.result(), size)
+
+                # Write completed chunks in submission order
+                while next_to_write in ready:
+                    results, size = ready.pop(next_to_write)
+                    writer.write(results)
+                    profiles_done += size
+                    next_to_write += 1
+
+                now = time.perf_counter()
+                if not args.quiet and now - last_report >= args.progress_interval:
+                    print(f"[report] {profiles_done:,} profiles  "
+                          f"{profiles_done / (now - start):,.0f} profiles/s", file=sys.stderr)
+                    last_report = now
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - start
+    summary = {
+        "profiles": profiles_done,
+        "invalid": len(invalid),
+        "pairs": profiles_done * len(industries),
+        "seconds": round(elapsed, 2),
+        "profiles_per_second": round(profiles_done / elapsed, 1) if elapsed else 0.0,
+        "workers": workers,
+        "chunk_size": args.chunk_size
+    }
+    print(json.dumps(summary), file=sys.stderr)
+    return summary
+
+
+def run_pack(args) -> Dict:
+    """Stream profiles into a packed, memory-mappable skill matrix file"""
+    from utils.skill_matrix import SkillMatrixWriter
+
+    invalid = []
+    profiles = iter_profiles(args.input, on_error=args.on_error,
+                             error_callback=lambda number, error: invalid.append(number))
+    start = time.perf_counter()
+    with SkillMatrixWriter(args.output) as writer:
+        try:
+            for chunk in _chunks(profiles, args.chunk_size):
+                writer.write(profile for _, profile in chunk)
+        except ProfileValidationError as exc:
+            raise SystemExit(f"Invalid profile in {args.input}: {exc}")
+
+    summary = {"profiles": writer.rows, "invalid": len(invalid), "skills": writer.width,
+               "bytes_per_profile": writer.dtype.itemsize, "seconds": round(time.perf_counter() - start, 2)}
+    print(json.dumps(summary), file=sys.stderr)
+    return summary
+
+
+def _openrouter_credentials(args) -> Tuple[str, str]:
+    """API key and model from flags, the environment, or .streamlit/secrets.toml"""
+    secrets = {}
+    secrets_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".streamlit", "secrets.toml")
+    if os.path.exists(secrets_path):
+        import tomllib
+        with open(secrets_path, "rb") as handle:
+            secrets = tomllib.load(handle)
+
+    api_key = args.api_key or os.getenv("OPENROUTER_API_KEY") or secrets.get("OPENROUTER_API_KEY")
+    model = args.model or os.getenv("OPENROUTER_MODEL") or secrets.get("OPENROUTER_MODEL")
+    if not api_key or not model:
+        raise SystemExit("Set OPENROUTER_API_KEY and OPENROUTER_MODEL (env or .streamlit/secrets.toml)")
+    return api_key, model
+
+
+def run_warmup(args) -> Dict:
+    """Pre-fill the persistent advisor cache for every canned prompt in one parallel batch"""
+    from config import RESPONSE_CACHE
+    from utils.advisor import BUSY_MESSAGE, OFFLINE_MESSAGE, create_client, create_response_cache
+    from utils.async_advisor import ask_many, canned_prompts
+
+    cache_path = args.cache_path or RESPONSE_CACHE["sqlite_path"]
+    if not cache_path:
+        raise SystemExit("Warm-up needs a persistent cache: pass --cache-path or set RESPONSE_CACHE_PATH")
+
+    api_key, model = _openrouter_credentials(args)
+    cache = create_response_cache({**RESPONSE_CACHE, "sqlite_path": cache_path})
+    client = create_client(api_key, base_url=args.base_url) if args.base_url else None
+    prompts = canned_prompts()
+
+    start = time.perf_counter()
+    answers = ask_many(prompts, api_key, model, cache=cache, client=client, concurrency=args.concurrency)
+    elapsed = time.perf_counter() - start
+
+    failed = sum(1 for answer in answers if answer in (BUSY_MESSAGE, OFFLINE_MESSAGE))
+    summary = {"prompts": len(prompts), "failed": failed, "seconds": round(elapsed, 2),
+               "cache": cache.stats()}
+    print(json.dumps(summary), file=sys.stderr)
+    return summary
+
+
+def run_figures(args) -> Dict:
+    """Pre-render the app's static Plotly figures to JSON"""
+    from components.figure_cache import build_static_figures
+
+    start = time.perf_counter()
+    written = build_static_figures(args.output_dir)
+    summary = {"figures": sorted(written), "directory": os.path.dirname(next(iter(written.values()))),
+               "seconds": round(time.perf_counter() - start, 2)}
+    print(json.dumps(summary), file=sys.stderr)
+    return summary
+
+
+def run_cohorts(args) -> Dict:
+    """Score a population once and store role x industry x education cubes as Parquet"""
+    import tempfile
+    from config import COHORT_CUBE
+    from utils.cohort_cubes import build_cohort_cube, write_cohort_cube
+    from utils.skill_matrix import SKILL_MATRIX_EXTENSION, SkillMatrix
+
+    output = args.output or COHORT_CUBE["path"]
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory() as scratch:
+        source = args.input
+        if not source.lower().endswith(SKILL_MATRIX_EXTENSION):
+            # Raw profiles are packed first so scoring runs over the mapped matrix
+            source = os.path.join(scratch, "population" + SKILL_MATRIX_EXTENSION)
+            run_pack(argparse.Namespace(input=args.input, output=source, chunk_size=10000, on_error=args.on_error))
+        matrix = SkillMatrix(source)
+        cube = build_cohort_cube(matrix, industries=args.industry, bins=args.bins)
+        del matrix
+    cells = write_cohort_cube(cube, output)
+
+    summary = {"profiles": int(cube.counts.sum(axis=(0, 2)).max(initial=0)), "cells": cells, "output": output,
+               "seconds": round(time.perf_counter() - start, 2)}
+    print(json.dumps(summary), file=sys.stderr)
+    return summary
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Career Shift Analyzer command-line tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    report = commands.add_parser("report", help="Bulk transition and readiness report")
+    report.add_argument("--input", required=True, help="Profiles as .jsonl or .csv")
+    report.add_argument("--output", required=True, help="Results as .jsonl, .parquet or .arrow")
+    report.add_argument("--format", choices=["jsonl", "parquet", "arrow"], help="Override output format")
+    report.add_argument("--industry", action="append", choices=list(FUTURE_INDUSTRIES),
+                        help="Target industry (repeatable, default: all)")
+    report.add_argument("--workers", type=int, default=0, help="Worker processes (default: CPU count)")
+    report.add_argument("--chunk-size", type=int, default=500, help="Profiles per submitted chunk")
+    report.add_argument("--on-error", choices=["skip", "raise"], default="skip",
+                        help="Skip or stop at profiles that fail validation")
+    report.add_argument("--progress-interval", type=float, default=2.0, help="Seconds between progress lines")
+    report.add_argument("--quiet", action="store_true", help="Suppress progress output")
+    report.set_defaults(handler=run_report)
+
+    pack = commands.add_parser("pack", help="Pack profiles into a memory-mapped skill matrix (.skm)")
+    pack.add_argument("--input", required=True, help="Profiles as .jsonl or .csv")
+    pack.add_argument("--output", required=True, help="Packed population file")
+    pack.add_argument("--chunk-size", type=int, default=10000, help="Profiles encoded per batch")
+    pack.add_argument("--on-error", choices=["skip", "raise"], default="skip",
+                      help="Skip or stop at profiles that fail validation")
+    pack.set_defaults(handler=run_pack)
+
+    warmup = commands.add_parser("warmup", help="Pre-generate advisor answers for every canned prompt")
+    warmup.add_argument("--cache-path", help="SQLite response cache (default: RESPONSE_CACHE_PATH)")
+    warmup.add_argument("--concurrency", type=int, default=8, help="Requests in flight")
+    warmup.add_argument("--api-key", help="OpenRouter API key (default: env or secrets.toml)")
+    warmup.add_argument("--model", help="OpenRouter model (default: env or secrets.toml)")
+    warmup.add_argument("--base-url", help="Override the chat completions endpoint")
+    warmup.set_defaults(handler=run_warmup)
+
+    figures = commands.add_parser("figures", help="Pre-render static charts to Plotly JSON")
+    figures.add_argument("--output-dir", help="Output directory (default: FIGURE_CACHE_DIR or build/figures)")
+    figures.set_defaults(handler=run_figures)
+
+    cohorts = commands.add_parser("cohorts", help="Build role x industry x education readiness cubes (Parquet)")
+    cohorts.add_argument("--input", required=True, help="Packed population (.skm) or profiles as .jsonl/.csv")
+    cohorts.add_argument("--output", help="Cube file (default: COHORT_CUBE_PATH or build/cohorts.parquet)")
+    cohorts.add_argument("--industry", action="append", choices=list(FUTURE_INDUSTRIES),
+                         help="Industry to aggregate (repeatable, default: all)")
+    cohorts.add_argument("--bins", type=int, default=20, help="Histogram bins over 0-100")
+    cohorts.add_argument("--on-error", choices=["skip", "raise"], default="skip",
+                         help="Skip or stop at profiles that fail validation (unpacked input)")
+    cohorts.set_defaults(handler=run_cohorts)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
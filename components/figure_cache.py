@@ -0,0 +1,137 @@
+"""
+Figure Cache
+Memoized Plotly figures and JSON for the app's charts, optionally pre-rendered to disk
+"""
+
+import hashlib
+import inspect
+import json
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
+
+import plotly
+import plotly.graph_objects as go
+import plotly.io as pio
+import streamlit as st
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import FIGURE_CACHE
+from components.visualizations import (create_industry_demand_chart, create_interactive_growth_chart,
+                                       create_radar_chart, create_salary_comparison_chart,
+                                       create_salary_projection)
+
+# Charts built from constant data; these are the ones pre-rendered to disk
+STATIC_FIGURES: Dict[str, Callable[[], go.Figure]] = {
+    "growth_projections": create_interactive_growth_chart,
+    "salary_ranges": create_salary_comparison_chart,
+    "industry_demand": create_industry_demand_chart
+}
+
+# Charts keyed on their (hashable) inputs
+PARAMETERIZED_FIGURES: Dict[str, Callable[..., go.Figure]] = {
+    "salary_projection": create_salary_projection,
+    "radar": lambda items, title: create_radar_chart(dict(items), title)
+}
+
+MANIFEST_NAME = "manifest.json"
+
+
+def fingerprint(name: str) -> str:
+    """Version of a static figure: its builder's source and the Plotly release"""
+    source = inspect.getsource(STATIC_FIGURES[name]) + plotly.__version__
+    return hashlib.sha1(source.encode("utf-8")).hexdigest()[:16]
+
+
+def _read_prerendered(name: str, directory: str) -> Optional[str]:
+    """Pre-rendered JSON for a static figure, or None when missing or stale"""
+    try:
+        with open(os.path.join(directory, MANIFEST_NAME), encoding="utf-8") as handle:
+            manifest = json.load(handle)
+        if manifest.get(name) != fingerprint(name):
+            return None
+        with open(os.path.join(directory, f"{name}.json"), encoding="utf-8") as handle:
+            return handle.read()
+    except (OSError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=FIGURE_CACHE["entries"])
+def figure_json(name: str, args: Tuple = ()) -> str:
+    """
+    Serialized Plotly JSON for a chart, built at most once per process
+
+    Args:
+        name: Key of STATIC_FIGURES or PARAMETERIZED_FIGURES
+        args: Builder arguments for parameterized charts (hashable)
+
+    Returns:
+        Figure JSON; static charts come from the pre-rendered files when current
+    """
+    if name in STATIC_FIGURES:
+        prerendered = _read_prerendered(name, FIGURE_CACHE["directory"])
+        if prerendered is not None:
+            return prerendered
+    return pio.to_json(get_figure(name, args), validate=False)
+
+
+@lru_cache(maxsize=FIGURE_CACHE["entries"])
+def get_figure(name: str, args: Tuple = ()) -> go.Figure:
+    """Shared figure object for a chart (treat as read-only)"""
+    if name in STATIC_FIGURES:
+        prerendered = _read_prerendered(name, FIGURE_CACHE["directory"])
+        if prerendered is not None:
+            return pio.from_json(prerendered)
+        return STATIC_FIGURES[name]()
+    return PARAMETERIZED_FIGURES[name](*args)
+
+
+def radar_args(scores: Dict[str, float], title: str = "Skills Assessment") -> Tuple:
+    """Cache key arguments for the radar chart"""
+    return (tuple(scores.items()), title)
+
+
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE["entries"])
+def show_figure(name: str, args: Tuple = ()):
+    """
+    Render a cached chart with st.plotly_chart
+
+    The element is recorded on first render and replayed by Streamlit on later
+    reruns, so a cached chart costs neither a rebuild nor re-serialization.
+    """
+    st.plotly_chart(get_figure(name, args), use_container_width=True)
+
+
+def build_static_figures(directory: Optional[str] = None) -> Dict[str, str]:
+    """
+    Pre-render every static figure to JSON files plus a fingerprint manifest
+
+    Args:
+        directory: Output directory (defaults to FIGURE_CACHE["directory"])
+
+    Returns:
+        Figure name -> written file path
+    """
+    directory = directory or FIGURE_CACHE["directory"]
+    os.makedirs(directory, exist_ok=True)
+    written, manifest = {}, {}
+    for name, builder in STATIC_FIGURES.items():
+        path = os.path.join(directory, f"{name}.json")
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(pio.to_json(builder(), validate=False))
+        written[name] = path
+        manifest[name] = fingerprint(name)
+    with open(os.path.join(directory, MANIFEST_NAME), "w", encoding="utf-8") as handle:
+        json.dump(manifest, handle, indent=2)
+    clear_cache()
+    return written
+
+
+def clear_cache():
+    """Forget memoized figures and recorded chart elements"""
+    figure_json.cache_clear()
+    get_figure.cache_clear()
+    show_figure.clear()
@@ -0,0 +1,185 @@
+"""
+App Services
+Scoring engines, dataset frames and HTTP clients shared by every Streamlit session
+"""
+
+import threading
+from typing import List, Optional
+
+import pandas as pd
+import streamlit as st
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import COHORT_CUBE
+from utils import data_loader
+from utils.advisor import OPENROUTER_URL, create_client, create_response_cache
+from utils.assessment_store import create_assessment_store
+from utils.career_mapper import CareerMapper
+from utils.cohort_cubes import CohortCube, read_cohort_cube
+from utils.course_search import CourseSearchEngine
+from utils.industry_ranker import IndustryRanker
+from utils.llm_client import OpenRouterClient
+from utils.readiness_score import ReadinessCalculator
+from utils.response_cache import ResponseCache
+
+# Each resource is built once per process (Streamlit holds a per-key lock while
+# building) and shared by every session. Resources are read-only after
+# construction apart from internal memo caches, which are lock-guarded or single
+# dict operations, so concurrent sessions need no further locking; per-user state
+# belongs in st.session_state. Engines and frames are keyed by the dataset files'
+# mtimes, so an edited CSV is picked up on the next rerun, and the clear_* hooks
+# drop resources explicitly.
+
+# Clients built by get_http_client, closed by clear_clients
+_open_clients: List[OpenRouterClient] = []
+_clients_lock = threading.Lock()
+
+
+def _skills_version() -> int:
+    return data_loader.file_mtime(data_loader.INDUSTRY_SKILLS_CSV)
+
+
+def _catalog_version() -> int:
+    return data_loader.file_mtime(data_loader.COURSE_CATALOG_CSV)
+
+
+def _cube_version() -> int:
+    return data_loader.file_mtime(COHORT_CUBE["path"])
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _industry_skills(version: int) -> pd.DataFrame:
+    return data_loader.load_industry_skills()
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _course_catalog(version: int) -> pd.DataFrame:
+    return data_loader.load_course_catalog()
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _calculator(version: int) -> ReadinessCalculator:
+    return ReadinessCalculator()
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _mapper(version: int) -> CareerMapper:
+    return CareerMapper()
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _ranker(version: int) -> IndustryRanker:
+    return IndustryRanker(_calculator(version), _mapper(version))
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _course_search(version: int) -> CourseSearchEngine:
+    return CourseSearchEngine(_course_catalog(version))
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _cohort_cube(version: int) -> Optional[CohortCube]:
+    return read_cohort_cube(COHORT_CUBE["path"]) if version else None
+
+
+def get_industry_skills() -> pd.DataFrame:
+    """Shared industry skills frame (read-only)"""
+    return _industry_skills(_skills_version())
+
+
+def get_course_catalog() -> pd.DataFrame:
+    """Shared course catalog frame (read-only)"""
+    return _course_catalog(_catalog_version())
+
+
+def get_readiness_calculator() -> ReadinessCalculator:
+    """Shared readiness engine"""
+    return _calculator(_skills_version())
+
+
+def get_career_mapper() -> CareerMapper:
+    """Shared transition engine"""
+    return _mapper(_skills_version())
+
+
+def get_industry_ranker() -> IndustryRanker:
+    """Shared ranker over the shared calculator and mapper"""
+    return _ranker(_skills_version())
+
+
+def get_course_search() -> CourseSearchEngine:
+    """Shared course search index"""
+    return _course_search(_catalog_version())
+
+
+def get_cohort_cube() -> Optional[CohortCube]:
+    """Shared cohort cube from COHORT_CUBE["path"], or None until `cli.py cohorts` has built it"""
+    return _cohort_cube(_cube_version())
+
+
+@st.cache_resource(show_spinner=False)
+def get_response_cache() -> ResponseCache:
+    """Advisor response cache shared by every session in this process"""
+    return create_response_cache()
+
+
+@st.cache_resource(show_spinner=False)
+def get_assessment_store():
+    """Persistent assessment store shared by every session (its connection pool is thread-safe)"""
+    return create_assessment_store()
+
+
+def engine_version() -> int:
+    """Version of the data the scoring engines are built from, for keying stored results"""
+    return _skills_version()
+
+
+@st.cache_resource(show_spinner=False)
+def get_http_client(api_key: str, base_url: str = OPENROUTER_URL) -> OpenRouterClient:
+    """Pooled OpenRouter client per (key, endpoint), shared by every session"""
+    client = create_client(api_key, base_url)
+    with _clients_lock:
+        _open_clients.append(client)
+    return client
+
+
+def clear_engines():
+    """Rebuild the scoring engines on next use"""
+    for resource in (_calculator, _mapper, _ranker):
+        resource.clear()
+
+
+def clear_datasets():
+    """Re-read the dataset files on next use, along with everything built from them"""
+    data_loader.clear_cache()
+    for resource in (_industry_skills, _course_catalog, _course_search, _cohort_cube):
+        resource.clear()
+    clear_engines()
+
+
+def clear_clients():
+    """Close the pooled HTTP clients; callers get fresh ones on next use"""
+    get_http_client.clear()
+    with _clients_lock:
+        clients = list(_open_clients)
+        _open_clients.clear()
+    for client in clients:
+        client.close()
+
+
+def clear_store():
+    """Close the assessment store's connections; the next caller reopens it"""
+    get_assessment_store().close()
+    get_assessment_store.clear()
+
+
+def clear_all():
+    """Drop every shared resource, including the advisor response cache"""
+    clear_datasets()
+    clear_clients()
+    clear_store()
+    get_response_cache.clear()
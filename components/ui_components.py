@@ -25,6 +25,12 @@ except ImportError:
         "danger_color": "#F44336"
     }
 
+try:
+    from utils.data_loader import get_key_skills
+except ImportError:
+    def get_key_skills(industry: str) -> List[str]:
+        return []
+
 def render_header():
     """Render application header"""
     st.markdown("""
@@ -67,7 +73,7 @@ def render_industry_card(industry_key: str, industry_info: Dict):
             skills_html = " ".join([f"<span style='background-color: #e0e0e0; padding: 4px 8px; "
                                   f"border-radius: 4px; margin: 2px; display: inline-block; "
                                   f"font-size: 0.8em;'>{skill}</span>" 
-                                  for skill in industry_info['key_skills'][:5]])
+                                  for skill in (industry_info.get('key_skills') or get_key_skills(industry_key))[:5]])
             st.markdown(skills_html, unsafe_allow_html=True)
         
         st.markdown("---")
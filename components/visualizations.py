@@ -5,7 +5,7 @@ Advanced Visualization Components
 import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence
 import numpy as np
 import sys
 import os
@@ -19,6 +19,15 @@ except ImportError:
     # Fallback if config not accessible
     FUTURE_INDUSTRIES = {}
 
+from utils.skill_heatmap import Profile, RequirementMatrix, get_requirement_matrix, requirement_matrix_from_lists
+from utils.skill_network import LAYOUT_SEED, SkillNetwork, get_layout, network_from_connections
+
+# Above this many nodes the network chart drops text labels and per-node sizing
+NETWORK_LABEL_LIMIT = 150
+
+# Layout coordinates are in [0, 1]; four decimals is sub-pixel and fits float32, halving the encoded payload
+NETWORK_COORDINATE_DECIMALS = 4
+
 def create_radar_chart(scores: Dict[str, float], title: str = "Skills Assessment") -> go.Figure:
     """Create a radar chart for multi-dimensional scoring"""
     
@@ -128,46 +137,54 @@ def create_transition_sankey(current_role: str, target_industry: str,
 
 def create_skill_heatmap(user_skills: List[str], industry_requirements: Dict[str, List[str]]) -> go.Figure:
     """Create a heatmap showing skill matches across industries"""
-    
-    industries = list(industry_requirements.keys())
-    all_skills = set()
-    for skills in industry_requirements.values():
-        all_skills.update(skills)
-    all_skills = sorted(list(all_skills))
-    
-    # Create matrix
-    matrix = []
-    for industry in industries:
-        row = []
-        for skill in all_skills:
-            if skill in user_skills and skill in industry_requirements[industry]:
-                row.append(2)  # User has skill and it's required
-            elif skill in industry_requirements[industry]:
-                row.append(1)  # Required but user doesn't have
-            else:
-                row.append(0)  # Not required
-        matrix.append(row)
-    
+    return create_match_heatmap([user_skills], requirement_matrix_from_lists(industry_requirements))
+
+
+def create_match_heatmap(profiles: Sequence[Profile], requirements: Optional[RequirementMatrix] = None,
+                         weighted: bool = False, title: str = "Skill Match Across Industries") -> go.Figure:
+    """
+    Heatmap of one or more overlaid profiles against the industry x skill requirements
+
+    Args:
+        profiles: Skill name lists or categorized skills dicts
+        requirements: Requirement matrix (every industry and skill in industry_skills.csv by default)
+        weighted: Scale cells by requirement importance
+        title: Chart title
+
+    Returns:
+        Plotly figure whose z is the int8 match encoding of RequirementMatrix.match
+    """
+    requirements = requirements or get_requirement_matrix()
+    matrix = requirements.match(profiles, weighted)
+    low = -int(requirements.weights.max(initial=1)) if weighted else -1
+    high = max(-low * len(profiles), 1)
+    # Gaps shade amber, unrequired cells stay grey, coverage shades green; 0 sits at `middle`
+    middle = -low / (high - low)
+
     fig = go.Figure(data=go.Heatmap(
         z=matrix,
-        x=all_skills,
-        y=industries,
-        colorscale=[[0, '#f5f5f5'], [0.5, '#FFE082'], [1, '#4CAF50']],
-        text=[[f"{'✓' if val == 2 else '✗' if val == 1 else ''}" for val in row] for row in matrix],
-        texttemplate="%{text}",
-        textfont={"size": 12},
-        showscale=False
+        x=requirements.skills,
+        y=requirements.industries,
+        zmin=low,
+        zmax=high,
+        colorscale=[[0, '#FFB300'], [middle * 0.999, '#FFE082'], [middle, '#f5f5f5'],
+                    [min(middle * 1.001 + 0.001, 1), '#C8E6C9'], [1, '#4CAF50']],
+        colorbar=dict(tickvals=[low, 0, high], ticktext=["Gap", "Not required", "Covered"], thickness=12),
+        xgap=1,
+        ygap=1,
+        hovertemplate='%{y} · %{x}<br>Match %{z}<extra></extra>',
+        showscale=len(profiles) > 1 or weighted
     ))
-    
+
     fig.update_layout(
-        title="Skill Match Across Industries",
+        title=title,
         xaxis_title="Skills",
         yaxis_title="Industries",
-        height=400
+        height=max(400, 40 * len(requirements.industries) + 160)
     )
-    
-    fig.update_xaxis(tickangle=-45)
-    
+
+    fig.update_xaxes(tickangle=-45)
+
     return fig
 
 def create_timeline_chart(milestones: List[Dict]) -> go.Figure:
@@ -294,6 +311,79 @@ def create_salary_projection(current_salary: float, industry: str) -> go.Figure:
     
     return fig
 
+def create_interactive_growth_chart() -> go.Figure:
+    """Create enhanced growth projections"""
+    years = list(range(2023, 2031))
+    
+    data = {
+        'Year': years,
+        'AI/ML': [100 * (1.25 ** (i/4)) for i in range(len(years))],
+        'Cloud Computing': [100 * (1.28 ** (i/4)) for i in range(len(years))],
+        'Data Science': [100 * (1.18 ** (i/4)) for i in range(len(years))],
+        'Cybersecurity': [100 * (1.15 ** (i/4)) for i in range(len(years))]
+    }
+    
+    df = pd.DataFrame(data)
+    fig = px.line(df, x='Year', y=['AI/ML', 'Cloud Computing', 'Data Science', 'Cybersecurity'],
+                  title='📈 STEM Career Growth Projections (2023-2030)',
+                  color_discrete_map={
+                      'AI/ML': '#00f0ff',
+                      'Cloud Computing': '#b347d9', 
+                      'Data Science': '#00d4aa',
+                      'Cybersecurity': '#ff6b6b'
+                  })
+    
+    fig.update_layout(
+        height=500,
+        font=dict(color='#ffffff', size=12),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        title_font_size=18,
+        legend=dict(bgcolor='rgba(0,0,0,0)', bordercolor='rgba(255,255,255,0.1)', borderwidth=1),
+        xaxis=dict(gridcolor='rgba(255,255,255,0.1)'),
+        yaxis=dict(gridcolor='rgba(255,255,255,0.1)')
+    )
+    return fig
+
+def create_salary_comparison_chart() -> go.Figure:
+    """Enhanced salary comparison"""
+    fields = ['AI/ML', 'Cloud Computing', 'Data Science', 'Cybersecurity']
+    min_salaries = [95000, 90000, 85000, 75000]
+    max_salaries = [190000, 185000, 170000, 155000]
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Bar(
+        name='Starting Range',
+        x=fields,
+        y=min_salaries,
+        marker_color='rgba(0, 240, 255, 0.7)',
+        text=[f'${x//1000}K' for x in min_salaries],
+        textposition='auto'
+    ))
+    
+    fig.add_trace(go.Bar(
+        name='Senior Range',
+        x=fields,
+        y=max_salaries,
+        marker_color='rgba(179, 71, 217, 0.8)',
+        text=[f'${x//1000}K' for x in max_salaries],
+        textposition='auto'
+    ))
+    
+    fig.update_layout(
+        title='💰 STEM Salary Ranges (USD)',
+        barmode='group',
+        height=450,
+        font=dict(color='#ffffff'),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        title_font_size=18,
+        xaxis=dict(gridcolor='rgba(255,255,255,0.1)'),
+        yaxis=dict(gridcolor='rgba(255,255,255,0.1)')
+    )
+    return fig
+
 def create_industry_demand_chart() -> go.Figure:
     """Create industry demand comparison chart"""
     
@@ -369,47 +459,68 @@ def create_learning_progress_chart(completed: int, total: int) -> go.Figure:
 
 def create_skill_network_graph(skills: List[str], connections: Dict[str, List[str]]) -> go.Figure:
     """Create a network graph showing skill relationships"""
-    
-    # Create edges
-    edge_trace = []
-    for skill, related in connections.items():
-        if skill in skills:
-            for related_skill in related:
-                if related_skill in skills:
-                    x0, y0 = np.random.rand(2)
-                    x1, y1 = np.random.rand(2)
-                    edge_trace.append(go.Scatter(
-                        x=[x0, x1, None],
-                        y=[y0, y1, None],
-                        mode='lines',
-                        line=dict(width=1, color='#888'),
-                        hoverinfo='none'
-                    ))
-    
-    # Create nodes
+    return create_network_figure(network_from_connections(skills, connections))
+
+
+def create_network_figure(network: SkillNetwork, title: str = "Skill Network",
+                          seed: int = LAYOUT_SEED) -> go.Figure:
+    """
+    Draw a skill network with its cached force layout
+
+    All edges go into one line trace (None-separated segments), so the figure has
+    two traces however many edges there are; nodes are sized and colored by degree.
+
+    Args:
+        network: Graph to draw
+        title: Chart title
+        seed: Layout seed (same seed, same picture)
+
+    Returns:
+        Plotly figure
+    """
+    positions = np.round(get_layout(network, seed), NETWORK_COORDINATE_DECIMALS).astype(np.float32)
+
+    # Segment i occupies rows 3i..3i+2: start, end, gap
+    segments = np.full((network.edge_count, 3, 2), np.nan, dtype=np.float32)
+    segments[:, 0] = positions[network.source]
+    segments[:, 1] = positions[network.target]
+    segments = segments.reshape(-1, 2)
+
+    edge_trace = go.Scatter(
+        x=segments[:, 0],
+        y=segments[:, 1],
+        mode='lines',
+        line=dict(width=0.5 if network.edge_count > 1000 else 1, color='#888'),
+        hoverinfo='none'
+    )
+
+    degree = network.degree
+    labelled = len(network) <= NETWORK_LABEL_LIMIT
     node_trace = go.Scatter(
-        x=[np.random.rand() for _ in skills],
-        y=[np.random.rand() for _ in skills],
-        mode='markers+text',
-        text=skills,
+        x=positions[:, 0],
+        y=positions[:, 1],
+        mode='markers+text' if labelled else 'markers',
+        text=network.names,
         textposition="top center",
+        hovertemplate='%{text}<br>%{marker.color} connections<extra></extra>',
         marker=dict(
-            size=20,
-            color='#1E88E5',
-            line=dict(width=2, color='white')
+            size=(8 + 12 * np.sqrt(degree / max(degree.max(initial=0), 1))).round(1) if labelled else 6,
+            color=degree,
+            colorscale='Blues',
+            line=dict(width=1 if labelled else 0, color='white')
         )
     )
-    
-    fig = go.Figure(data=edge_trace + [node_trace])
-    
+
+    fig = go.Figure(data=[edge_trace, node_trace])
+
     fig.update_layout(
-        title="Skill Network",
+        title=title,
         showlegend=False,
         hovermode='closest',
         margin=dict(b=0, l=0, r=0, t=40),
         xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
         yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-        height=400
+        height=400 if labelled else 600
     )
-    
+
     return fig
@@ -8,31 +8,57 @@ APP_TITLE = "Career Shift to Future STEM Industry"
 APP_ICON = "🚀"
 VERSION = "1.0.0"
 
-# STEM Fields Data
+# STEM Fields Data ("industry" links a field to its rows in dataset/course_catalog.csv)
 STEM_FIELDS = {
     'AI & Machine Learning': {
         'icon': '🤖',
         'growth': '+25%',
         'avg_salary': 145000,
-        'description': 'Build intelligent systems'
+        'salary_range': '$95K - $190K',
+        'timeline': '8-12 months',
+        'demand_score': 95,
+        'description': 'Build intelligent systems that transform industries',
+        'skills': ['Python', 'TensorFlow', 'Scikit-learn', 'Statistics'],
+        'courses': ['Python for AI', 'Machine Learning Fundamentals', 'Deep Learning with TensorFlow',
+                    'Natural Language Processing'],
+        'industry': 'AI'
     },
     'Data Science': {
         'icon': '📊', 
         'growth': '+18%',
         'avg_salary': 125000,
-        'description': 'Extract insights from data'
+        'salary_range': '$85K - $170K',
+        'timeline': '6-10 months',
+        'demand_score': 88,
+        'description': 'Extract insights from complex data',
+        'skills': ['Python', 'SQL', 'Tableau', 'R'],
+        'courses': ['Python for Data Analysis', 'Statistical Modeling', 'Data Visualization',
+                    'Big Data Analytics'],
+        'industry': None
     },
     'Cybersecurity': {
         'icon': '🔒',
         'growth': '+15%', 
         'avg_salary': 110000,
-        'description': 'Protect digital assets'
+        'salary_range': '$75K - $155K',
+        'timeline': '6-9 months',
+        'demand_score': 82,
+        'description': 'Protect digital assets and infrastructure',
+        'skills': ['Networking', 'Linux', 'Security Tools', 'Risk Assessment'],
+        'courses': ['Network Security', 'Ethical Hacking', 'Security Architecture', 'Digital Forensics'],
+        'industry': 'CYBERSECURITY'
     },
     'Cloud Computing': {
         'icon': '☁️',
         'growth': '+28%',
         'avg_salary': 135000,
-        'description': 'Scale applications globally'
+        'salary_range': '$90K - $185K',
+        'timeline': '5-8 months',
+        'demand_score': 97,
+        'description': 'Scale applications globally with cloud infrastructure',
+        'skills': ['AWS', 'Docker', 'Kubernetes', 'DevOps'],
+        'courses': ['AWS Fundamentals', 'Azure Architecture', 'DevOps with Docker', 'Kubernetes Orchestration'],
+        'industry': None
     }
 }
 
@@ -43,3 +69,127 @@ SCORING_WEIGHTS = {
     "learning_curve": 0.20,
     "market_demand": 0.20
 }
+
+# Future STEM industries (keys match the scoring and mapping engines; key skills
+# come from dataset/industry_skills.csv via utils.data_loader)
+FUTURE_INDUSTRIES = {
+    "AI": {
+        "name": "Artificial Intelligence",
+        "icon": "🤖",
+        "description": "Machine learning, deep learning and intelligent systems",
+        "roles": ["ML Engineer", "Data Scientist", "AI Researcher", "ML Ops Engineer",
+                  "Computer Vision Engineer", "NLP Engineer"]
+    },
+    "BLOCKCHAIN": {
+        "name": "Blockchain",
+        "icon": "⛓️",
+        "description": "Decentralized systems, smart contracts and DeFi",
+        "roles": ["Blockchain Developer", "Smart Contract Developer", "DeFi Analyst",
+                  "Crypto Security Specialist", "Blockchain Architect", "Web3 Developer"]
+    },
+    "CYBERSECURITY": {
+        "name": "Cybersecurity",
+        "icon": "🔒",
+        "description": "Protecting systems, networks and data",
+        "roles": ["Security Analyst", "Penetration Tester", "Security Engineer",
+                  "SOC Analyst", "Security Architect", "Incident Response Specialist"]
+    },
+    "BIOTECH": {
+        "name": "Biotechnology",
+        "icon": "🧬",
+        "description": "Bioinformatics, genomics and computational biology",
+        "roles": ["Bioinformatician", "Clinical Data Analyst", "Biotech Researcher",
+                  "Genomics Specialist", "Biostatistician", "Medical Device Engineer"]
+    },
+    "AGRITECH": {
+        "name": "Agricultural Technology",
+        "icon": "🌾",
+        "description": "Precision agriculture, IoT and sustainable farming",
+        "roles": ["Precision Agriculture Specialist", "AgTech Developer", "Farm Data Analyst",
+                  "Sustainable Agriculture Consultant", "IoT Agriculture Engineer"]
+    },
+    "AQUATECH": {
+        "name": "Aquatic Technology",
+        "icon": "🌊",
+        "description": "Aquaculture systems, marine science and water quality",
+        "roles": ["Aquaculture Systems Engineer", "Marine Biologist", "Aquatech Data Analyst",
+                  "Sustainable Fisheries Manager", "Marine Biotechnologist"]
+    },
+    "SPACETECH": {
+        "name": "Space Technology",
+        "icon": "🚀",
+        "description": "Satellites, aerospace engineering and mission systems",
+        "roles": ["Satellite Engineer", "Space Systems Analyst", "Mission Planner",
+                  "Spacecraft Software Developer", "Remote Sensing Specialist"]
+    },
+    "RENEWABLE": {
+        "name": "Renewable Energy",
+        "icon": "⚡",
+        "description": "Solar, wind, storage and grid integration",
+        "roles": ["Renewable Energy Engineer", "Energy Data Analyst", "Solar/Wind Technician",
+                  "Energy Storage Specialist", "Grid Integration Engineer", "Sustainability Analyst"]
+    }
+}
+
+# UI colours shared by the reusable components
+UI_CONFIG = {
+    "primary_color": "#1E88E5",
+    "secondary_color": "#FFC107",
+    "success_color": "#4CAF50",
+    "warning_color": "#FF9800",
+    "danger_color": "#F44336"
+}
+
+# AI advisor response cache (set RESPONSE_CACHE_PATH to enable the SQLite tier)
+RESPONSE_CACHE = {
+    "memory_entries": 256,
+    "memory_ttl_seconds": 24 * 3600,
+    "sqlite_path": os.getenv("RESPONSE_CACHE_PATH"),
+    "sqlite_entries": 10000,
+    "sqlite_ttl_seconds": 7 * 24 * 3600,
+    # Least-recently-used order on disk is kept to this granularity, sparing most hits a write
+    "sqlite_touch_seconds": 3600
+}
+
+# Pooled OpenRouter HTTP client
+LLM_CLIENT = {
+    "pool_size": 10,
+    "timeout_seconds": 15,
+    "max_retries": 3,
+    "backoff_base_seconds": 0.5,
+    "backoff_max_seconds": 8.0,
+    "breaker_failure_threshold": 5,
+    "breaker_reset_seconds": 30.0
+}
+
+# Learning schedule used for time-to-readiness (hours from dataset/industry_skills.csv)
+LEARNING_SCHEDULE = {
+    "weekly_hours": 20,
+    "max_hours_per_skill": 10
+}
+
+# Plotly figure cache (figures pre-rendered by `python cli.py figures` are read from "directory")
+FIGURE_CACHE = {
+    "directory": os.getenv("FIGURE_CACHE_DIR",
+                           os.path.join(os.path.dirname(os.path.abspath(__file__)), "build", "figures")),
+    "entries": 256
+}
+
+# Cohort analytics cube (built by `python cli.py cohorts`, read by the Cohort Analytics page)
+COHORT_CUBE = {
+    "path": os.getenv("COHORT_CUBE_PATH",
+                      os.path.join(os.path.dirname(os.path.abspath(__file__)), "build", "cohorts.parquet")),
+    "bins": 20
+}
+
+# Persistent per-user assessments and advisor history ("sqlite" or "memory" backend)
+ASSESSMENT_STORE = {
+    "backend": os.getenv("ASSESSMENT_STORE_BACKEND", "sqlite"),
+    "sqlite_path": os.getenv("ASSESSMENT_STORE_PATH",
+                             os.path.join(os.path.dirname(os.path.abspath(__file__)), "build", "assessments.db")),
+    "pool_size": 4,
+    "timeout_seconds": 5.0,
+    "history_limit": 20,
+    # Best-Fit saves every distinct set of inputs; older profiles and their results are pruned
+    "max_profiles_per_user": 10
+}
@@ -0,0 +1,201 @@
+"""
+AI Career Advisor
+OpenRouter chat integration shared by the Streamlit app and the CLI
+"""
+
+import logging
+import threading
+from typing import Dict, Iterator, Optional
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import LLM_CLIENT, RESPONSE_CACHE
+from utils.llm_client import CircuitBreaker, CircuitOpenError, LLMClientError, LLMHTTPError, OpenRouterClient
+from utils.response_cache import MemoryLRUCache, ResponseCache, SQLiteCache
+
+logger = logging.getLogger(__name__)
+
+OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
+
+ADVISOR_SYSTEM_PROMPT = """You are an expert STEM career advisor with 15+ years of experience helping professionals transition into technology careers. 
+
+Provide practical, actionable advice that is:
+- Specific and detailed
+- Based on current market trends
+- Includes realistic timelines
+- Mentions specific tools/skills/certifications
+- Encouraging but honest about challenges
+
+Keep responses under 300 words and well-structured."""
+
+# Sampling parameters sent with every advisor request
+SAMPLING_PARAMS = {
+    "max_tokens": 400,
+    "temperature": 0.7,
+    "top_p": 0.9
+}
+
+QUICK_QUESTIONS = [
+    "How do I transition from marketing to data science?",
+    "What programming language should I learn first for AI?",
+    "Which cloud certification offers the best ROI?",
+    "How to build a portfolio with no tech experience?",
+    "What's the realistic timeline to land a STEM job?"
+]
+
+BUSY_MESSAGE = ("I'm here to help with your STEM career questions! The AI service is temporarily busy, "
+                "but I can still provide guidance through our interactive features.")
+OFFLINE_MESSAGE = ("I'm ready to assist with your STEM career journey! While the AI connects, "
+                   "explore our course catalog and market analysis features.")
+
+
+def build_payload(prompt: str, model: str) -> Dict:
+    """Chat completion payload for a single advisor question"""
+    return {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": ADVISOR_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ],
+        **SAMPLING_PARAMS
+    }
+
+
+# Attribution headers OpenRouter shows on its dashboard
+APP_HEADERS = {
+    "HTTP-Referer": "https://career-shift-analyzer.streamlit.app",
+    "X-Title": "STEM Career Advisor"
+}
+
+
+def create_client(api_key: str, base_url: str = OPENROUTER_URL, settings: Optional[Dict] = None) -> OpenRouterClient:
+    """Build a pooled OpenRouter client from config settings"""
+    settings = settings or LLM_CLIENT
+    return OpenRouterClient(
+        api_key,
+        base_url=base_url,
+        headers=APP_HEADERS,
+        pool_size=settings["pool_size"],
+        timeout=settings["timeout_seconds"],
+        max_retries=settings["max_retries"],
+        backoff_base=settings["backoff_base_seconds"],
+        backoff_max=settings["backoff_max_seconds"],
+        breaker=CircuitBreaker(settings["breaker_failure_threshold"], settings["breaker_reset_seconds"])
+    )
+
+
+_clients: Dict[tuple, OpenRouterClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_shared_client(api_key: str, base_url: str = OPENROUTER_URL) -> OpenRouterClient:
+    """Process-wide client per (key, endpoint) so every caller shares one connection pool"""
+    key = (api_key, base_url)
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = _clients[key] = create_client(api_key, base_url)
+    return client
+
+
+def create_response_cache(settings: Optional[Dict] = None) -> ResponseCache:
+    """Build the advisor response cache from config settings"""
+    settings = settings or RESPONSE_CACHE
+    memory = MemoryLRUCache(settings["memory_entries"], settings["memory_ttl_seconds"])
+    disk = None
+    if settings.get("sqlite_path"):
+        disk = SQLiteCache(settings["sqlite_path"], settings["sqlite_entries"], settings["sqlite_ttl_seconds"],
+                           settings["sqlite_touch_seconds"])
+    return ResponseCache(memory, disk)
+
+
+def get_ai_response(prompt: str, api_key: str, model: str, cache: Optional[ResponseCache] = None,
+                    client: Optional[OpenRouterClient] = None) -> str:
+    """
+    Ask the advisor model a question
+
+    Args:
+        prompt: User question
+        api_key: OpenRouter API key
+        model: OpenRouter model identifier
+        cache: Optional response cache consulted before calling the API
+        client: Pooled client (the shared client for api_key if omitted)
+
+    Returns:
+        Model answer, or a friendly fallback message when the service is unavailable
+    """
+    if cache is not None:
+        cached = cache.get(prompt, model, SAMPLING_PARAMS)
+        if cached is not None:
+            return cached
+
+    client = client or get_shared_client(api_key)
+    try:
+        answer = client.chat(build_payload(prompt, model))
+    except (LLMHTTPError, CircuitOpenError) as exc:
+        logger.warning("Advisor request failed: %s", exc)
+        return BUSY_MESSAGE
+    except (LLMClientError, ValueError, KeyError, IndexError) as exc:
+        logger.warning("Advisor request failed: %s", exc)
+        return OFFLINE_MESSAGE
+
+    # Only real answers are cached; fallbacks should be retried next time
+    if cache is not None:
+        cache.set(prompt, model, answer, SAMPLING_PARAMS)
+    return answer
+
+
+def stream_ai_response(prompt: str, api_key: str, model: str, cache: Optional[ResponseCache] = None,
+                       client: Optional[OpenRouterClient] = None,
+                       status: Optional[Dict] = None) -> Iterator[str]:
+    """
+    Stream the advisor's answer token by token
+
+    Args:
+        prompt: User question
+        api_key: OpenRouter API key
+        model: OpenRouter model identifier
+        cache: Optional response cache; hits are yielded in one piece
+        client: Pooled client (the shared client for api_key if omitted)
+        status: Optional dict; status["complete"] is set True once a whole answer has
+            been yielded, and stays False for fallbacks and interrupted streams
+
+    Returns:
+        Generator of text chunks suitable for st.write_stream
+    """
+    status = status if status is not None else {}
+    status["complete"] = False
+    if cache is not None:
+        cached = cache.get(prompt, model, SAMPLING_PARAMS)
+        if cached is not None:
+            yield cached
+            status["complete"] = True
+            return
+
+    client = client or get_shared_client(api_key)
+    chunks = []
+    try:
+        for chunk in client.stream_chat(build_payload(prompt, model)):
+            chunks.append(chunk)
+            yield chunk
+    except (LLMHTTPError, CircuitOpenError) as exc:
+        logger.warning("Advisor stream failed: %s", exc)
+        if not chunks:
+            yield BUSY_MESSAGE
+        return
+    except (LLMClientError, ValueError) as exc:
+        logger.warning("Advisor stream failed: %s", exc)
+        if not chunks:
+            yield OFFLINE_MESSAGE
+        return
+
+    # Cache complete answers only, so an interrupted stream is regenerated next time
+    if chunks:
+        status["complete"] = True
+        if cache is not None:
+            cache.set(prompt, model, "".join(chunks), SAMPLING_PARAMS)
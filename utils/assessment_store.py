@@ -0,0 +1,340 @@
+"""
+Assessment Store
+Persistent per-user profiles, readiness results, transition maps and advisor chat turns
+"""
+
+import hashlib
+import json
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import ASSESSMENT_STORE
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS users ("
+    "user_id TEXT PRIMARY KEY, created_at REAL NOT NULL, last_seen REAL NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS profiles ("
+    "user_id TEXT NOT NULL, profile_key TEXT NOT NULL, created_at REAL NOT NULL, profile TEXT NOT NULL, "
+    "PRIMARY KEY (user_id, profile_key))",
+    "CREATE INDEX IF NOT EXISTS idx_profiles_user_time ON profiles(user_id, created_at)",
+    "CREATE TABLE IF NOT EXISTS readiness_results ("
+    "user_id TEXT NOT NULL, profile_key TEXT NOT NULL, industry TEXT NOT NULL, rank INTEGER NOT NULL, "
+    "overall_score REAL NOT NULL, created_at REAL NOT NULL, result TEXT NOT NULL, "
+    "PRIMARY KEY (user_id, profile_key, industry))",
+    "CREATE INDEX IF NOT EXISTS idx_readiness_user_time ON readiness_results(user_id, created_at)",
+    "CREATE TABLE IF NOT EXISTS transitions ("
+    "user_id TEXT NOT NULL, profile_key TEXT NOT NULL, industry TEXT NOT NULL, current_role TEXT NOT NULL, "
+    "created_at REAL NOT NULL, result TEXT NOT NULL, PRIMARY KEY (user_id, profile_key, industry))",
+    "CREATE INDEX IF NOT EXISTS idx_transitions_user_time ON transitions(user_id, created_at)",
+    "CREATE TABLE IF NOT EXISTS self_assessments ("
+    "id INTEGER PRIMARY KEY, user_id TEXT NOT NULL, created_at REAL NOT NULL, "
+    "overall_score REAL NOT NULL, result TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS idx_self_assessments_user_time ON self_assessments(user_id, created_at)",
+    "CREATE TABLE IF NOT EXISTS chat_turns ("
+    "id INTEGER PRIMARY KEY, user_id TEXT NOT NULL, created_at REAL NOT NULL, "
+    "question TEXT NOT NULL, answer TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS idx_chat_turns_user_time ON chat_turns(user_id, created_at)"
+)
+
+# Statements are module constants so each pooled connection compiles them once
+# and reuses the prepared form from its statement cache
+TOUCH_USER = ("INSERT INTO users VALUES (?, ?, ?) "
+              "ON CONFLICT(user_id) DO UPDATE SET last_seen = excluded.last_seen")
+UPSERT_PROFILE = ("INSERT INTO profiles VALUES (?, ?, ?, ?) "
+                  "ON CONFLICT(user_id, profile_key) DO UPDATE SET created_at = excluded.created_at")
+REPLACE_READINESS = "INSERT OR REPLACE INTO readiness_results VALUES (?, ?, ?, ?, ?, ?, ?)"
+REPLACE_TRANSITION = "INSERT OR REPLACE INTO transitions VALUES (?, ?, ?, ?, ?, ?)"
+INSERT_SELF_ASSESSMENT = ("INSERT INTO self_assessments (user_id, created_at, overall_score, result) "
+                          "VALUES (?, ?, ?, ?)")
+INSERT_CHAT_TURN = "INSERT INTO chat_turns (user_id, created_at, question, answer) VALUES (?, ?, ?, ?)"
+SELECT_LATEST_PROFILE = ("SELECT profile_key, profile, created_at FROM profiles "
+                         "WHERE user_id = ? ORDER BY created_at DESC LIMIT 1")
+SELECT_PROFILE = "SELECT profile_key, profile, created_at FROM profiles WHERE user_id = ? AND profile_key = ?"
+SELECT_READINESS = ("SELECT result FROM readiness_results WHERE user_id = ? AND profile_key = ? "
+                    "ORDER BY rank")
+SELECT_TRANSITIONS = "SELECT industry, result FROM transitions WHERE user_id = ? AND profile_key = ?"
+SELECT_LATEST_SELF_ASSESSMENT = ("SELECT result, created_at FROM self_assessments "
+                                 "WHERE user_id = ? ORDER BY created_at DESC LIMIT 1")
+SELECT_STALE_PROFILES = ("SELECT profile_key FROM profiles WHERE user_id = ? "
+                         "ORDER BY created_at DESC LIMIT -1 OFFSET ?")
+DELETE_PROFILE = "DELETE FROM profiles WHERE user_id = ? AND profile_key = ?"
+DELETE_READINESS = "DELETE FROM readiness_results WHERE user_id = ? AND profile_key = ?"
+DELETE_TRANSITIONS = "DELETE FROM transitions WHERE user_id = ? AND profile_key = ?"
+SELECT_CHAT_TURNS = ("SELECT question, answer, created_at FROM chat_turns "
+                     "WHERE user_id = ? ORDER BY created_at DESC, id DESC LIMIT ?")
+
+
+def profile_key(profile: Dict, version: object = "") -> str:
+    """Stable key of a profile's inputs (plus an engine/dataset version) for result lookups"""
+    material = json.dumps({"profile": profile, "version": str(version)}, sort_keys=True, default=str)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _dumps(value) -> str:
+    # Numpy scalars in results are float subclasses; anything else unexpected is stringified
+    return json.dumps(value, default=str)
+
+
+class SQLitePool:
+    def __init__(self, path: str, size: int = 4, timeout_seconds: float = 5.0):
+        """
+        Bounded pool of WAL-mode connections to one database
+
+        A connection is lent to one thread at a time, so sessions on different
+        Streamlit script threads never share a cursor; WAL lets their reads run
+        alongside a single writer.
+
+        Args:
+            path: Database file
+            size: Maximum open connections
+            timeout_seconds: Wait for a free connection and for SQLite write locks
+        """
+        self.path = path
+        self.size = size
+        self.timeout_seconds = timeout_seconds
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._created = 0
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False, timeout=self.timeout_seconds,
+                               cached_statements=64)
+        conn.execute("PRAGMA journal_mode=WAL")
+        # WAL with synchronous=NORMAL stays consistent after a crash and skips an fsync per commit
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection; the block runs as one transaction (commit on success, rollback on error)"""
+        if self._closed:
+            raise sqlite3.ProgrammingError(f"connection pool for {self.path} is closed")
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                create = self._created < self.size
+                if create:
+                    self._created += 1
+            if create:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            else:
+                try:
+                    conn = self._idle.get(timeout=self.timeout_seconds)
+                except queue.Empty:
+                    raise TimeoutError(f"no free connection to {self.path} after {self.timeout_seconds}s")
+        try:
+            with conn:
+                yield conn
+        finally:
+            # Checked under the lock so a connection is never parked after close() has drained the pool
+            with self._lock:
+                closed = self._closed
+                if closed:
+                    self._created -= 1
+                else:
+                    self._idle.put(conn)
+            if closed:
+                conn.close()
+
+    def close(self):
+        """Close the pool's idle connections; borrowed ones close when returned, and new borrows raise"""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._created -= 1
+
+
+class SQLiteAssessmentStore:
+    def __init__(self, path: str, pool_size: int = 4, timeout_seconds: float = 5.0,
+                 max_profiles: int = ASSESSMENT_STORE["max_profiles_per_user"]):
+        """
+        Assessment store in a WAL-mode SQLite database
+
+        Args:
+            path: Database file (created with its schema if missing)
+            pool_size: Connections shared by every session in the process
+            timeout_seconds: Pool and lock wait limit
+            max_profiles: Most recent profiles (with their results) kept per user
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.max_profiles = max_profiles
+        self.pool = SQLitePool(path, pool_size, timeout_seconds)
+        with self.pool.connection() as conn:
+            for statement in SCHEMA:
+                conn.execute(statement)
+
+    def save_assessment(self, user_id: str, profile: Dict, key: str, ranking: List[Dict],
+                        transitions: Optional[Dict[str, Dict]] = None):
+        """
+        Store a profile with its industry ranking and transition maps in one transaction
+
+        Args:
+            user_id: Owner
+            profile: Profile inputs
+            key: profile_key() of the profile
+            ranking: IndustryRanker.rank_industries entries
+            transitions: Industry -> TransitionResult.to_dict() for the maps worth keeping
+        """
+        now = time.time()
+        role = profile.get("current_role", "")
+        with self.pool.connection() as conn:
+            conn.execute(TOUCH_USER, (user_id, now, now))
+            conn.execute(UPSERT_PROFILE, (user_id, key, now, _dumps(profile)))
+            conn.executemany(REPLACE_READINESS, [
+                (user_id, key, entry["industry"], entry["rank"], float(entry["overall_score"]), now, _dumps(entry))
+                for entry in ranking
+            ])
+            conn.executemany(REPLACE_TRANSITION, [
+                (user_id, key, industry, role, now, _dumps(transition))
+                for industry, transition in (transitions or {}).items()
+            ])
+            # Every distinct set of inputs is saved, so only the latest few are kept
+            stale = conn.execute(SELECT_STALE_PROFILES, (user_id, self.max_profiles)).fetchall()
+            if stale:
+                rows = [(user_id, stale_key) for (stale_key,) in stale]
+                for statement in (DELETE_PROFILE, DELETE_READINESS, DELETE_TRANSITIONS):
+                    conn.executemany(statement, rows)
+
+    def load_assessment(self, user_id: str, key: Optional[str] = None) -> Optional[Dict]:
+        """
+        A stored assessment: the one for a profile key, or the user's latest
+
+        Returns:
+            {"profile", "profile_key", "ranking", "transitions", "created_at"}, or None
+        """
+        with self.pool.connection() as conn:
+            if key is None:
+                row = conn.execute(SELECT_LATEST_PROFILE, (user_id,)).fetchone()
+            else:
+                row = conn.execute(SELECT_PROFILE, (user_id, key)).fetchone()
+            if row is None:
+                return None
+            key, profile, created_at = row
+            ranking = [json.loads(result) for (result,) in conn.execute(SELECT_READINESS, (user_id, key))]
+            transitions = {industry: json.loads(result)
+                           for industry, result in conn.execute(SELECT_TRANSITIONS, (user_id, key))}
+        return {"profile": json.loads(profile), "profile_key": key, "ranking": ranking,
+                "transitions": transitions, "created_at": created_at}
+
+    def save_self_assessment(self, user_id: str, result: Dict):
+        """Store a self-rated skills assessment (must carry "overall_score")"""
+        now = time.time()
+        with self.pool.connection() as conn:
+            conn.execute(TOUCH_USER, (user_id, now, now))
+            conn.execute(INSERT_SELF_ASSESSMENT, (user_id, now, float(result["overall_score"]), _dumps(result)))
+
+    def latest_self_assessment(self, user_id: str) -> Optional[Dict]:
+        """Most recent self-assessment with its "created_at", or None"""
+        with self.pool.connection() as conn:
+            row = conn.execute(SELECT_LATEST_SELF_ASSESSMENT, (user_id,)).fetchone()
+        if row is None:
+            return None
+        return {**json.loads(row[0]), "created_at": row[1]}
+
+    def add_chat_turns(self, user_id: str, turns: List[Dict]):
+        """Append advisor turns ({"question", "answer", optional "created_at"}) in one batch"""
+        now = time.time()
+        with self.pool.connection() as conn:
+            conn.execute(TOUCH_USER, (user_id, now, now))
+            conn.executemany(INSERT_CHAT_TURN, [
+                (user_id, turn.get("created_at", now), turn["question"], turn["answer"]) for turn in turns
+            ])
+
+    def chat_history(self, user_id: str, limit: int = 20) -> List[Dict]:
+        """The user's latest chat turns, oldest first"""
+        with self.pool.connection() as conn:
+            rows = conn.execute(SELECT_CHAT_TURNS, (user_id, limit)).fetchall()
+        return [{"question": question, "answer": answer, "created_at": created_at}
+                for question, answer, created_at in reversed(rows)]
+
+    def close(self):
+        self.pool.close()
+
+
+class MemoryAssessmentStore:
+    def __init__(self, max_profiles: int = ASSESSMENT_STORE["max_profiles_per_user"]):
+        """Process-local store with the same interface (nothing survives a restart)"""
+        self.max_profiles = max_profiles
+        self._assessments: Dict[str, Dict[str, Dict]] = {}
+        self._self_assessments: Dict[str, List[Dict]] = {}
+        self._chats: Dict[str, List[Dict]] = {}
+        self._lock = threading.Lock()
+
+    def save_assessment(self, user_id: str, profile: Dict, key: str, ranking: List[Dict],
+                        transitions: Optional[Dict[str, Dict]] = None):
+        record = json.loads(_dumps({"profile": profile, "profile_key": key, "ranking": ranking,
+                                    "transitions": transitions or {}, "created_at": time.time()}))
+        with self._lock:
+            stored = self._assessments.setdefault(user_id, {})
+            # Re-inserting moves the key to the end, so the last entry is the latest
+            stored.pop(key, None)
+            stored[key] = record
+            while len(stored) > self.max_profiles:
+                del stored[next(iter(stored))]
+
+    def load_assessment(self, user_id: str, key: Optional[str] = None) -> Optional[Dict]:
+        with self._lock:
+            stored = self._assessments.get(user_id, {})
+            if key is None:
+                return next(reversed(stored.values()), None)
+            return stored.get(key)
+
+    def save_self_assessment(self, user_id: str, result: Dict):
+        with self._lock:
+            self._self_assessments.setdefault(user_id, []).append({**result, "created_at": time.time()})
+
+    def latest_self_assessment(self, user_id: str) -> Optional[Dict]:
+        with self._lock:
+            history = self._self_assessments.get(user_id)
+            return history[-1] if history else None
+
+    def add_chat_turns(self, user_id: str, turns: List[Dict]):
+        now = time.time()
+        with self._lock:
+            self._chats.setdefault(user_id, []).extend(
+                {"question": turn["question"], "answer": turn["answer"], "created_at": turn.get("created_at", now)}
+                for turn in turns
+            )
+
+    def chat_history(self, user_id: str, limit: int = 20) -> List[Dict]:
+        with self._lock:
+            return list(self._chats.get(user_id, [])[-limit:])
+
+    def close(self):
+        pass
+
+
+def create_assessment_store(settings: Optional[Dict] = None):
+    """Build the configured store backend ("sqlite" or "memory")"""
+    settings = settings or ASSESSMENT_STORE
+    backend = settings.get("backend", "sqlite")
+    if backend == "memory":
+        return MemoryAssessmentStore(settings["max_profiles_per_user"])
+    if backend == "sqlite":
+        return SQLiteAssessmentStore(settings["sqlite_path"], settings["pool_size"], settings["timeout_seconds"],
+                                     settings["max_profiles_per_user"])
+    raise ValueError(f"unknown assessment store backend {backend!r}")
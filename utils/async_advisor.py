@@ -0,0 +1,77 @@
+"""
+Async Advisor Fan-out
+Runs many advisor prompts concurrently with a bounded semaphore, returning answers in order
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import LLM_CLIENT, STEM_FIELDS
+from utils.advisor import QUICK_QUESTIONS, get_ai_response, get_shared_client
+from utils.llm_client import OpenRouterClient
+from utils.response_cache import ResponseCache, normalize_prompt
+
+FIELD_PROMPT_TEMPLATE = ("I want to move into {field}. Which skills, certifications and first projects "
+                         "should I focus on, and what is a realistic timeline?")
+
+
+def field_prompt(field: str) -> str:
+    """Advisor question asked from the Course Catalog page for a STEM field"""
+    return FIELD_PROMPT_TEMPLATE.format(field=field)
+
+
+def canned_prompts() -> List[str]:
+    """Every fixed prompt the app can send: quick questions plus one per STEM field"""
+    return list(QUICK_QUESTIONS) + [field_prompt(field) for field in STEM_FIELDS]
+
+
+async def ask_many_async(prompts: Sequence[str], api_key: str, model: str,
+                         cache: Optional[ResponseCache] = None, client: Optional[OpenRouterClient] = None,
+                         concurrency: int = 8) -> List[str]:
+    """
+    Ask several prompts concurrently
+
+    Args:
+        prompts: Questions to ask; duplicates (after normalization) are sent once
+        api_key: OpenRouter API key
+        model: OpenRouter model identifier
+        cache: Optional response cache shared by every call
+        client: Pooled client (the shared client for api_key if omitted)
+        concurrency: Maximum requests in flight
+
+    Returns:
+        Answers in the same order as prompts
+    """
+    client = client or get_shared_client(api_key)
+    semaphore = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+
+    # Calls go through the pooled blocking client on a pool sized to the semaphore,
+    # so each in-flight request holds one keep-alive connection
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="advisor") as executor:
+        async def ask(prompt: str) -> str:
+            async with semaphore:
+                return await loop.run_in_executor(executor, get_ai_response, prompt, api_key, model,
+                                                  cache, client)
+
+        unique: Dict[str, asyncio.Task] = {}
+        for prompt in prompts:
+            key = normalize_prompt(prompt)
+            if key not in unique:
+                unique[key] = asyncio.ensure_future(ask(prompt))
+        await asyncio.gather(*unique.values())
+
+    return [unique[normalize_prompt(prompt)].result() for prompt in prompts]
+
+
+def ask_many(prompts: Sequence[str], api_key: str, model: str, cache: Optional[ResponseCache] = None,
+             client: Optional[OpenRouterClient] = None, concurrency: int = None) -> List[str]:
+    """Blocking wrapper around ask_many_async for scripts and Streamlit callbacks"""
+    concurrency = concurrency or LLM_CLIENT["pool_size"]
+    return asyncio.run(ask_many_async(prompts, api_key, model, cache, client, concurrency))
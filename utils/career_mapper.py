@@ -4,7 +4,9 @@ Maps current career to potential future STEM careers
 """
 
 import pandas as pd
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
 import numpy as np
 import sys
 import os
@@ -13,12 +15,92 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import FUTURE_INDUSTRIES
+from utils.data_loader import get_key_skills
+from utils.learning_planner import get_learning_planner
+from utils.results import PathStep, TransitionResult, shared_tuple
+from utils.role_resolver import get_role_resolver
+from utils.skill_graph import get_skill_graph
+from utils.skill_vocabulary import get_vocabulary
+
+# Soft skills each known role brings to any industry
+ROLE_TRANSFERABLE_SKILLS = {
+    "accountant": ["analytical thinking", "attention to detail", "data analysis",
+                   "financial modeling", "compliance", "risk assessment"],
+    "software_developer": ["programming", "problem solving", "system design",
+                           "debugging", "version control", "agile methodology"],
+    "data_analyst": ["data visualization", "statistical analysis", "SQL",
+                     "reporting", "critical thinking", "pattern recognition"],
+    "engineer": ["technical problem solving", "project management", "mathematics",
+                 "system optimization", "technical documentation", "CAD skills"],
+    "teacher": ["communication", "presentation skills", "curriculum development",
+                "mentoring", "patience", "adaptability"],
+    "healthcare_professional": ["attention to detail", "ethics", "research skills",
+                                "patient care", "documentation", "teamwork"],
+    "marketing_professional": ["communication", "market analysis", "creativity",
+                               "digital marketing", "brand management", "analytics"],
+    "researcher": ["research methodology", "data analysis", "scientific writing",
+                   "hypothesis testing", "literature review", "experimentation"]
+}
+
+# Industry-agnostic transferable skills
+UNIVERSAL_SKILLS = ["problem solving", "communication", "teamwork", "adaptability"]
+
+# Typical technical skills of each known role
+ROLE_TECHNICAL_SKILLS = {
+    "accountant": ["Excel", "QuickBooks", "SQL", "Financial Analysis"],
+    "software_developer": ["Python", "JavaScript", "Git", "APIs", "Databases"],
+    "data_analyst": ["SQL", "Python", "Tableau", "Excel", "Statistics"],
+    "engineer": ["CAD", "MATLAB", "Project Management", "Technical Drawing"],
+    "teacher": ["Curriculum Design", "Assessment", "Educational Technology"],
+    "healthcare_professional": ["Clinical Skills", "Medical Knowledge", "EMR Systems"],
+    "marketing_professional": ["SEO", "Google Analytics", "Social Media", "CRM"],
+    "researcher": ["Research Methods", "Statistical Analysis", "Academic Writing"]
+}
+
+# Market growth rates (simplified)
+MARKET_MODIFIERS = {
+    "AI": 1.3,  # High growth
+    "BLOCKCHAIN": 1.2,
+    "CYBERSECURITY": 1.25,
+    "BIOTECH": 1.15,
+    "AGRITECH": 1.1,
+    "AQUATECH": 1.05,
+    "SPACETECH": 1.15,
+    "RENEWABLE": 1.2
+}
+
+SUCCESS_FACTORS = (
+    "Strong commitment to continuous learning",
+    "Building a portfolio of relevant projects",
+    "Networking within the target industry",
+    "Obtaining industry-recognized certifications",
+    "Finding a mentor in the target field",
+    "Starting with transitional roles or freelance projects"
+)
+
+DURATION_BUCKETS = {
+    "Easy": "6-9 months",
+    "Moderate": "9-12 months",
+    "Challenging": "12-18 months",
+    "Very Challenging": "18-24 months"
+}
+
 
 class CareerMapper:
     def __init__(self):
         """Initialize career mapper with transition data"""
         self.transition_matrix = self._build_transition_matrix()
         self.career_paths = self._define_career_paths()
+        self.vocabulary = get_vocabulary()
+        self._industry_skill_ids = {
+            industry: [(skill, self.vocabulary.intern(skill)) for skill in get_key_skills(industry)]
+            for industry in FUTURE_INDUSTRIES
+        }
+        self._role_skill_masks = {}
+        self.planner = get_learning_planner()
+        self.resolver = get_role_resolver()
+        self.transitions = self._precompute_transitions()
+        self._transition_cached = lru_cache(maxsize=4096)(self._map_transition)
         
     def _build_transition_matrix(self) -> Dict[str, Dict[str, float]]:
         """
@@ -183,20 +265,48 @@ class CareerMapper:
             ]
         }
     
-    def map_career_transition(self, current_role: str, target_industry: str) -> Dict:
+    def _precompute_transitions(self) -> Mapping[Tuple[str, str], TransitionResult]:
+        """
+        Materialize the transition result of every known role x industry pair
+        
+        Results depend only on the pair and on data loaded at construction, so
+        map_career_transition serves known pairs with one dictionary hit.
+        """
+        return MappingProxyType({
+            (role, industry): self._compute_transition(role, industry)
+            for role in self.transition_matrix
+            for industry in FUTURE_INDUSTRIES
+        })
+    
+    def map_career_transition(self, current_role: str, target_industry: str) -> TransitionResult:
         """
         Map career transition from current role to target industry
         
+        Free-text titles are resolved to a canonical role first. Known roles are
+        served from the precomputed table of immutable results.
+        
         Args:
             current_role: Current job role
             target_industry: Target STEM industry
             
         Returns:
             Transition analysis with score, path, and recommendations
+            (to_dict() gives the nested-dict form)
         """
+        return self._transition_cached(current_role, target_industry)
+    
+    def _map_transition(self, current_role: str, target_industry: str) -> TransitionResult:
         # Normalize inputs
-        current_role = current_role.lower().replace(" ", "_")
+        role_match = self.resolver.resolve(current_role)
+        current_role = self.resolver.canonical_role(current_role)
         
+        result = self.transitions.get((current_role, target_industry))
+        if result is None:
+            result = self._compute_transition(current_role, target_industry)
+        return result.with_role_match(role_match["role"], role_match["title"], role_match["confidence"])
+    
+    def _compute_transition(self, current_role: str, target_industry: str) -> TransitionResult:
+        """Build the transition analysis for a normalized role"""
         # Get transition score
         transition_score = self._calculate_transition_score(current_role, target_industry)
         
@@ -205,7 +315,9 @@ class CareerMapper:
         
         # Get recommended path
         path_key = f"{current_role}_to_{target_industry.lower()}"
-        specific_path = self.career_paths.get(path_key, self._generate_generic_path(current_role, target_industry))
+        specific_path = self.career_paths.get(path_key)
+        if specific_path is None:
+            specific_path = self._generate_generic_path(current_role, target_industry)
         
         # Get transferable skills
         transferable_skills = self._identify_transferable_skills(current_role, target_industry)
@@ -213,16 +325,16 @@ class CareerMapper:
         # Get skill gaps
         skill_gaps = self._identify_skill_gaps(current_role, target_industry)
         
-        return {
-            "transition_score": transition_score,
-            "difficulty": difficulty,
-            "estimated_duration": self._estimate_duration(difficulty),
-            "career_path": specific_path,
-            "transferable_skills": transferable_skills,
-            "skill_gaps": skill_gaps,
-            "success_factors": self._get_success_factors(current_role, target_industry),
-            "potential_roles": self._get_potential_roles(target_industry)
-        }
+        return TransitionResult(
+            transition_score=transition_score,
+            difficulty=difficulty,
+            estimated_duration=self._estimate_duration(difficulty, current_role, target_industry),
+            career_path=tuple(PathStep.from_dict(step) for step in specific_path),
+            transferable_skills=shared_tuple(transferable_skills),
+            skill_gaps=shared_tuple(skill_gaps),
+            success_factors=self._get_success_factors(current_role, target_industry),
+            potential_roles=self._get_potential_roles(target_industry)
+        )
     
     def _calculate_transition_score(self, current_role: str, target_industry: str) -> float:
         """Calculate transition feasibility score (0-1)"""
@@ -250,148 +362,119 @@ class CareerMapper:
         else:
             return "Very Challenging"
     
-    def _estimate_duration(self, difficulty: str) -> str:
-        """Estimate transition duration based on difficulty"""
-        duration_map = {
-            "Easy": "6-9 months",
-            "Moderate": "9-12 months",
-            "Challenging": "12-18 months",
-            "Very Challenging": "18-24 months"
-        }
-        return duration_map.get(difficulty, "12-18 months")
+    def _estimate_duration(self, difficulty: str, current_role: str = None, target_industry: str = None) -> str:
+        """
+        Estimate transition duration
+        
+        Schedules the learning hours of the role's skill gaps over the industry's
+        prerequisite graph; falls back to a difficulty bucket for industries
+        without dataset skills.
+        """
+        if target_industry is not None:
+            graph = get_skill_graph(target_industry)
+            if graph.names:
+                return graph.schedule_for_mask(self._role_skill_mask(current_role or "")).time_to_ready
+        
+        return DURATION_BUCKETS.get(difficulty, "12-18 months")
     
     def _generate_generic_path(self, current_role: str, target_industry: str) -> List[Dict]:
-        """Generate generic career transition path"""
+        """Generate a course-backed career transition path for the role's skill gaps"""
         industry_info = FUTURE_INDUSTRIES.get(target_industry, {})
-        key_skills = industry_info.get("key_skills", [])
+        industry_name = industry_info.get('name', target_industry)
+        current_mask = self._role_skill_mask(current_role)
+        gaps = [skill for skill, skill_id in self._industry_skill_ids.get(target_industry, [])
+                if not current_mask >> skill_id & 1]
+        plan = self.planner.plan(gaps, target_industry)
+        
+        phase_titles = {
+            "Beginner": f"Learn {industry_name} Fundamentals",
+            "Intermediate": "Develop Core Technical Skills",
+            "Advanced": "Specialize in Advanced Topics"
+        }
+        path = []
+        for level, title in phase_titles.items():
+            courses = [course for course in plan["courses"] if course["difficulty"] == level]
+            if not courses:
+                continue
+            path.append({
+                "step": len(path) + 1,
+                "title": title,
+                "duration": self._format_weeks(sum(course["duration_weeks"] for course in courses)),
+                "skills": [skill for course in courses for skill in course["covers"]],
+                "resources": [f"{course['course_name']} ({course['platform']})" for course in courses]
+            })
         
-        return [
-            {
+        if plan["uncovered"]:
+            path.append({
+                "step": len(path) + 1,
+                "title": "Self-Study Remaining Skills",
+                "duration": "Self-paced",
+                "skills": plan["uncovered"],
+                "resources": ["Industry documentation", "YouTube tutorials", "Open-source projects"]
+            })
+        
+        if not path:
+            path.append({
                 "step": 1,
-                "title": f"Learn {industry_info.get('name', target_industry)} Fundamentals",
+                "title": f"Learn {industry_name} Fundamentals",
                 "duration": "2-3 months",
-                "skills": key_skills[:3] if key_skills else ["Industry basics"],
+                "skills": ["Industry basics"],
                 "resources": ["Online courses", "Industry documentation", "YouTube tutorials"]
-            },
-            {
-                "step": 2,
-                "title": "Develop Core Technical Skills",
-                "duration": "4-6 months",
-                "skills": key_skills[3:6] if len(key_skills) > 3 else ["Technical skills"],
-                "resources": ["Specialized courses", "Bootcamps", "Certifications"]
-            },
-            {
-                "step": 3,
-                "title": "Build Portfolio & Network",
-                "duration": "3-4 months",
-                "skills": ["Project development", "Industry networking", "Portfolio building"],
-                "resources": ["GitHub projects", "LinkedIn networking", "Industry meetups"]
-            }
-        ]
+            })
+        
+        path.append({
+            "step": len(path) + 1,
+            "title": "Build Portfolio & Network",
+            "duration": "3-4 months",
+            "skills": ["Project development", "Industry networking", "Portfolio building"],
+            "resources": ["GitHub projects", "LinkedIn networking", "Industry meetups"]
+        })
+        return path
+    
+    def _format_weeks(self, weeks: int) -> str:
+        """Readable duration for a number of study weeks"""
+        if weeks <= 8:
+            return f"{weeks} weeks"
+        return f"about {round(weeks / 4.345)} months"
     
     def _identify_transferable_skills(self, current_role: str, target_industry: str) -> List[str]:
         """Identify skills that transfer from current role to target industry"""
-        # Define transferable skills by role
-        role_skills = {
-            "accountant": ["analytical thinking", "attention to detail", "data analysis", 
-                          "financial modeling", "compliance", "risk assessment"],
-            "software_developer": ["programming", "problem solving", "system design", 
-                                 "debugging", "version control", "agile methodology"],
-            "data_analyst": ["data visualization", "statistical analysis", "SQL", 
-                           "reporting", "critical thinking", "pattern recognition"],
-            "engineer": ["technical problem solving", "project management", "mathematics",
-                        "system optimization", "technical documentation", "CAD skills"],
-            "teacher": ["communication", "presentation skills", "curriculum development",
-                       "mentoring", "patience", "adaptability"],
-            "healthcare_professional": ["attention to detail", "ethics", "research skills",
-                                      "patient care", "documentation", "teamwork"],
-            "marketing_professional": ["communication", "market analysis", "creativity",
-                                     "digital marketing", "brand management", "analytics"],
-            "researcher": ["research methodology", "data analysis", "scientific writing",
-                         "hypothesis testing", "literature review", "experimentation"]
-        }
-        
-        current_skills = role_skills.get(current_role, ["problem solving", "communication"])
-        
-        # Industry-agnostic transferable skills
-        universal_skills = ["problem solving", "communication", "teamwork", "adaptability"]
-        
-        return list(set(current_skills + universal_skills))
+        current_skills = ROLE_TRANSFERABLE_SKILLS.get(current_role, ["problem solving", "communication"])
+        return list(set(current_skills + UNIVERSAL_SKILLS))
     
     def _identify_skill_gaps(self, current_role: str, target_industry: str) -> List[str]:
         """Identify skills needed for target industry"""
-        industry_info = FUTURE_INDUSTRIES.get(target_industry, {})
-        required_skills = industry_info.get("key_skills", [])
+        required_skills = self._industry_skill_ids.get(target_industry, [])
         
-        # Get current role's typical skills
-        current_skills = self._get_role_technical_skills(current_role)
+        # Get current role's typical skills as a vocabulary bitset
+        current_mask = self._role_skill_mask(current_role)
         
         # Find gaps
-        skill_gaps = [skill for skill in required_skills if skill.lower() not in 
-                     [s.lower() for s in current_skills]]
+        skill_gaps = [skill for skill, skill_id in required_skills if not current_mask >> skill_id & 1]
         
         return skill_gaps[:6]  # Return top 6 gaps
     
+    def _role_skill_mask(self, role: str) -> int:
+        """Vocabulary bitset of a role's typical technical skills (cached per role)"""
+        mask = self._role_skill_masks.get(role)
+        if mask is None:
+            mask = self.vocabulary.mask(self._get_role_technical_skills(role))
+            self._role_skill_masks[role] = mask
+        return mask
+    
     def _get_role_technical_skills(self, role: str) -> List[str]:
         """Get typical technical skills for a role"""
-        role_tech_skills = {
-            "accountant": ["Excel", "QuickBooks", "SQL", "Financial Analysis"],
-            "software_developer": ["Python", "JavaScript", "Git", "APIs", "Databases"],
-            "data_analyst": ["SQL", "Python", "Tableau", "Excel", "Statistics"],
-            "engineer": ["CAD", "MATLAB", "Project Management", "Technical Drawing"],
-            "teacher": ["Curriculum Design", "Assessment", "Educational Technology"],
-            "healthcare_professional": ["Clinical Skills", "Medical Knowledge", "EMR Systems"],
-            "marketing_professional": ["SEO", "Google Analytics", "Social Media", "CRM"],
-            "researcher": ["Research Methods", "Statistical Analysis", "Academic Writing"]
-        }
-        
-        return role_tech_skills.get(role, [])
+        return ROLE_TECHNICAL_SKILLS.get(role, [])
     
     def _get_market_modifier(self, industry: str) -> float:
         """Get market demand modifier for industry"""
-        # Market growth rates (simplified)
-        market_modifiers = {
-            "AI": 1.3,  # High growth
-            "BLOCKCHAIN": 1.2,
-            "CYBERSECURITY": 1.25,
-            "BIOTECH": 1.15,
-            "AGRITECH": 1.1,
-            "AQUATECH": 1.05,
-            "SPACETECH": 1.15,
-            "RENEWABLE": 1.2
-        }
-        return market_modifiers.get(industry, 1.0)
+        return MARKET_MODIFIERS.get(industry, 1.0)
     
-    def _get_success_factors(self, current_role: str, target_industry: str) -> List[str]:
+    def _get_success_factors(self, current_role: str, target_industry: str) -> Tuple[str, ...]:
         """Get key success factors for transition"""
-        return [
-            "Strong commitment to continuous learning",
-            "Building a portfolio of relevant projects",
-            "Networking within the target industry",
-            "Obtaining industry-recognized certifications",
-            "Finding a mentor in the target field",
-            "Starting with transitional roles or freelance projects"
-        ]
+        return SUCCESS_FACTORS
     
-    def _get_potential_roles(self, industry: str) -> List[str]:
+    def _get_potential_roles(self, industry: str) -> Tuple[str, ...]:
         """Get potential job roles in target industry"""
-        industry_roles = {
-            "AI": ["ML Engineer", "Data Scientist", "AI Researcher", "ML Ops Engineer", 
-                   "Computer Vision Engineer", "NLP Engineer"],
-            "BLOCKCHAIN": ["Blockchain Developer", "Smart Contract Developer", "DeFi Analyst",
-                          "Crypto Security Specialist", "Blockchain Architect", "Web3 Developer"],
-            "CYBERSECURITY": ["Security Analyst", "Penetration Tester", "Security Engineer",
-                             "SOC Analyst", "Security Architect", "Incident Response Specialist"],
-            "BIOTECH": ["Bioinformatician", "Clinical Data Analyst", "Biotech Researcher",
-                        "Genomics Specialist", "Biostatistician", "Medical Device Engineer"],
-            "AGRITECH": ["Precision Agriculture Specialist", "AgTech Developer", "Farm Data Analyst",
-                         "Sustainable Agriculture Consultant", "IoT Agriculture Engineer"],
-            "AQUATECH": ["Aquaculture Systems Engineer", "Marine Biologist", "Aquatech Data Analyst",
-                         "Sustainable Fisheries Manager", "Marine Biotechnologist"],
-            "SPACETECH": ["Satellite Engineer", "Space Systems Analyst", "Mission Planner",
-                         "Spacecraft Software Developer", "Remote Sensing Specialist"],
-            "RENEWABLE": ["Renewable Energy Engineer", "Energy Data Analyst", "Solar/Wind Technician",
-                         "Energy Storage Specialist", "Grid Integration Engineer", "Sustainability Analyst"]
-        }
-        
-        return industry_roles.get(industry, ["Industry Specialist", "Technical Analyst", "Project Manager"])
+        return shared_tuple(FUTURE_INDUSTRIES.get(industry, {}).get(
+            "roles", ["Industry Specialist", "Technical Analyst", "Project Manager"]))
@@ -0,0 +1,260 @@
+"""
+Cohort Cubes
+Pre-aggregated role x industry x education readiness cubes for population analytics
+"""
+
+import json
+from typing import Dict, List, Optional, Sequence, Union
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import COHORT_CUBE
+from utils.readiness_score import ReadinessCalculator
+from utils.result_export import _pyarrow
+from utils.results import COMPONENT_NAMES
+
+# Aggregated scores, all in percent like ReadinessResult
+MEASURES = ("overall_score", *COMPONENT_NAMES)
+
+# Cube axes, in array order
+DIMENSIONS = ("role", "industry", "education")
+
+# Label of the catch-all member for unresolved roles and education levels
+UNKNOWN_MEMBER = "unknown"
+
+# Parquet schema metadata key holding the cube's dimensions and binning
+METADATA_KEY = b"cohort_cube"
+CUBE_FORMAT_VERSION = 1
+
+# A slice filter: one member, several members, or None for all
+Members = Optional[Union[str, Sequence[str]]]
+
+
+class CohortCube:
+    def __init__(self, roles: List[str], industries: List[str], education_levels: List[str],
+                 counts: np.ndarray, sums: np.ndarray, sums_sq: np.ndarray, histograms: np.ndarray):
+        """
+        Additive readiness aggregates per (role, industry, education) cell
+
+        Every statistic is a sum, so any slice or roll-up is a sum over cells and
+        never touches individual profiles.
+
+        Args:
+            roles: Role axis members
+            industries: Industry axis members
+            education_levels: Education axis members
+            counts: roles x industries x education scored profiles
+            sums: measures x cells sum of scores (percent)
+            sums_sq: measures x cells sum of squared scores
+            histograms: measures x cells x bins score counts over equal-width bins of 0-100
+        """
+        self.members = {"role": list(roles), "industry": list(industries), "education": list(education_levels)}
+        self._index = {dimension: {member: i for i, member in enumerate(members)}
+                       for dimension, members in self.members.items()}
+        self.counts = counts
+        self.sums = sums
+        self.sums_sq = sums_sq
+        self.histograms = histograms
+        self.bins = histograms.shape[-1]
+        self.bin_edges = np.linspace(0, 100, self.bins + 1)
+
+    @property
+    def total(self) -> int:
+        """Scored (profile, industry) pairs in the cube"""
+        return int(self.counts.sum())
+
+    def _positions(self, dimension: str, members: Members) -> np.ndarray:
+        if members is None:
+            return np.arange(len(self.members[dimension]))
+        if isinstance(members, str):
+            members = [members]
+        try:
+            return np.array([self._index[dimension][member] for member in members], dtype=np.intp)
+        except KeyError as exc:
+            raise ValueError(f"{exc.args[0]!r} is not a {dimension} in this cube") from None
+
+    def _select(self, role: Members, industry: Members, education: Members):
+        return np.ix_(self._positions("role", role), self._positions("industry", industry),
+                      self._positions("education", education))
+
+    def slice(self, role: Members = None, industry: Members = None, education: Members = None) -> Dict:
+        """
+        Roll the selected cells up into one cohort summary
+
+        Args:
+            role: Role member(s), or None for every role
+            industry: Industry member(s), or None for every industry
+            education: Education member(s), or None for every level
+
+        Returns:
+            {"count", "mean": {measure: %}, "std": {measure: %},
+             "histogram": {measure: counts per bin}, "bin_edges"}
+        """
+        cells = self._select(role, industry, education)
+        count = int(self.counts[cells].sum())
+        sums = self.sums[(slice(None), *cells)].sum(axis=(1, 2, 3))
+        sums_sq = self.sums_sq[(slice(None), *cells)].sum(axis=(1, 2, 3))
+        histograms = self.histograms[(slice(None), *cells)].sum(axis=(1, 2, 3))
+
+        means = sums / count if count else np.full(len(MEASURES), np.nan)
+        variance = np.maximum(sums_sq / count - means ** 2, 0) if count else np.full(len(MEASURES), np.nan)
+        return {
+            "count": count,
+            "mean": dict(zip(MEASURES, means.tolist())),
+            "std": dict(zip(MEASURES, np.sqrt(variance).tolist())),
+            "histogram": dict(zip(MEASURES, histograms)),
+            "bin_edges": self.bin_edges
+        }
+
+    def breakdown(self, by: str, role: Members = None, industry: Members = None,
+                  education: Members = None) -> pd.DataFrame:
+        """
+        Drill down one axis within a slice
+
+        Args:
+            by: Dimension whose members become rows ("role", "industry" or "education")
+            role, industry, education: Slice filters, as for slice()
+
+        Returns:
+            Frame with the member, count and mean of every measure, one row per non-empty member
+        """
+        if by not in DIMENSIONS:
+            raise ValueError(f"by must be one of {DIMENSIONS}, got {by!r}")
+        filters = {"role": role, "industry": industry, "education": education}
+        cells = self._select(**filters)
+        keep = tuple(axis for axis, dimension in enumerate(DIMENSIONS) if dimension != by)
+        axis = DIMENSIONS.index(by)
+
+        counts = self.counts[cells].sum(axis=keep)
+        sums = self.sums[(slice(None), *cells)].sum(axis=tuple(a + 1 for a in keep))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = sums / counts
+        frame = pd.DataFrame({by: [self.members[by][i] for i in cells[axis].ravel()], "count": counts})
+        for measure, values in zip(MEASURES, means):
+            frame[measure] = values
+        return frame[frame["count"] > 0].reset_index(drop=True)
+
+
+def build_cohort_cube(matrix, calculator: Optional[ReadinessCalculator] = None,
+                      industries: Optional[List[str]] = None, bins: int = COHORT_CUBE["bins"],
+                      chunk_rows: int = 8192) -> CohortCube:
+    """
+    Score a packed population once and aggregate it into a cube
+
+    Cells are accumulated with np.bincount per chunk, so memory is bounded by
+    chunk_rows and the cube's (small) size whatever the population.
+
+    Args:
+        matrix: utils.skill_matrix.SkillMatrix over the population
+        calculator: Readiness engine (a fresh one by default)
+        industries: Industry axis (defaults to every readiness industry)
+        bins: Histogram bins over 0-100
+        chunk_rows: Profiles scored per chunk
+
+    Returns:
+        CohortCube
+    """
+    calculator = calculator or ReadinessCalculator()
+    industries = list(industries) if industries is not None else list(calculator.industry_requirements)
+    # Unknown roles are stored as -1 and unknown education as len(levels); both land on the last member
+    roles = [*matrix.roles, UNKNOWN_MEMBER]
+    education_levels = [*matrix.education_levels, UNKNOWN_MEMBER]
+    shape = (len(roles), len(industries), len(education_levels))
+    cells = int(np.prod(shape))
+
+    counts = np.zeros(cells, dtype=np.int64)
+    sums = np.zeros((len(MEASURES), cells))
+    sums_sq = np.zeros((len(MEASURES), cells))
+    histograms = np.zeros((len(MEASURES), cells * bins), dtype=np.int64)
+    industry_offsets = np.arange(len(industries)) * len(education_levels)
+
+    for start, scores in calculator.score_skill_matrix(matrix, industries, chunk_rows):
+        records = matrix.records[start:start + len(scores["overall"])]
+        role = records["role"].astype(np.intp)
+        role[role < 0] = len(roles) - 1
+        education = np.minimum(records["education"].astype(np.intp), len(education_levels) - 1)
+        cell = ((role * shape[1] * shape[2] + education)[:, None] + industry_offsets).ravel()
+        counts += np.bincount(cell, minlength=cells)
+
+        for m, measure in enumerate(MEASURES):
+            values = scores["overall" if measure == "overall_score" else measure].ravel()
+            sums[m] += np.bincount(cell, weights=values, minlength=cells)
+            sums_sq[m] += np.bincount(cell, weights=values * values, minlength=cells)
+            bin_index = np.minimum((values * bins).astype(np.intp), bins - 1)
+            histograms[m] += np.bincount(cell * bins + bin_index, minlength=cells * bins)
+
+    # Scores are 0-1 internally; the cube reports percent
+    return CohortCube(roles, industries, education_levels, counts.reshape(shape),
+                      (sums * 100).reshape(len(MEASURES), *shape),
+                      (sums_sq * 10000).reshape(len(MEASURES), *shape),
+                      histograms.reshape(len(MEASURES), *shape, bins))
+
+
+def write_cohort_cube(cube: CohortCube, path: str, compression: str = "zstd") -> int:
+    """
+    Store a cube as a long Parquet table, one row per non-empty cell
+
+    Columns are role, industry, education, count, then {measure}_sum,
+    {measure}_sum_sq and {measure}_hist (fixed-size list of bin counts).
+
+    Returns:
+        Rows (cells) written
+    """
+    pa = _pyarrow()
+    import pyarrow.parquet as pq
+
+    occupied = np.nonzero(cube.counts)
+    columns = {dimension: pa.array([cube.members[dimension][i] for i in positions], pa.string()).dictionary_encode()
+               for dimension, positions in zip(DIMENSIONS, occupied)}
+    columns["count"] = pa.array(cube.counts[occupied])
+    for m, measure in enumerate(MEASURES):
+        columns[f"{measure}_sum"] = pa.array(cube.sums[m][occupied])
+        columns[f"{measure}_sum_sq"] = pa.array(cube.sums_sq[m][occupied])
+        flat = pa.array(np.ascontiguousarray(cube.histograms[m][occupied]).ravel())
+        columns[f"{measure}_hist"] = pa.FixedSizeListArray.from_arrays(flat, cube.bins)
+
+    metadata = {"version": CUBE_FORMAT_VERSION, "measures": list(MEASURES), "bins": cube.bins,
+                **{dimension: members for dimension, members in cube.members.items()}}
+    table = pa.table(columns).replace_schema_metadata({METADATA_KEY: json.dumps(metadata).encode("utf-8")})
+    pq.write_table(table, path, compression=compression)
+    return table.num_rows
+
+
+def read_cohort_cube(path: str) -> CohortCube:
+    """Load a cube written by write_cohort_cube"""
+    _pyarrow()
+    import pyarrow.parquet as pq
+
+    table = pq.read_table(path)
+    raw = (table.schema.metadata or {}).get(METADATA_KEY)
+    if raw is None:
+        raise ValueError(f"{path} is not a cohort cube file")
+    metadata = json.loads(raw.decode("utf-8"))
+    if metadata["version"] != CUBE_FORMAT_VERSION:
+        raise ValueError(f"{path} has unsupported cohort cube version {metadata['version']}")
+
+    measures, bins = metadata["measures"], metadata["bins"]
+    shape = tuple(len(metadata[dimension]) for dimension in DIMENSIONS)
+    cells = tuple(
+        pd.Index(metadata[dimension]).get_indexer(table.column(dimension).to_pandas().astype(str))
+        for dimension in DIMENSIONS
+    )
+    counts = np.zeros(shape, dtype=np.int64)
+    counts[cells] = table.column("count").to_numpy()
+    sums = np.zeros((len(MEASURES), *shape))
+    sums_sq = np.zeros((len(MEASURES), *shape))
+    histograms = np.zeros((len(MEASURES), *shape, bins), dtype=np.int64)
+    for m, measure in enumerate(MEASURES):
+        if measure not in measures:
+            continue
+        sums[m][cells] = table.column(f"{measure}_sum").to_numpy()
+        sums_sq[m][cells] = table.column(f"{measure}_sum_sq").to_numpy()
+        flat = table.column(f"{measure}_hist").combine_chunks().flatten().to_numpy()
+        histograms[m][cells] = flat.reshape(-1, bins)
+    return CohortCube(*(metadata[dimension] for dimension in DIMENSIONS), counts, sums, sums_sq, histograms)
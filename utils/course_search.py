@@ -0,0 +1,310 @@
+"""
+Course Search Engine
+Inverted and secondary indexes over the course catalog for fast filtered top-k queries
+"""
+
+import re
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Union
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.data_loader import (COURSE_CATALOG_CSV, COURSE_DIFFICULTY_LEVELS, file_mtime,
+                               industry_key, load_course_catalog)
+from utils.skill_vocabulary import normalize_skill
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9+#.]+")
+
+# Candidates examined per step when scanning a posting list; grows geometrically
+SCAN_BLOCK = 256
+
+# Largest price/duration range used to drive a scan (larger ranges are filtered instead)
+RANGE_DRIVER_LIMIT = 50_000
+
+StrFilter = Optional[Union[str, Sequence[str]]]
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens of a course name or skill"""
+    return [token.strip(".") for token in TOKEN_PATTERN.findall(text.lower()) if token.strip(".")]
+
+
+def _as_list(value: StrFilter) -> List[str]:
+    if value is None:
+        return []
+    return [value] if isinstance(value, str) else list(value)
+
+
+def _group_postings(codes: np.ndarray, size: int) -> List[np.ndarray]:
+    """Sorted row-id lists per code (codes < 0 are left out)"""
+    order = np.argsort(codes, kind="stable").astype(np.int32)
+    counts = np.bincount(codes[codes >= 0], minlength=size)
+    start = int(np.count_nonzero(codes < 0))
+    return np.split(order[start:], np.cumsum(counts)[:-1])
+
+
+def _contains(posting: np.ndarray, ids: np.ndarray) -> np.ndarray:
+    """Membership of ids in a sorted posting list"""
+    if len(posting) == 0:
+        return np.zeros(len(ids), dtype=bool)
+    positions = np.minimum(np.searchsorted(posting, ids), len(posting) - 1)
+    return posting[positions] == ids
+
+
+class CourseSearchEngine:
+    def __init__(self, catalog: pd.DataFrame):
+        """
+        Index a course catalog
+
+        Rows are renumbered in descending rating-per-week order (cheaper first on
+        ties), so every posting list sorted by row ID is also sorted by rank and a
+        top-k query stops as soon as it has k matching rows.
+
+        Args:
+            catalog: Frame in the course_catalog.csv layout
+        """
+        weeks = catalog["duration_weeks"].to_numpy(dtype=np.float32)
+        rating = catalog["rating"].to_numpy(dtype=np.float32)
+        score = np.divide(rating, weeks, out=np.zeros_like(rating), where=weeks > 0)
+        price = catalog["price_usd"].to_numpy(dtype=np.float32)
+        order = np.lexsort((price, -score))
+        frame = catalog.iloc[order].reset_index(drop=True)
+        self.size = len(frame)
+
+        # Column store in rank order
+        self.score = score[order]
+        self.rating = rating[order]
+        self.price = price[order]
+        self.weeks = frame["duration_weeks"].to_numpy(dtype=np.int16)
+        self.difficulty = pd.Categorical(frame["difficulty"], categories=COURSE_DIFFICULTY_LEVELS,
+                                         ordered=True).codes.astype(np.int8)
+        industries = pd.Categorical(frame["industry"].astype(str))
+        self.industry = industries.codes.astype(np.int16)
+        self._industry_labels = list(industries.categories)
+        self.industry_names = [industry_key(label) for label in self._industry_labels]
+        platforms = pd.Categorical(frame["platform"].astype(str))
+        self.platform = platforms.codes.astype(np.int16)
+        self.platform_names = list(platforms.categories)
+        self._course_names = frame["course_name"].to_numpy(dtype=object)
+        self._skill_focus = frame["skill_focus"].to_numpy(dtype=object)
+        self._urls = frame["url"].to_numpy(dtype=object)
+        self._all_rows = np.arange(self.size, dtype=np.int32)
+
+        # Skill index: normalized skill_focus -> rows
+        skill_codes, skill_names = pd.factorize(frame["skill_focus"].astype(str).map(normalize_skill))
+        self._skill_ids = {name: i for i, name in enumerate(skill_names)}
+        self._skill_postings = _group_postings(skill_codes, len(skill_names))
+
+        # Inverted index over course_name and skill_focus tokens
+        self._token_postings = self._build_token_index(frame)
+
+        # Secondary indexes on categorical columns
+        self._industry_postings = _group_postings(self.industry, len(self.industry_names))
+        self._platform_postings = _group_postings(self.platform, len(self.platform_names))
+        self._difficulty_postings = _group_postings(self.difficulty, len(COURSE_DIFFICULTY_LEVELS))
+
+        # Range indexes: rows ordered by price and by duration
+        self._price_order = np.argsort(self.price, kind="stable").astype(np.int32)
+        self._price_sorted = self.price[self._price_order]
+        self._weeks_order = np.argsort(self.weeks, kind="stable").astype(np.int32)
+        self._weeks_sorted = self.weeks[self._weeks_order]
+
+    def _build_token_index(self, frame: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Token -> sorted rows, tokenizing each distinct name once"""
+        token_rows: Dict[str, List[np.ndarray]] = {}
+        for column in ("course_name", "skill_focus"):
+            codes, values = pd.factorize(frame[column].astype(str))
+            postings = _group_postings(codes, len(values))
+            for value, rows in zip(values, postings):
+                for token in set(tokenize(value)):
+                    token_rows.setdefault(token, []).append(rows)
+        return {token: np.unique(np.concatenate(parts)) for token, parts in token_rows.items()}
+
+    def skill_rows(self, skill: str) -> np.ndarray:
+        """Rows whose skill focus is this skill (any part of a composite "a/b")"""
+        parts = [self._skill_ids.get(part) for part in normalize_skill(skill).split("/")]
+        postings = [self._skill_postings[i] for i in parts if i is not None]
+        if not postings:
+            return np.empty(0, dtype=np.int32)
+        return postings[0] if len(postings) == 1 else np.unique(np.concatenate(postings))
+
+    def search(self, skills: Optional[Iterable[str]] = None, text: Optional[str] = None,
+               industry: StrFilter = None, platform: StrFilter = None, difficulty: StrFilter = None,
+               max_difficulty: Optional[str] = None, max_price: Optional[float] = None,
+               max_weeks: Optional[int] = None, min_rating: Optional[float] = None,
+               k: int = 10) -> List[Dict]:
+        """
+        Top-k courses by rating per week matching every given filter
+
+        Args:
+            skills: Skill gaps; a course matches if its skill focus covers any of them
+            text: Free text; every token must appear in the name or skill focus
+            industry: Engine industry key(s), e.g. "AI"
+            platform: Platform name(s)
+            difficulty: Exact difficulty level(s)
+            max_difficulty: Highest difficulty allowed (Beginner < Intermediate < Advanced)
+            max_price: Price ceiling in USD
+            max_weeks: Duration ceiling in weeks
+            min_rating: Rating floor
+            k: Number of results
+
+        Returns:
+            Course records ranked by rating per week, each with the skills it covers
+        """
+        rows = self.search_rows(skills, text, industry, platform, difficulty, max_difficulty,
+                                max_price, max_weeks, min_rating, k)
+        gaps = list(skills or [])
+        covered = [(gap, _contains(self.skill_rows(gap), rows)) for gap in gaps]
+        results = []
+        for i, row in enumerate(rows.tolist()):
+            results.append({
+                "course_name": self._course_names[row],
+                "platform": self.platform_names[self.platform[row]],
+                "industry": self._industry_labels[self.industry[row]],
+                "skill_focus": self._skill_focus[row],
+                "difficulty": COURSE_DIFFICULTY_LEVELS[self.difficulty[row]] if self.difficulty[row] >= 0 else None,
+                "duration_weeks": int(self.weeks[row]),
+                "price_usd": round(float(self.price[row]), 2),
+                "rating": round(float(self.rating[row]), 1),
+                "rating_per_week": round(float(self.score[row]), 3),
+                "url": self._urls[row],
+                "covers": [gap for gap, hits in covered if hits[i]]
+            })
+        return results
+
+    def search_rows(self, skills: Optional[Iterable[str]] = None, text: Optional[str] = None,
+                    industry: StrFilter = None, platform: StrFilter = None, difficulty: StrFilter = None,
+                    max_difficulty: Optional[str] = None, max_price: Optional[float] = None,
+                    max_weeks: Optional[int] = None, min_rating: Optional[float] = None,
+                    k: int = 10) -> np.ndarray:
+        """Same query as search, returning internal row IDs in rank order"""
+        wanted = {name.upper() for name in _as_list(industry)}
+        industries = [code for code, key in enumerate(self.industry_names) if key in wanted]
+        platforms = [self.platform_names.index(p) for p in _as_list(platform) if p in self.platform_names]
+        levels = [COURSE_DIFFICULTY_LEVELS.index(d) for d in _as_list(difficulty)
+                  if d in COURSE_DIFFICULTY_LEVELS]
+        if max_difficulty is not None:
+            ceiling = COURSE_DIFFICULTY_LEVELS.index(max_difficulty)
+            levels = [d for d in (levels or range(len(COURSE_DIFFICULTY_LEVELS))) if d <= ceiling]
+        # A filter that names only unknown values matches nothing
+        if ((industry is not None and not industries) or (platform is not None and not platforms)
+                or ((difficulty is not None or max_difficulty is not None) and not levels)):
+            return np.empty(0, dtype=np.int32)
+
+        text_postings = self._text_postings(text) if text else []
+        if text and not text_postings:
+            return np.empty(0, dtype=np.int32)
+
+        # Drive the scan from the most selective index; the filter re-checks the rest
+        if skills:
+            drivers = [self.skill_rows(skill) for skill in skills]
+        elif text_postings:
+            drivers, text_postings = text_postings[:1], text_postings[1:]
+        else:
+            drivers = self._cheapest_driver(industries, platforms, levels, max_price, max_weeks)
+
+        keep = self._row_filter(industries, platforms, levels, max_price, max_weeks, min_rating,
+                                text_postings)
+        found = [self._scan(rows, keep, k) for rows in drivers]
+        found = [rows for rows in found if len(rows)]
+        if not found:
+            return np.empty(0, dtype=np.int32)
+        return (found[0] if len(found) == 1 else np.unique(np.concatenate(found)))[:k]
+
+    def _text_postings(self, text: str) -> List[np.ndarray]:
+        """Posting list per query token, shortest first (empty if any token is unknown)"""
+        postings = [self._token_postings.get(token) for token in set(tokenize(text))]
+        if any(posting is None for posting in postings):
+            return []
+        return sorted(postings, key=len)
+
+    def _cheapest_driver(self, industries: List[int], platforms: List[int], levels: List[int],
+                         max_price: Optional[float], max_weeks: Optional[int]) -> List[np.ndarray]:
+        """Rank-ordered posting lists of the smallest secondary index hit"""
+        size, drivers = self.size, [self._all_rows]
+        for codes, postings in ((industries, self._industry_postings), (platforms, self._platform_postings),
+                                (levels, self._difficulty_postings)):
+            lists = [postings[code] for code in codes]
+            total = sum(len(rows) for rows in lists)
+            if lists and total < size:
+                size, drivers = total, lists
+        for ceiling, order, values in ((max_price, self._price_order, self._price_sorted),
+                                       (max_weeks, self._weeks_order, self._weeks_sorted)):
+            if ceiling is None:
+                continue
+            end = int(np.searchsorted(values, values.dtype.type(ceiling), side="right"))
+            # Range slices come out in value order and must be re-sorted into rank
+            # order, which only pays off when the range is narrow
+            if end <= RANGE_DRIVER_LIMIT and end < size:
+                size, drivers = end, [np.sort(order[:end])]
+        return drivers
+
+    def _row_filter(self, industries: List[int], platforms: List[int], levels: List[int],
+                    max_price: Optional[float], max_weeks: Optional[int], min_rating: Optional[float],
+                    text_postings: List[np.ndarray]) -> Callable[[np.ndarray], np.ndarray]:
+        """Vectorized predicate over a block of row IDs"""
+        checks = []
+        for column, codes in ((self.industry, industries), (self.platform, platforms),
+                              (self.difficulty, levels)):
+            if len(codes) == 1:
+                checks.append(lambda ids, column=column, code=codes[0]: column[ids] == code)
+            elif codes:
+                checks.append(lambda ids, column=column, codes=codes: np.isin(column[ids], codes))
+        if max_price is not None:
+            checks.append(lambda ids, ceiling=np.float32(max_price): self.price[ids] <= ceiling)
+        if max_weeks is not None:
+            checks.append(lambda ids: self.weeks[ids] <= max_weeks)
+        if min_rating is not None:
+            checks.append(lambda ids, floor=np.float32(min_rating): self.rating[ids] >= floor)
+        for posting in text_postings:
+            checks.append(lambda ids, posting=posting: _contains(posting, ids))
+
+        def keep(ids: np.ndarray) -> np.ndarray:
+            mask = np.ones(len(ids), dtype=bool)
+            for check in checks:
+                mask &= check(ids)
+            return mask
+        return keep
+
+    @staticmethod
+    def _scan(rows: np.ndarray, keep: Callable[[np.ndarray], np.ndarray], k: int) -> np.ndarray:
+        """First k rows of a rank-ordered posting list passing the filter"""
+        matches = []
+        found = 0
+        start = 0
+        block = max(SCAN_BLOCK, k)
+        while start < len(rows) and found < k:
+            ids = rows[start:start + block]
+            hits = ids[keep(ids)]
+            matches.append(hits)
+            found += len(hits)
+            start += block
+            block *= 4
+        if not matches:
+            return np.empty(0, dtype=np.int32)
+        return np.concatenate(matches)[:k]
+
+    @property
+    def skills(self) -> List[str]:
+        """Distinct skill focus values in the catalog"""
+        return sorted(set(self._skill_focus))
+
+    @property
+    def platforms(self) -> List[str]:
+        return list(self.platform_names)
+
+
+def get_course_search(path: str = COURSE_CATALOG_CSV) -> CourseSearchEngine:
+    """Process-wide engine over the catalog, rebuilt when the CSV changes"""
+    return _engine(path, file_mtime(path))
+
+
+@lru_cache(maxsize=2)
+def _engine(path: str, mtime_ns: int) -> CourseSearchEngine:
+    return CourseSearchEngine(load_course_catalog(path))
@@ -0,0 +1,126 @@
+"""
+Dataset Loader
+Loads the bundled CSV datasets once per process into typed pandas frames
+"""
+
+import os
+import threading
+from functools import lru_cache
+from typing import Dict, List
+
+import pandas as pd
+
+DATASET_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dataset")
+INDUSTRY_SKILLS_CSV = os.path.join(DATASET_DIR, "industry_skills.csv")
+COURSE_CATALOG_CSV = os.path.join(DATASET_DIR, "course_catalog.csv")
+
+# Ordered levels so comparisons and sorts follow their meaning, not the alphabet
+IMPORTANCE_LEVELS = ["Optional", "Important", "Essential"]
+SKILL_DIFFICULTY_LEVELS = ["Medium", "High", "Very High"]
+COURSE_DIFFICULTY_LEVELS = ["Beginner", "Intermediate", "Advanced"]
+
+INDUSTRY_SKILLS_DTYPES = {
+    "industry": "category",
+    "skill_name": "string",
+    "skill_category": "category",
+    "importance": pd.CategoricalDtype(IMPORTANCE_LEVELS, ordered=True),
+    "difficulty": pd.CategoricalDtype(SKILL_DIFFICULTY_LEVELS, ordered=True),
+    "learning_hours": "int32"
+}
+
+COURSE_CATALOG_DTYPES = {
+    "course_name": "string",
+    "platform": "category",
+    "industry": "category",
+    "skill_focus": "string",
+    "duration_weeks": "int16",
+    "difficulty": pd.CategoricalDtype(COURSE_DIFFICULTY_LEVELS, ordered=True),
+    "price_usd": "float64",
+    "rating": "float32",
+    "url": "string"
+}
+
+_reload_lock = threading.Lock()
+
+
+def industry_key(name: str) -> str:
+    """Map a dataset industry label ("BioTech") to the engine key ("BIOTECH")"""
+    return name.upper()
+
+
+def file_mtime(path: str) -> int:
+    """Modification time in nanoseconds (0 if missing), used as a cache version"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+@lru_cache(maxsize=8)
+def _read_csv(path: str, mtime_ns: int, dtypes_name: str) -> pd.DataFrame:
+    """Parse a CSV once per (path, mtime); a changed file gets a new cache entry"""
+    dtypes = INDUSTRY_SKILLS_DTYPES if dtypes_name == "industry_skills" else COURSE_CATALOG_DTYPES
+    frame = pd.read_csv(path, dtype=dtypes)
+    frame.flags.allows_duplicate_labels = False
+    return frame
+
+
+def _load(path: str, dtypes_name: str) -> pd.DataFrame:
+    mtime_ns = file_mtime(path)
+    with _reload_lock:
+        return _read_csv(path, mtime_ns, dtypes_name)
+
+
+def load_industry_skills(path: str = INDUSTRY_SKILLS_CSV) -> pd.DataFrame:
+    """
+    Industry skill requirements, typed and cached until the file changes
+
+    The returned frame is shared by every caller; treat it as read-only.
+    """
+    return _load(path, "industry_skills")
+
+
+def load_course_catalog(path: str = COURSE_CATALOG_CSV) -> pd.DataFrame:
+    """
+    Course catalog, typed and cached until the file changes
+
+    The returned frame is shared by every caller; treat it as read-only.
+    """
+    return _load(path, "course_catalog")
+
+
+def get_industry_skill_lists(path: str = INDUSTRY_SKILLS_CSV) -> Dict[str, Dict[str, List[str]]]:
+    """
+    Skill names per engine industry key
+
+    Returns:
+        {industry: {"key_skills": all skills in dataset order,
+                    "essential_skills": Essential rows,
+                    "preferred_skills": Important and Optional rows}}
+    """
+    return _industry_skill_lists(path, file_mtime(path))
+
+
+@lru_cache(maxsize=4)
+def _industry_skill_lists(path: str, mtime_ns: int) -> Dict[str, Dict[str, List[str]]]:
+    skills = load_industry_skills(path)
+    lists = {}
+    for industry, group in skills.groupby("industry", observed=True, sort=False):
+        essential = group["importance"] == "Essential"
+        lists[industry_key(industry)] = {
+            "key_skills": group["skill_name"].tolist(),
+            "essential_skills": group.loc[essential, "skill_name"].tolist(),
+            "preferred_skills": group.loc[~essential, "skill_name"].tolist()
+        }
+    return lists
+
+
+def get_key_skills(industry: str, path: str = INDUSTRY_SKILLS_CSV) -> List[str]:
+    """Key skills for an engine industry key in dataset order (empty if unknown)"""
+    return get_industry_skill_lists(path).get(industry, {}).get("key_skills", [])
+
+
+def clear_cache():
+    """Drop every cached frame so the next call re-reads from disk"""
+    _read_csv.cache_clear()
+    _industry_skill_lists.cache_clear()
@@ -0,0 +1,135 @@
+"""
+Industry Ranker
+Scores one profile against every future industry at once and ranks the best fits
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Optional
+import sys
+import os
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import FUTURE_INDUSTRIES
+from utils.career_mapper import CareerMapper
+from utils.readiness_score import COMPONENT_NAMES, ReadinessCalculator, _round_percent
+from utils.skill_graph import get_skill_graph
+
+# Share of the fit score taken by transition feasibility; the rest is readiness
+TRANSITION_WEIGHT = 0.3
+
+
+class IndustryRanker:
+    def __init__(self, calculator: Optional[ReadinessCalculator] = None, mapper: Optional[CareerMapper] = None,
+                 industries: Optional[List[str]] = None):
+        """
+        Precompute the per-role transition scores used for ranking
+
+        Args:
+            calculator: Readiness engine (a new one by default)
+            mapper: Transition engine (a new one by default)
+            industries: Industries to rank (defaults to every readiness industry)
+        """
+        self.calculator = calculator or ReadinessCalculator()
+        self.mapper = mapper or CareerMapper()
+        self.industries = list(industries or self.calculator.industry_requirements)
+        self._graphs = [get_skill_graph(industry) for industry in self.industries]
+
+        # Missing-skill codes of every scheduled industry come from one gather over
+        # the concatenated graph nodes, summed per industry segment
+        self._coded = [column for column, graph in enumerate(self._graphs) if 0 < len(graph.names) < 63]
+        nodes = [self._graphs[column] for column in self._coded]
+        self._node_ids = np.array([i for graph in nodes for i in graph.vocab_ids], dtype=np.intp)
+        self._node_bits = np.concatenate([np.int64(1) << np.arange(len(graph.names), dtype=np.int64)
+                                          for graph in nodes]) if nodes else np.zeros(0, dtype=np.int64)
+        self._segments = np.cumsum([0] + [len(graph.names) for graph in nodes[:-1]])
+
+        # Role x industry transition scores; the last row is the unknown-role default
+        self._roles = {role: row for row, role in enumerate(self.mapper.transition_matrix)}
+        self._transition = np.array([
+            [self.mapper._calculate_transition_score(role, industry) for industry in self.industries]
+            for role in [*self._roles, ""]
+        ])
+
+    def rank_industries(self, profile: Dict, scores: Optional[Dict[str, np.ndarray]] = None) -> List[Dict]:
+        """
+        Rank every industry for one profile
+
+        Readiness components for all industries come from one pass over the
+        industries x skills requirement matrices; transition scores are one
+        row of the precomputed role x industry table.
+
+        Args:
+            profile: User profile in the shape calculate_readiness_score expects
+            scores: This profile's score matrices if already known (e.g. from a
+                ScoringSession); computed with score_matrices otherwise
+
+        Returns:
+            Industries sorted by fit score (best first), each with readiness
+            level, component scores, transition score and time to readiness
+        """
+        if scores is None:
+            scores = self.calculator.score_matrices([profile], self.industries)
+        overall = scores["overall"][0]
+
+        role = self.mapper.resolver.canonical_role(profile.get("current_role", ""))
+        transition = self._transition[self._roles.get(role, -1)]
+        fit = overall * (1 - TRANSITION_WEIGHT) + transition * TRANSITION_WEIGHT
+
+        # Percentages for fit, overall and every component, rounded in one call
+        rows = np.vstack([fit, overall] + [scores[name][0] for name in COMPONENT_NAMES])
+        percents = _round_percent(rows).reshape(rows.shape).tolist()
+        fit_pct, overall_pct, components = percents[0], percents[1], percents[2:]
+        schedules = self._schedules(profile, scores)
+
+        ranking = []
+        for rank, column in enumerate(np.argsort(-fit, kind="stable").tolist(), 1):
+            industry = self.industries[column]
+            info = FUTURE_INDUSTRIES.get(industry, {})
+            schedule = schedules.get(column)
+            if schedule is not None:
+                time_to_ready, months_to_ready = schedule.time_to_ready, schedule.months_to_ready
+            else:
+                time_to_ready = self.calculator._estimate_time_to_readiness(
+                    overall[column], scores["learning_curve"][0, column])
+                months_to_ready = None
+            ranking.append({
+                "rank": rank,
+                "industry": industry,
+                "name": info.get("name", industry),
+                "icon": info.get("icon", ""),
+                "fit_score": fit_pct[column],
+                "overall_score": overall_pct[column],
+                "readiness_level": self.calculator._get_readiness_level(overall[column]),
+                "component_scores": {name: values[column] for name, values in zip(COMPONENT_NAMES, components)},
+                "transition_score": float(transition[column]),
+                "difficulty": self.mapper._get_transition_difficulty(transition[column]),
+                "time_to_ready": time_to_ready,
+                "months_to_ready": months_to_ready
+            })
+        return ranking
+
+    def _schedules(self, profile: Dict, scores: Dict[str, np.ndarray]) -> Dict:
+        """Learning schedule per column for industries with a prerequisite graph"""
+        schedules = {}
+        if self._coded:
+            missing = scores["skills"][0, self._node_ids] == 0
+            codes = np.add.reduceat(np.where(missing, self._node_bits, 0), self._segments).tolist()
+            for column, code in zip(self._coded, codes):
+                schedules[column] = self._graphs[column].schedule(code)
+
+        # Graphs too wide for int64 codes go through the bitset path
+        for column, graph in enumerate(self._graphs):
+            if len(graph.names) >= 63:
+                skill_mask = self.calculator.vocabulary.profile_mask(profile.get("skills", {}))
+                schedules[column] = graph.schedule_for_mask(skill_mask)
+        return schedules
+
+
+@lru_cache(maxsize=1)
+def get_industry_ranker() -> IndustryRanker:
+    """Process-wide ranker over the default engines"""
+    return IndustryRanker()
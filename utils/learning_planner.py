@@ -0,0 +1,300 @@
+"""
+Learning Path Planner
+Picks the cheapest or shortest set of catalog courses covering a user's skill gaps
+"""
+
+import heapq
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.data_loader import (COURSE_CATALOG_CSV, COURSE_DIFFICULTY_LEVELS, INDUSTRY_SKILLS_CSV, file_mtime,
+                               industry_key, load_course_catalog, load_industry_skills)
+from utils.skill_vocabulary import normalize_skill
+
+# Relative value of closing a gap, multiplied by the skill's learning hours
+IMPORTANCE_WEIGHTS = {"Essential": 3.0, "Important": 2.0, "Optional": 1.0}
+
+# Weight of skills missing from industry_skills.csv (an Important skill of median effort)
+DEFAULT_SKILL_WEIGHT = 2.0 * 250
+
+# Secondary cost term so free courses still cost something and ties favour the other objective
+TIE_BREAK = 0.01
+
+# Branch-and-bound nodes explored before the exact mode settles for its best cover so far
+EXACT_NODE_LIMIT = 200_000
+
+# Longest skill name, in words, recognised inside a course title
+MAX_SKILL_WORDS = 4
+
+_WORD = re.compile(r"[^\s,:;()\-]+")
+
+
+class LearningPlanner:
+    def __init__(self, courses: pd.DataFrame, skills: pd.DataFrame):
+        """
+        Index which catalog courses teach which skills
+
+        A course teaches its skill_focus plus every known skill named in its
+        title ("Biostatistics in R" teaches Biostatistics and R).
+
+        Args:
+            courses: Frame in the course_catalog.csv layout
+            skills: Frame in the industry_skills.csv layout
+        """
+        self._skill_index: Dict[str, int] = {}
+        self.skill_names: List[str] = []
+        for name in list(skills["skill_name"].astype(str)) + list(courses["skill_focus"].astype(str)):
+            self._intern(name)
+
+        # Gap weight per (industry, skill); the best weight across industries otherwise
+        self._weights: Dict[Tuple[str, int], float] = {}
+        self._best_weight = np.full(len(self.skill_names), DEFAULT_SKILL_WEIGHT)
+        best_seen = np.zeros(len(self.skill_names), dtype=bool)
+        for row in skills.itertuples(index=False):
+            skill = self._skill_index[normalize_skill(str(row.skill_name))]
+            weight = IMPORTANCE_WEIGHTS.get(str(row.importance), 1.0) * float(row.learning_hours)
+            self._weights[(industry_key(str(row.industry)), skill)] = weight
+            if not best_seen[skill] or weight > self._best_weight[skill]:
+                self._best_weight[skill] = weight
+                best_seen[skill] = True
+
+        self.course_names = courses["course_name"].to_numpy(dtype=object)
+        self.platforms = courses["platform"].astype(str).to_numpy(dtype=object)
+        self.urls = courses["url"].to_numpy(dtype=object)
+        self.price = courses["price_usd"].to_numpy(dtype=np.float64)
+        self.weeks = courses["duration_weeks"].to_numpy(dtype=np.int64)
+        self.difficulty = pd.Categorical(courses["difficulty"], categories=COURSE_DIFFICULTY_LEVELS,
+                                         ordered=True).codes.astype(np.int8)
+
+        self.covers: List[np.ndarray] = []
+        self.courses_for_skill: List[List[int]] = [[] for _ in self.skill_names]
+        for course, (title, focus) in enumerate(zip(self.course_names, courses["skill_focus"].astype(str))):
+            taught = {self._skill_index[normalize_skill(focus)]} | self._skills_in_title(str(title))
+            self.covers.append(np.array(sorted(taught), dtype=np.int32))
+            for skill in taught:
+                self.courses_for_skill[skill].append(course)
+
+    def _intern(self, name: str) -> int:
+        key = normalize_skill(name)
+        if key not in self._skill_index:
+            self._skill_index[key] = len(self.skill_names)
+            self.skill_names.append(name)
+        return self._skill_index[key]
+
+    def _skills_in_title(self, title: str) -> set:
+        """Known skills named by any run of up to MAX_SKILL_WORDS words in a title"""
+        words = _WORD.findall(title)
+        found = set()
+        for start in range(len(words)):
+            for end in range(start + 1, min(start + MAX_SKILL_WORDS, len(words)) + 1):
+                skill = self._skill_index.get(normalize_skill(" ".join(words[start:end])))
+                if skill is not None:
+                    found.add(skill)
+        return found
+
+    def skill_weight(self, skill: str, industry: Optional[str] = None) -> float:
+        """Importance x learning hours of a skill, for an industry when given"""
+        index = self._skill_index.get(normalize_skill(skill))
+        if index is None:
+            return DEFAULT_SKILL_WEIGHT
+        return self._weights.get((industry, index), self._best_weight[index])
+
+    def course_costs(self, objective: str = "cost") -> np.ndarray:
+        """Cost of every course: USD for "cost", weeks for "time", each tie-broken by the other"""
+        if objective == "cost":
+            return self.price + TIE_BREAK * self.weeks
+        if objective == "time":
+            return self.weeks + TIE_BREAK * self.price / 100
+        raise ValueError(f"Unknown objective: {objective}")
+
+    def plan(self, gaps: Iterable[str], industry: Optional[str] = None, objective: str = "cost",
+             exact: bool = False, max_difficulty: Optional[str] = None) -> Dict:
+        """
+        Choose courses covering the given skill gaps
+
+        Greedy weighted set cover picks, at each step, the course with the most
+        uncovered gap weight per unit cost. The exact mode runs branch-and-bound
+        from the greedy cover and proves the minimum-cost cover unless it hits
+        EXACT_NODE_LIMIT.
+
+        Args:
+            gaps: Skills the user still needs
+            industry: Target industry key used to weight gaps (e.g. "AI")
+            objective: "cost" (cheapest) or "time" (shortest)
+            exact: Search for the optimal cover instead of the greedy one
+            max_difficulty: Highest course level allowed
+
+        Returns:
+            Plan with courses ordered Beginner -> Intermediate -> Advanced,
+            covered/uncovered gaps, totals and whether the cover is optimal
+        """
+        gap_names: Dict[int, str] = {}
+        unknown = []
+        for gap in gaps:
+            index = self._skill_index.get(normalize_skill(gap))
+            if index is None:
+                unknown.append(gap)
+            else:
+                gap_names.setdefault(index, gap)
+
+        ceiling = COURSE_DIFFICULTY_LEVELS.index(max_difficulty) if max_difficulty else len(COURSE_DIFFICULTY_LEVELS)
+        candidates = sorted({course for skill in gap_names for course in self.courses_for_skill[skill]
+                             if self.difficulty[course] <= ceiling})
+        costs = self.course_costs(objective)
+        weights = np.zeros(len(self.skill_names))
+        for skill in gap_names:
+            weights[skill] = self._weights.get((industry, skill), self._best_weight[skill])
+
+        chosen = self._greedy(candidates, costs, weights)
+        optimal = False
+        if exact:
+            chosen, optimal = self._branch_and_bound(candidates, costs, weights > 0, chosen)
+
+        return self._describe(chosen, gap_names, unknown, weights, objective, optimal)
+
+    def _greedy(self, candidates: List[int], costs: np.ndarray, weights: np.ndarray) -> List[int]:
+        """Lazy greedy weighted set cover (gains only shrink, so stale heap entries are re-scored)"""
+        remaining = weights.copy()
+        heap = []
+        for course in candidates:
+            gain = remaining[self.covers[course]].sum()
+            if gain > 0:
+                heap.append((-gain / costs[course], int(self.difficulty[course]), course))
+        heapq.heapify(heap)
+
+        chosen = []
+        while heap:
+            _, level, course = heapq.heappop(heap)
+            gain = remaining[self.covers[course]].sum()
+            if gain <= 0:
+                continue
+            ratio = gain / costs[course]
+            if heap and ratio < -heap[0][0]:
+                heapq.heappush(heap, (-ratio, level, course))
+                continue
+            chosen.append(course)
+            remaining[self.covers[course]] = 0
+        return chosen
+
+    def _branch_and_bound(self, candidates: List[int], costs: np.ndarray, is_gap: np.ndarray,
+                          incumbent: List[int]) -> Tuple[List[int], bool]:
+        """Minimum-cost cover of every coverable gap, seeded with an incumbent cover"""
+        gap_bits = {skill: bit for bit, skill in enumerate(np.flatnonzero(is_gap))}
+        masks: Dict[int, Tuple[float, int]] = {}
+        for course in candidates:
+            mask = 0
+            for skill in self.covers[course]:
+                if skill in gap_bits:
+                    mask |= 1 << gap_bits[skill]
+            # Of courses covering the same gaps keep the cheapest
+            if mask and (mask not in masks or costs[course] < masks[mask][0]):
+                masks[mask] = (costs[course], course)
+
+        # Drop courses dominated by a cheaper course covering a superset
+        options = sorted(((cost, mask, course) for mask, (cost, course) in masks.items()))
+        kept = []
+        for cost, mask, course in options:
+            if not any(other_mask & mask == mask for _, other_mask, _ in kept):
+                kept.append((cost, mask, course))
+
+        target = 0
+        for _, mask, _ in kept:
+            target |= mask
+        covering: Dict[int, List[Tuple[float, int, int]]] = {}
+        for option in kept:
+            bits = option[1]
+            while bits:
+                low = bits & -bits
+                covering.setdefault(low.bit_length() - 1, []).append(option)
+                bits ^= low
+        cheapest = {bit: options[0][0] for bit, options in covering.items()}
+
+        best_cost = float(sum(costs[course] for course in incumbent))
+        best = list(incumbent)
+        nodes = 0
+        exhausted = True
+
+        def search(uncovered: int, cost: float, picked: List[int]):
+            nonlocal best_cost, best, nodes, exhausted
+            if not uncovered:
+                if cost < best_cost - 1e-9:
+                    best_cost, best = cost, list(picked)
+                return
+            nodes += 1
+            if nodes > EXACT_NODE_LIMIT:
+                exhausted = False
+                return
+            # Every uncovered gap needs at least its cheapest course
+            bound = 0.0
+            branch_bit, branch_size = -1, None
+            bits = uncovered
+            while bits:
+                low = bits & -bits
+                bit = low.bit_length() - 1
+                bound = max(bound, cheapest[bit])
+                if branch_size is None or len(covering[bit]) < branch_size:
+                    branch_bit, branch_size = bit, len(covering[bit])
+                bits ^= low
+            if cost + bound >= best_cost - 1e-9:
+                return
+            for option_cost, mask, course in covering[branch_bit]:
+                picked.append(course)
+                search(uncovered & ~mask, cost + option_cost, picked)
+                picked.pop()
+
+        search(target, 0.0, [])
+        return best, exhausted
+
+    def _describe(self, chosen: List[int], gap_names: Dict[int, str], unknown: List[str],
+                  weights: np.ndarray, objective: str, optimal: bool) -> Dict:
+        """Plan dict in learning order"""
+        ordered = sorted(chosen, key=lambda course: (self.difficulty[course], self.weeks[course], course))
+        covered = set()
+        courses = []
+        for course in ordered:
+            teaches = [gap_names[skill] for skill in self.covers[course]
+                       if skill in gap_names and skill not in covered]
+            covered.update(skill for skill in self.covers[course] if skill in gap_names)
+            level = self.difficulty[course]
+            courses.append({
+                "course_name": self.course_names[course],
+                "platform": self.platforms[course],
+                "difficulty": COURSE_DIFFICULTY_LEVELS[level] if level >= 0 else None,
+                "duration_weeks": int(self.weeks[course]),
+                "price_usd": float(self.price[course]),
+                "url": self.urls[course],
+                "covers": teaches
+            })
+
+        total_weight = float(weights.sum()) + DEFAULT_SKILL_WEIGHT * len(unknown)
+        covered_weight = float(weights[list(covered)].sum()) if covered else 0.0
+        return {
+            "objective": objective,
+            "courses": courses,
+            "covered": [name for skill, name in gap_names.items() if skill in covered],
+            "uncovered": [name for skill, name in gap_names.items() if skill not in covered] + unknown,
+            "total_cost": round(sum(course["price_usd"] for course in courses), 2),
+            "total_weeks": sum(course["duration_weeks"] for course in courses),
+            "coverage": round(covered_weight / total_weight, 3) if total_weight else 1.0,
+            "optimal": optimal
+        }
+
+
+def get_learning_planner(courses_path: str = COURSE_CATALOG_CSV,
+                         skills_path: str = INDUSTRY_SKILLS_CSV) -> LearningPlanner:
+    """Process-wide planner over the bundled datasets, rebuilt when either CSV changes"""
+    return _planner(courses_path, file_mtime(courses_path), skills_path, file_mtime(skills_path))
+
+
+@lru_cache(maxsize=2)
+def _planner(courses_path: str, courses_mtime: int, skills_path: str, skills_mtime: int) -> LearningPlanner:
+    return LearningPlanner(load_course_catalog(courses_path), load_industry_skills(skills_path))
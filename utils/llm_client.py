@@ -0,0 +1,265 @@
+"""
+LLM HTTP Client
+Pooled, thread-safe OpenRouter client with retry/backoff, circuit breaker and latency metrics
+"""
+
+import json
+import logging
+import random
+import threading
+import time
+from collections import deque
+from typing import Dict, Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Status codes worth retrying: rate limiting and transient server errors
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class LLMClientError(Exception):
+    """Base error for failed LLM calls"""
+
+
+class LLMHTTPError(LLMClientError):
+    def __init__(self, status_code: int, message: str = ""):
+        super().__init__(f"HTTP {status_code}: {message}" if message else f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class CircuitOpenError(LLMClientError):
+    """Raised without calling the API while the circuit breaker is open"""
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """Open after consecutive failures, allow one trial call after the timeout"""
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        """Whether a call may proceed now"""
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return True
+            if state == "half_open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_neutral(self):
+        """A call that says nothing about service health: keep the failure count, free a half-open trial slot"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+class LatencyMetrics:
+    def __init__(self, window: int = 1000):
+        """Rolling per-call latency and outcome counters"""
+        self._latencies = deque(maxlen=window)
+        self._ttfts = deque(maxlen=window)
+        self._stream_totals = deque(maxlen=window)
+        self._counters = {"calls": 0, "successes": 0, "failures": 0, "retries": 0, "short_circuited": 0}
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, success: bool, retries: int):
+        with self._lock:
+            self._latencies.append(seconds)
+            self._counters["calls"] += 1
+            self._counters["successes" if success else "failures"] += 1
+            self._counters["retries"] += retries
+
+    def record_stream(self, ttft: Optional[float], total: float):
+        """Time to first token and total generation time of a streamed call"""
+        with self._lock:
+            if ttft is not None:
+                self._ttfts.append(ttft)
+            self._stream_totals.append(total)
+
+    def record_short_circuit(self):
+        with self._lock:
+            self._counters["short_circuited"] += 1
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            stats = dict(self._counters)
+            series = {"": sorted(self._latencies), "ttft_": sorted(self._ttfts),
+                      "stream_total_": sorted(self._stream_totals)}
+        for prefix, values in series.items():
+            if values:
+                stats[f"{prefix}p50_ms"] = round(values[len(values) // 2] * 1000, 2)
+                stats[f"{prefix}p95_ms"] = round(values[min(len(values) - 1, int(len(values) * 0.95))] * 1000, 2)
+                stats[f"{prefix}max_ms"] = round(values[-1] * 1000, 2)
+        return stats
+
+
+class OpenRouterClient:
+    def __init__(self, api_key: str, base_url: str = "https://openrouter.ai/api/v1/chat/completions",
+                 headers: Optional[Dict] = None, pool_size: int = 10, timeout: float = 15,
+                 max_retries: int = 3, backoff_base: float = 0.5, backoff_max: float = 8.0,
+                 breaker: Optional[CircuitBreaker] = None):
+        """
+        Initialize a client sharing one keep-alive connection pool
+
+        Args:
+            api_key: OpenRouter API key
+            base_url: Chat completions endpoint
+            headers: Extra headers sent with every request
+            pool_size: Maximum pooled connections to the API host
+            timeout: Per-attempt timeout in seconds
+            max_retries: Retries after the first attempt on 429/5xx and connection errors
+            backoff_base: First backoff ceiling in seconds, doubled per retry
+            backoff_max: Upper bound on a single backoff
+            breaker: Circuit breaker (one with defaults is created if omitted)
+        """
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker = breaker or CircuitBreaker()
+        self.metrics = LatencyMetrics()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=True, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Authorization": f"Bearer {api_key}",
+                                     "Content-Type": "application/json",
+                                     "Connection": "keep-alive"})
+        if headers:
+            self.session.headers.update(headers)
+
+    def _backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Full-jitter exponential backoff, honouring Retry-After when given"""
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def post(self, payload: Dict, stream: bool = False) -> requests.Response:
+        """
+        POST a payload with retries, returning the successful response
+
+        Raises:
+            CircuitOpenError: The breaker is open and the call was not attempted
+            LLMHTTPError: A non-retryable status, or retries were exhausted
+            LLMClientError: Connection errors persisted through every retry
+        """
+        if not self.breaker.allow():
+            self.metrics.record_short_circuit()
+            raise CircuitOpenError("LLM circuit breaker is open")
+
+        start = time.perf_counter()
+        attempt = 0
+        while True:
+            error: Optional[LLMClientError] = None
+            retry_after = None
+            try:
+                response = self.session.post(self.base_url, json=payload, timeout=self.timeout, stream=stream)
+                if response.status_code == 200:
+                    self.breaker.record_success()
+                    self.metrics.record(time.perf_counter() - start, True, attempt)
+                    return response
+                error = LLMHTTPError(response.status_code, response.reason or "")
+                retry_after = response.headers.get("Retry-After")
+                response.close()
+                retryable = response.status_code in RETRYABLE_STATUS
+            except requests.RequestException as exc:
+                error = LLMClientError(str(exc))
+                retryable = True
+
+            if not retryable:
+                # Client errors (bad key, bad payload) say nothing about service health
+                self.breaker.record_neutral()
+                self.metrics.record(time.perf_counter() - start, False, attempt)
+                raise error
+            if attempt >= self.max_retries:
+                self.breaker.record_failure()
+                self.metrics.record(time.perf_counter() - start, False, attempt)
+                raise error
+
+            time.sleep(self._backoff(attempt, retry_after))
+            attempt += 1
+
+    def chat(self, payload: Dict) -> str:
+        """Send a chat completion and return the first choice's content"""
+        result = self.post(payload).json()
+        return result['choices'][0]['message']['content']
+
+    def stream_chat(self, payload: Dict) -> Iterator[str]:
+        """
+        Stream a chat completion over server-sent events, yielding content deltas
+
+        Retries and the circuit breaker apply until the response starts; time to
+        first token and total time are logged and recorded in metrics.
+        """
+        start = time.perf_counter()
+        response = self.post({**payload, "stream": True}, stream=True)
+        ttft = None
+        try:
+            for line in response.iter_lines(decode_unicode=True):
+                # SSE comments (": OPENROUTER PROCESSING") and blank keep-alives carry no data
+                if not line or not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                try:
+                    event = json.loads(data)
+                except ValueError:
+                    continue
+                if "error" in event:
+                    raise LLMClientError(str(event["error"].get("message", event["error"])))
+                choices = event.get("choices") or [{}]
+                delta = choices[0].get("delta", {}).get("content")
+                if delta:
+                    if ttft is None:
+                        ttft = time.perf_counter() - start
+                    yield delta
+        except requests.RequestException as exc:
+            raise LLMClientError(str(exc)) from exc
+        finally:
+            response.close()
+            total = time.perf_counter() - start
+            self.metrics.record_stream(ttft, total)
+            logger.info("LLM stream finished: ttft=%s total=%.3fs",
+                        f"{ttft:.3f}s" if ttft is not None else "n/a", total)
+
+    def close(self):
+        self.session.close()
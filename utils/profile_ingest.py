@@ -0,0 +1,159 @@
+"""
+Profile Ingestion
+Streams user profiles from JSONL/CSV files one at a time and writes results incrementally
+"""
+
+import csv
+import json
+import math
+from typing import Callable, Dict, Iterator, List, Optional
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.result_export import ArrowResultWriter, infer_format
+
+PROFILE_FIELDS = ["skills", "experience_years", "education_level", "current_role",
+                  "projects", "certifications"]
+
+# Extensions treated as one JSON object per line
+JSONL_EXTENSIONS = (".jsonl", ".ndjson", ".json")
+
+
+class ProfileValidationError(ValueError):
+    """Raised when a record cannot be coerced into the user_profile shape"""
+
+
+def _split_list(value) -> List[str]:
+    """Coerce a list or semicolon-separated string into a list of strings"""
+    if value is None or value == "":
+        return []
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(";") if item.strip()]
+    if isinstance(value, (list, tuple)):
+        if not all(isinstance(item, str) for item in value):
+            raise ProfileValidationError("list entries must be strings")
+        return list(value)
+    raise ProfileValidationError(f"expected a list or string, got {type(value).__name__}")
+
+
+def validate_profile(record: Dict) -> Dict:
+    """
+    Validate a raw record against the profile shape calculate_readiness_score expects
+
+    Args:
+        record: Parsed JSON object or CSV row
+
+    Returns:
+        Profile with skills as {category: [skills]}, numeric experience_years,
+        string education_level/current_role and list projects/certifications
+    """
+    if not isinstance(record, dict):
+        raise ProfileValidationError(f"profile must be an object, got {type(record).__name__}")
+
+    skills = record.get("skills", {})
+    if isinstance(skills, dict):
+        skills = {str(category): _split_list(values) for category, values in skills.items()}
+    else:
+        skills = {"general": _split_list(skills)}
+
+    experience = record.get("experience_years", 0)
+    # bool is an int subclass, so True/False would otherwise pass as 1/0
+    if isinstance(experience, bool):
+        raise ProfileValidationError(f"experience_years must be numeric, got {experience!r}")
+    try:
+        experience_years = float(experience) if experience not in (None, "") else 0
+    except (TypeError, ValueError):
+        raise ProfileValidationError(f"experience_years must be numeric, got {experience!r}")
+    # json.loads accepts bare NaN/Infinity and float() accepts "nan"/"inf"
+    if not math.isfinite(experience_years):
+        raise ProfileValidationError(f"experience_years must be finite, got {experience!r}")
+    if experience_years < 0:
+        raise ProfileValidationError("experience_years must not be negative")
+    if float(experience_years).is_integer():
+        experience_years = int(experience_years)
+
+    for field in ("education_level", "current_role"):
+        if not isinstance(record.get(field) or "", str):
+            raise ProfileValidationError(f"{field} must be a string")
+
+    profile = {
+        "skills": skills,
+        "experience_years": experience_years,
+        "education_level": record.get("education_level") or "",
+        "current_role": record.get("current_role") or "",
+        "projects": _split_list(record.get("projects")),
+        "certifications": _split_list(record.get("certifications"))
+    }
+    if record.get("id") not in (None, ""):
+        profile["id"] = record["id"]
+    return profile
+
+
+def _iter_records(path: str) -> Iterator[Dict]:
+    """Yield raw records without holding more than one line in memory"""
+    with open(path, newline="", encoding="utf-8") as handle:
+        if path.lower().endswith(".csv"):
+            yield from csv.DictReader(handle)
+        else:
+            for line in handle:
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError as exc:
+                        yield ProfileValidationError(f"invalid JSON: {exc.msg}")
+
+
+def iter_profiles(path: str, on_error: str = "skip",
+                  error_callback: Optional[Callable[[int, Exception], None]] = None) -> Iterator[Dict]:
+    """
+    Lazily parse and validate profiles from a JSONL or CSV file
+
+    Args:
+        path: Input file (.csv, or one JSON object per line)
+        on_error: "skip" to drop invalid records or "raise" to stop at the first one
+        error_callback: Called with (record number, error) for each skipped record
+
+    Returns:
+        Generator of validated profiles
+    """
+    for number, record in enumerate(_iter_records(path), start=1):
+        try:
+            if isinstance(record, Exception):
+                raise record
+            yield validate_profile(record)
+        except ProfileValidationError as exc:
+            if on_error == "raise":
+                raise ProfileValidationError(f"record {number}: {exc}") from exc
+            if error_callback is not None:
+                error_callback(number, exc)
+
+
+class JsonlResultWriter:
+    def __init__(self, path: str):
+        """Append pre-serialized JSON lines to a file"""
+        self._handle = open(path, "w", encoding="utf-8")
+
+    def write(self, results: List[str]):
+        if results:
+            self._handle.write("\n".join(results))
+            self._handle.write("\n")
+
+    def close(self):
+        self._handle.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open_result_writer(path: str, output_format: str = None):
+    """Open an incremental writer, inferring the format from the extension"""
+    output_format = output_format or infer_format(path)
+    if output_format in ("parquet", "arrow"):
+        return ArrowResultWriter(path, output_format)
+    return JsonlResultWriter(path)
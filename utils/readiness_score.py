@@ -4,7 +4,7 @@ Calculates individual readiness score for transitioning to future STEM industrie
 """
 
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
 import pandas as pd
 import sys
 import os
@@ -13,75 +13,142 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import FUTURE_INDUSTRIES, SCORING_WEIGHTS
+from utils.data_loader import get_industry_skill_lists
+from utils.results import COMPONENT_NAMES, ComponentScores, ReadinessResult, shared_tuple
+from utils.role_resolver import get_role_resolver
+from utils.skill_graph import get_skill_graph
+from utils.skill_vocabulary import SkillVocabulary, get_vocabulary
+
+# Lookup tables shared by the per-call and batch scoring paths
+ROLE_RELEVANCE = {
+    "software_developer": 0.8,
+    "data_analyst": 0.75,
+    "engineer": 0.7,
+    "researcher": 0.65,
+    "teacher": 0.4,
+    "healthcare_professional": 0.5,
+    "accountant": 0.45,
+    "marketing_professional": 0.4
+}
+
+EDUCATION_SCORES = {
+    "phd": {"technical": 1.0, "scientific": 1.0, "engineering": 1.0, "mixed": 0.9},
+    "masters": {"technical": 0.9, "scientific": 0.9, "engineering": 0.9, "mixed": 0.8},
+    "bachelors": {"technical": 0.7, "scientific": 0.7, "engineering": 0.7, "mixed": 0.7},
+    "associate": {"technical": 0.5, "scientific": 0.4, "engineering": 0.5, "mixed": 0.5},
+    "high_school": {"technical": 0.3, "scientific": 0.2, "engineering": 0.3, "mixed": 0.4}
+}
+
+# Industry-relevant certification keywords
+INDUSTRY_CERTS = {
+    "AI": ["machine learning", "deep learning", "ai", "tensorflow", "aws ml"],
+    "BLOCKCHAIN": ["blockchain", "ethereum", "solidity", "web3", "defi"],
+    "CYBERSECURITY": ["security+", "cissp", "ceh", "oscp", "ccna security"],
+    "BIOTECH": ["bioinformatics", "clinical", "gcp", "biostatistics"],
+    "AGRITECH": ["precision agriculture", "iot", "sustainability", "gis"],
+    "AQUATECH": ["aquaculture", "marine", "water quality", "environmental"],
+    "SPACETECH": ["aerospace", "systems engineering", "satellite", "space"],
+    "RENEWABLE": ["renewable energy", "solar", "wind", "energy management", "leed"]
+}
+
+# Simplified market scores based on current trends
+MARKET_SCORES = {
+    "AI": 0.95,
+    "CYBERSECURITY": 0.9,
+    "RENEWABLE": 0.85,
+    "BLOCKCHAIN": 0.8,
+    "BIOTECH": 0.8,
+    "SPACETECH": 0.75,
+    "AGRITECH": 0.75,
+    "AQUATECH": 0.7
+}
+
+# Hiring profile per industry; required skills are read from the dataset
+INDUSTRY_PROFILES = {
+    "AI": {"experience_level": "intermediate", "education_preference": "technical", "project_importance": 0.9},
+    "BLOCKCHAIN": {"experience_level": "intermediate", "education_preference": "technical",
+                   "project_importance": 0.85},
+    "CYBERSECURITY": {"experience_level": "intermediate", "education_preference": "technical",
+                      "project_importance": 0.8},
+    "BIOTECH": {"experience_level": "advanced", "education_preference": "scientific", "project_importance": 0.7},
+    "AGRITECH": {"experience_level": "intermediate", "education_preference": "mixed", "project_importance": 0.75},
+    "AQUATECH": {"experience_level": "intermediate", "education_preference": "scientific",
+                 "project_importance": 0.7},
+    "SPACETECH": {"experience_level": "advanced", "education_preference": "engineering",
+                  "project_importance": 0.85},
+    "RENEWABLE": {"experience_level": "intermediate", "education_preference": "engineering",
+                  "project_importance": 0.8}
+}
+
+# Foundational skills that make learning easier
+FOUNDATIONAL_SKILLS = ["programming", "data analysis", "mathematics", "problem solving"]
+
+NEXT_STEPS = {
+    "ready": ("Update resume highlighting relevant skills",
+              "Apply for entry-level positions in the industry",
+              "Join industry-specific communities and forums"),
+    "nearly": ("Complete 1-2 industry-relevant certifications",
+               "Build 2-3 portfolio projects",
+               "Attend industry meetups and conferences"),
+    "developing": ("Enroll in comprehensive online courses",
+                   "Start with beginner projects",
+                   "Find a mentor in the field"),
+    "foundation": ("Build foundational skills through MOOCs",
+                   "Join study groups or bootcamps",
+                   "Create a structured learning plan")
+}
+
+def _round_percent(values: np.ndarray) -> np.ndarray:
+    """Scale scores to percentages rounded exactly like round(x * 100, 1)"""
+    percent = np.asarray(values * 100, dtype=float).ravel()
+    rounded = np.round(percent, 1)
+
+    # np.round scales before rounding, so near-ties can land on the other side;
+    # defer those few values to Python's correctly rounded round()
+    scaled = percent * 10
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    rounded[near_tie] = [round(float(v), 1) for v in percent[near_tie]]
+    return rounded
 
 class ReadinessCalculator:
     def __init__(self):
         """Initialize readiness calculator"""
         self.weights = SCORING_WEIGHTS
         self.industry_requirements = self._load_industry_requirements()
+        self.vocabulary = get_vocabulary()
+        self._skill_ids = self._compile_skill_ids()
+        self._foundational_ids = [self.vocabulary.intern(s) for s in FOUNDATIONAL_SKILLS]
+        self.resolver = get_role_resolver()
+        self._requirement_cache = {}
         
     def _load_industry_requirements(self) -> Dict[str, Dict]:
-        """Load specific requirements for each industry"""
+        """
+        Load specific requirements for each industry
+
+        Skill lists come from the industry skills dataset (Essential rows are essential,
+        Important and Optional rows preferred); the hiring profile is fixed per industry.
+        """
+        skill_lists = get_industry_skill_lists()
         return {
-            "AI": {
-                "essential_skills": ["Python", "Machine Learning", "Mathematics", "Statistics"],
-                "preferred_skills": ["TensorFlow", "PyTorch", "Deep Learning", "NLP", "Computer Vision"],
-                "experience_level": "intermediate",
-                "education_preference": "technical",
-                "project_importance": 0.9
-            },
-            "BLOCKCHAIN": {
-                "essential_skills": ["Programming", "Cryptography", "Distributed Systems"],
-                "preferred_skills": ["Solidity", "Web3", "Smart Contracts", "DeFi", "Ethereum"],
-                "experience_level": "intermediate",
-                "education_preference": "technical",
-                "project_importance": 0.85
-            },
-            "CYBERSECURITY": {
-                "essential_skills": ["Networking", "Security Fundamentals", "Linux", "Python"],
-                "preferred_skills": ["Penetration Testing", "SIEM", "Cloud Security", "Cryptography"],
-                "experience_level": "intermediate",
-                "education_preference": "technical",
-                "project_importance": 0.8
-            },
-            "BIOTECH": {
-                "essential_skills": ["Biology", "Data Analysis", "Research Methods"],
-                "preferred_skills": ["Bioinformatics", "Genomics", "R/Python", "Lab Techniques"],
-                "experience_level": "advanced",
-                "education_preference": "scientific",
-                "project_importance": 0.7
-            },
-            "AGRITECH": {
-                "essential_skills": ["Agriculture Knowledge", "Data Analysis", "IoT"],
-                "preferred_skills": ["Precision Agriculture", "GIS", "Sustainability", "Automation"],
-                "experience_level": "intermediate",
-                "education_preference": "mixed",
-                "project_importance": 0.75
-            },
-            "AQUATECH": {
-                "essential_skills": ["Marine Science", "Data Analysis", "Environmental Science"],
-                "preferred_skills": ["Aquaculture Systems", "Water Quality", "IoT", "Sustainability"],
-                "experience_level": "intermediate",
-                "education_preference": "scientific",
-                "project_importance": 0.7
-            },
-            "SPACETECH": {
-                "essential_skills": ["Engineering", "Mathematics", "Physics", "Programming"],
-                "preferred_skills": ["Aerospace Engineering", "Systems Engineering", "MATLAB", "Simulation"],
-                "experience_level": "advanced",
-                "education_preference": "engineering",
-                "project_importance": 0.85
-            },
-            "RENEWABLE": {
-                "essential_skills": ["Engineering", "Energy Systems", "Mathematics"],
-                "preferred_skills": ["Solar/Wind Technology", "Grid Systems", "Energy Storage", "Sustainability"],
-                "experience_level": "intermediate",
-                "education_preference": "engineering",
-                "project_importance": 0.8
+            industry: {
+                "essential_skills": skill_lists.get(industry, {}).get("essential_skills", []),
+                "preferred_skills": skill_lists.get(industry, {}).get("preferred_skills", []),
+                **profile
             }
+            for industry, profile in INDUSTRY_PROFILES.items()
         }
     
-    def calculate_readiness_score(self, user_profile: Dict, target_industry: str) -> Dict:
+    def _compile_skill_ids(self) -> Dict[str, Dict[str, List[Tuple[str, int]]]]:
+        """Intern every requirement skill once, keeping display names alongside IDs"""
+        return {
+            industry: {
+                kind: [(skill, self.vocabulary.intern(skill)) for skill in requirements.get(kind, [])]
+                for kind in ("essential_skills", "preferred_skills")
+            }
+            for industry, requirements in self.industry_requirements.items()
+        }
+
+    def calculate_readiness_score(self, user_profile: Dict, target_industry: str) -> ReadinessResult:
         """
         Calculate comprehensive readiness score
         
@@ -90,7 +157,7 @@ class ReadinessCalculator:
             target_industry: Target STEM industry
             
         Returns:
-            Detailed readiness assessment
+            Detailed readiness assessment (to_dict() gives the nested-dict form)
         """
         # Extract user information
         user_skills = user_profile.get("skills", {})
@@ -100,15 +167,18 @@ class ReadinessCalculator:
         projects = user_profile.get("projects", [])
         certifications = user_profile.get("certifications", [])
         
+        # Encode skills once as a vocabulary bitset
+        skill_mask = self.vocabulary.profile_mask(user_skills)
+        
         # Calculate component scores
-        skill_match_score = self._calculate_skill_match(user_skills, target_industry)
+        skill_match_score = self._calculate_skill_match(skill_mask, target_industry)
         experience_score = self._calculate_experience_score(experience_years, current_role, target_industry)
         education_score = self._calculate_education_score(education_level, target_industry)
         project_score = self._calculate_project_score(projects, target_industry)
         certification_score = self._calculate_certification_score(certifications, target_industry)
         
         # Calculate learning curve score
-        learning_curve_score = self._calculate_learning_curve(user_skills, target_industry)
+        learning_curve_score = self._calculate_learning_curve(skill_mask, target_industry)
         
         # Calculate market readiness
         market_readiness = self._calculate_market_readiness(target_industry)
@@ -131,48 +201,329 @@ class ReadinessCalculator:
         # Generate recommendations
         recommendations = self._generate_recommendations(
             skill_match_score, experience_score, learning_curve_score, 
-            user_skills, target_industry
+            skill_mask, target_industry
         )
         
-        # Time to readiness estimate
-        time_to_ready = self._estimate_time_to_readiness(final_score, learning_curve_score)
-        
-        return {
-            "overall_score": round(final_score * 100, 1),
-            "readiness_level": readiness_level,
-            "component_scores": {
-                "skill_match": round(skill_match_score * 100, 1),
-                "experience": round(experience_score * 100, 1),
-                "education": round(education_score * 100, 1),
-                "projects": round(project_score * 100, 1),
-                "certifications": round(certification_score * 100, 1),
-                "learning_curve": round(learning_curve_score * 100, 1),
-                "market_readiness": round(market_readiness * 100, 1)
-            },
-            "time_to_ready": time_to_ready,
-            "recommendations": recommendations,
-            "strengths": self._identify_strengths(user_profile, target_industry),
-            "gaps": self._identify_gaps(user_skills, target_industry),
-            "next_steps": self._generate_next_steps(final_score, target_industry)
+        # Time to readiness: scheduled learning hours for the missing skills
+        graph = get_skill_graph(target_industry)
+        if graph.names:
+            schedule = graph.schedule_for_mask(skill_mask)
+            time_to_ready, months_to_ready = schedule.time_to_ready, schedule.months_to_ready
+        else:
+            time_to_ready = self._estimate_time_to_readiness(final_score, learning_curve_score)
+            months_to_ready = None
+        
+        return ReadinessResult(
+            overall_score=round(final_score * 100, 1),
+            readiness_level=readiness_level,
+            component_scores=ComponentScores.from_percentages(
+                round(score * 100, 1) for score in (skill_match_score, experience_score, education_score,
+                                                    project_score, certification_score, learning_curve_score,
+                                                    market_readiness)),
+            time_to_ready=time_to_ready,
+            months_to_ready=months_to_ready,
+            recommendations=shared_tuple(recommendations),
+            strengths=shared_tuple(self._identify_strengths(user_profile, target_industry)),
+            gaps=shared_tuple(self._identify_gaps(skill_mask, target_industry)),
+            next_steps=self._generate_next_steps(final_score, target_industry)
+        )
+
+    def score_batch(self, profiles: List[Dict], industries: List[str] = None) -> pd.DataFrame:
+        """
+        Score every profile against every industry in one vectorized pass
+
+        Args:
+            profiles: User profiles in the same shape calculate_readiness_score expects
+            industries: Target industries (defaults to every known industry)
+
+        Returns:
+            One row per profile x industry pair with the overall score, readiness level,
+            component scores and time to readiness of the per-call path
+        """
+        profiles = list(profiles)
+        industries = list(industries) if industries is not None else list(self.industry_requirements)
+        graphs = [get_skill_graph(industry) for industry in industries]
+        scores = self.score_matrices(profiles, industries)
+        final = scores["overall"]
+
+        readiness_level = np.select([final >= 0.8, final >= 0.6, final >= 0.4, final >= 0.2],
+                                    ["Ready to Transition", "Nearly Ready", "Developing Readiness",
+                                     "Early Stage"], default="Foundation Building")
+        time_to_ready, months_to_ready = self._time_to_ready_matrix(scores["skills"], graphs, final,
+                                                                    scores["learning_curve"])
+
+        result = {
+            "profile_index": np.repeat(np.arange(len(profiles)), len(industries)),
+            "industry": np.tile(np.array(industries, dtype=object), len(profiles)),
+            "overall_score": _round_percent(final),
+            "readiness_level": readiness_level.ravel(),
         }
-    
-    def _calculate_skill_match(self, user_skills: Dict, industry: str) -> float:
+        for name in COMPONENT_NAMES:
+            result[name] = _round_percent(scores[name])
+        result["time_to_ready"] = time_to_ready.ravel()
+        result["months_to_ready"] = months_to_ready.ravel()
+
+        return pd.DataFrame(result)
+
+    def score_matrices(self, profiles: List[Dict], industries: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Unrounded profile x industry score matrices shared by the vectorized paths
+
+        Args:
+            profiles: User profiles in the same shape calculate_readiness_score expects
+            industries: Target industries, one column each
+
+        Returns:
+            "overall" and each COMPONENT_NAMES entry as 0-1 matrices, plus the
+            profile x vocabulary "skills" membership matrix they were computed from
+        """
+        # Encode requirements and profiles against a shared skill vocabulary
+        essential, preferred, foundational = self._requirement_matrices(industries)
+        skills = self._encode_profiles(profiles)
+        if skills.shape[1] > essential.shape[1]:
+            # The vocabulary grew between the two calls; rebuild at the new width
+            essential, preferred, foundational = self._requirement_matrices(industries)
+
+        # Profile-level inputs
+        years = np.array([p.get("experience_years", 0) for p in profiles], dtype=float)
+        relevance = np.array([ROLE_RELEVANCE.get(self.resolver.canonical_role(p.get("current_role", "")), 0.5)
+                              for p in profiles])
+        project_counts = np.array([len(p.get("projects", [])) for p in profiles])
+
+        scores = self._score_components(skills @ essential.T, skills @ preferred.T, skills @ foundational,
+                                        years, relevance, project_counts,
+                                        self._education_matrix(profiles, industries),
+                                        self._certification_matrix(profiles, industries), industries)
+        scores["skills"] = skills
+        return scores
+
+    def score_skill_matrix(self, matrix, industries: List[str] = None,
+                           chunk_rows: int = 8192) -> Iterator[Tuple[int, Dict[str, np.ndarray]]]:
+        """
+        Score a memory-mapped population file chunk by chunk
+
+        Skill bits are unpacked straight from the mapped pages and matched against
+        every industry's requirements in one float32 matrix product per chunk, so
+        memory use is bounded by chunk_rows whatever the population size.
+
+        Args:
+            matrix: utils.skill_matrix.SkillMatrix opened over a packed population file
+            industries: Target industries (defaults to every known industry)
+            chunk_rows: Profiles scored per chunk
+
+        Returns:
+            Generator of (first row, score matrices) with "overall" and each
+            COMPONENT_NAMES entry as 0-1 chunk x industry matrices
+        """
+        industries = list(industries) if industries is not None else list(self.industry_requirements)
+
+        # Requirement columns for the file's skills; skills unknown to the vocabulary match nothing
+        vocab_ids = matrix.vocabulary_ids(self.vocabulary)
+        essential, preferred, foundational = self._requirement_matrices(industries)
+        known = vocab_ids >= 0
+        weights = np.zeros((len(vocab_ids), 2 * len(industries) + 1), dtype=np.float32)
+        weights[known] = np.column_stack([essential.T, preferred.T, foundational])[vocab_ids[known]]
+
+        # Codes in the file index the header lists; the last entry of each table is the default
+        relevance_table = np.array([ROLE_RELEVANCE.get(role, 0.5) for role in matrix.roles] + [0.5])
+        levels = list(EDUCATION_SCORES)
+        education_rows = np.array([levels.index(level) if level in levels else len(levels)
+                                   for level in matrix.education_levels] + [len(levels)])
+        education_table = self._education_table(industries)[education_rows]
+        keyword_table = np.array([[INDUSTRY_CERTS.get(industry, []).count(keyword)
+                                   for keyword in matrix.cert_keywords] for industry in industries],
+                                 dtype=float).reshape(len(industries), len(matrix.cert_keywords))
+        keyword_bits = np.uint64(1) << np.arange(len(matrix.cert_keywords), dtype=np.uint64)
+
+        for start, records in matrix.chunks(chunk_rows):
+            hits = (matrix.skill_bits(records).astype(np.float32) @ weights).astype(float)
+
+            # Few distinct certification sets occur, so score each once
+            cert_sets, cert_index = np.unique(records["certifications"], return_inverse=True)
+            found = (cert_sets[:, None] & keyword_bits) != 0
+            certifications = np.minimum((found @ keyword_table.T) / 3, 1.0)[cert_index.ravel()]
+            role = records["role"].astype(np.intp)
+            scores = self._score_components(
+                hits[:, :len(industries)], hits[:, len(industries):-1], hits[:, -1],
+                records["experience_years"].astype(float),
+                relevance_table[np.where(role < 0, len(matrix.roles), role)], records["projects"],
+                education_table[records["education"].astype(np.intp)], certifications, industries)
+            yield start, scores
+
+    def _score_components(self, essential_hits: np.ndarray, preferred_hits: np.ndarray,
+                          foundation_hits: np.ndarray, years: np.ndarray, relevance: np.ndarray,
+                          project_counts: np.ndarray, education: np.ndarray, certifications: np.ndarray,
+                          industries: List[str]) -> Dict[str, np.ndarray]:
+        """Overall and component matrices from requirement hit counts and per-profile inputs"""
+        shape = essential_hits.shape
+        skill_ids = [self._skill_ids.get(i, {}) for i in industries]
+
+        # Skill match: essential (60%) and preferred (40%) coverage
+        essential_total = np.array([len(ids.get("essential_skills", [])) for ids in skill_ids])
+        preferred_total = np.array([len(ids.get("preferred_skills", [])) for ids in skill_ids])
+        essential_score = np.divide(essential_hits, essential_total, out=np.zeros(shape),
+                                    where=essential_total > 0)
+        preferred_score = np.divide(preferred_hits, preferred_total, out=np.zeros(shape),
+                                    where=preferred_total > 0)
+        skill_match = essential_score * 0.6 + preferred_score * 0.4
+
+        # Learning curve: foundational coverage plus existing skill match
+        foundation = foundation_hits / len(FOUNDATIONAL_SKILLS)
+        learning_curve = foundation[:, None] * 0.4 + skill_match * 0.6
+
+        experience_base = np.select([years >= 10, years >= 5, years >= 3, years >= 1],
+                                    [0.9, 0.7, 0.5, 0.3], default=0.1)
+        project_base = np.select([project_counts >= 5, project_counts >= 3, project_counts >= 1],
+                                 [0.9, 0.7, 0.4], default=0.0)
+
+        experience = np.broadcast_to((experience_base * relevance)[:, None], shape)
+        importance = np.array([self.industry_requirements.get(i, {}).get("project_importance", 0.7)
+                               for i in industries])
+        projects = project_base[:, None] * importance
+        market = np.broadcast_to(np.array([MARKET_SCORES.get(i, 0.7) for i in industries]), shape)
+
+        # Weighted final score with education/project/certification bonus
+        final = (
+            skill_match * self.weights["current_skills_match"] +
+            experience * self.weights["transferable_skills"] +
+            learning_curve * self.weights["learning_curve"] +
+            market * self.weights["market_demand"]
+        )
+        bonus = (education + projects + certifications) / 3 * 0.1
+        final = np.minimum(final + bonus, 1.0)
+
+        components = [skill_match, experience, education, projects,
+                      certifications, learning_curve, market]
+        return {"overall": final, **dict(zip(COMPONENT_NAMES, components))}
+
+    def _requirement_matrices(self, industries: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Build industry x skill requirement matrices over the shared vocabulary (cached per width)"""
+        key = (tuple(industries), len(self.vocabulary))
+        cached = self._requirement_cache.get(key)
+        if cached is not None:
+            return cached
+
+        skill_ids = [self._skill_ids.get(i) or {"essential_skills": [], "preferred_skills": []}
+                     for i in industries]
+        width = len(self.vocabulary)
+
+        essential = np.zeros((len(industries), width))
+        preferred = np.zeros((len(industries), width))
+        for row, ids in enumerate(skill_ids):
+            for _, skill_id in ids["essential_skills"]:
+                essential[row, skill_id] += 1
+            for _, skill_id in ids["preferred_skills"]:
+                preferred[row, skill_id] += 1
+
+        foundational = np.zeros(width)
+        for skill_id in self._foundational_ids:
+            foundational[skill_id] += 1
+
+        if len(self._requirement_cache) >= 64:
+            self._requirement_cache.clear()
+        self._requirement_cache[key] = (essential, preferred, foundational)
+        return essential, preferred, foundational
+
+    def _encode_profiles(self, profiles: List[Dict]) -> np.ndarray:
+        """Encode profiles as a profile x skill membership matrix"""
+        # Collect (row, column) coordinates of known skills only
+        rows, cols = [], []
+        for row, profile in enumerate(profiles):
+            skill_ids = SkillVocabulary.ids_of_mask(self.vocabulary.profile_mask(profile.get("skills", {})))
+            rows.extend([row] * len(skill_ids))
+            cols.extend(skill_ids)
+
+        matrix = np.zeros((len(profiles), len(self.vocabulary)))
+        matrix[rows, cols] = 1.0
+        return matrix
+
+    def _time_to_ready_matrix(self, skills: np.ndarray, graphs: List, final: np.ndarray,
+                              learning_curve: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Scheduled time to readiness per pair, computed once per distinct set of missing skills"""
+        time_to_ready = np.empty(final.shape, dtype=object)
+        months_to_ready = np.full(final.shape, np.nan)
+        for column, graph in enumerate(graphs):
+            if not graph.names:
+                combined = (final[:, column] + learning_curve[:, column]) / 2
+                time_to_ready[:, column] = np.select(
+                    [combined >= 0.8, combined >= 0.6, combined >= 0.4, combined >= 0.2],
+                    ["0-3 months", "3-6 months", "6-12 months", "12-18 months"], default="18-24 months")
+                continue
+            missing = skills[:, graph.vocab_ids] == 0
+            if len(graph.names) < 63:
+                codes = missing.astype(np.int64) @ (np.int64(1) << np.arange(len(graph.names), dtype=np.int64))
+            else:
+                codes = np.array([sum(1 << node for node in np.flatnonzero(row)) for row in missing],
+                                 dtype=object)
+            unique_codes, inverse = np.unique(codes, return_inverse=True)
+            schedules = [graph.schedule(int(code)) for code in unique_codes]
+            time_to_ready[:, column] = np.array([s.time_to_ready for s in schedules], dtype=object)[inverse]
+            months_to_ready[:, column] = np.array([s.months_to_ready for s in schedules])[inverse]
+        return time_to_ready, months_to_ready
+
+    def _education_matrix(self, profiles: List[Dict], industries: List[str]) -> np.ndarray:
+        """Education relevance for every profile x industry pair"""
+        levels = list(EDUCATION_SCORES)
+        level_index = []
+        for profile in profiles:
+            education_lower = profile.get("education_level", "").lower()
+            level_index.append(next((i for i, level in enumerate(levels) if level in education_lower),
+                                    len(levels)))
+
+        return self._education_table(industries)[level_index]
+
+    def _education_table(self, industries: List[str]) -> np.ndarray:
+        """Education level x industry scores (cached per industry list)"""
+        key = ("education", tuple(industries))
+        table = self._requirement_cache.get(key)
+        if table is None:
+            preferences = [self.industry_requirements.get(i, {}).get("education_preference", "technical")
+                           for i in industries]
+
+            # Last row holds the default score for unrecognised education levels
+            table = np.array([[EDUCATION_SCORES[level].get(pref, 0.5) for pref in preferences]
+                              for level in EDUCATION_SCORES] + [[0.5] * len(industries)])
+            self._requirement_cache[key] = table
+        return table
+
+    def _certification_matrix(self, profiles: List[Dict], industries: List[str]) -> np.ndarray:
+        """Certification relevance for every profile x industry pair"""
+        key = ("certifications", tuple(industries))
+        cached = self._requirement_cache.get(key)
+        if cached is None:
+            keywords = sorted({k for i in industries for k in INDUSTRY_CERTS.get(i, [])})
+            keyword_index = {k: i for i, k in enumerate(keywords)}
+
+            industry_keywords = np.zeros((len(industries), len(keywords)))
+            for row, industry in enumerate(industries):
+                for keyword in INDUSTRY_CERTS.get(industry, []):
+                    industry_keywords[row, keyword_index[keyword]] += 1
+            cached = self._requirement_cache[key] = (keyword_index, industry_keywords)
+        keyword_index, industry_keywords = cached
+
+        found = np.zeros((len(profiles), len(keyword_index)))
+        for row, profile in enumerate(profiles):
+            certifications = profile.get("certifications", [])
+            if certifications:
+                cert_text = " ".join(certifications).lower()
+                for keyword, col in keyword_index.items():
+                    if keyword in cert_text:
+                        found[row, col] = 1.0
+
+        return np.minimum((found @ industry_keywords.T) / 3, 1.0)
+
+    def _calculate_skill_match(self, skill_mask: int, industry: str) -> float:
         """Calculate skill match score"""
-        requirements = self.industry_requirements.get(industry, {})
-        essential_skills = requirements.get("essential_skills", [])
-        preferred_skills = requirements.get("preferred_skills", [])
-        
-        # Flatten user skills
-        all_user_skills = []
-        for category, skills in user_skills.items():
-            all_user_skills.extend([s.lower() for s in skills])
+        skill_ids = self._skill_ids.get(industry, {})
+        essential_skills = skill_ids.get("essential_skills", [])
+        preferred_skills = skill_ids.get("preferred_skills", [])
         
         # Check essential skills (60% weight)
-        essential_match = sum(1 for skill in essential_skills if skill.lower() in all_user_skills)
+        essential_match = sum(1 for _, skill_id in essential_skills if skill_mask >> skill_id & 1)
         essential_score = essential_match / len(essential_skills) if essential_skills else 0
         
         # Check preferred skills (40% weight)
-        preferred_match = sum(1 for skill in preferred_skills if skill.lower() in all_user_skills)
+        preferred_match = sum(1 for _, skill_id in preferred_skills if skill_mask >> skill_id & 1)
         preferred_score = preferred_match / len(preferred_skills) if preferred_skills else 0
         
         return essential_score * 0.6 + preferred_score * 0.4
@@ -192,18 +543,7 @@ class ReadinessCalculator:
             base_score = 0.1
         
         # Adjust based on role relevance
-        role_relevance = {
-            "software_developer": 0.8,
-            "data_analyst": 0.75,
-            "engineer": 0.7,
-            "researcher": 0.65,
-            "teacher": 0.4,
-            "healthcare_professional": 0.5,
-            "accountant": 0.45,
-            "marketing_professional": 0.4
-        }
-        
-        relevance_modifier = role_relevance.get(current_role.lower().replace(" ", "_"), 0.5)
+        relevance_modifier = ROLE_RELEVANCE.get(self.resolver.canonical_role(current_role), 0.5)
         
         return base_score * relevance_modifier
     
@@ -212,16 +552,8 @@ class ReadinessCalculator:
         requirements = self.industry_requirements.get(industry, {})
         preference = requirements.get("education_preference", "technical")
         
-        education_scores = {
-            "phd": {"technical": 1.0, "scientific": 1.0, "engineering": 1.0, "mixed": 0.9},
-            "masters": {"technical": 0.9, "scientific": 0.9, "engineering": 0.9, "mixed": 0.8},
-            "bachelors": {"technical": 0.7, "scientific": 0.7, "engineering": 0.7, "mixed": 0.7},
-            "associate": {"technical": 0.5, "scientific": 0.4, "engineering": 0.5, "mixed": 0.5},
-            "high_school": {"technical": 0.3, "scientific": 0.2, "engineering": 0.3, "mixed": 0.4}
-        }
-        
         education_lower = education.lower()
-        for edu_level, scores in education_scores.items():
+        for edu_level, scores in EDUCATION_SCORES.items():
             if edu_level in education_lower:
                 return scores.get(preference, 0.5)
         
@@ -253,41 +585,20 @@ class ReadinessCalculator:
         if not certifications:
             return 0.0
         
-        # Industry-relevant certification keywords
-        industry_certs = {
-            "AI": ["machine learning", "deep learning", "ai", "tensorflow", "aws ml"],
-            "BLOCKCHAIN": ["blockchain", "ethereum", "solidity", "web3", "defi"],
-            "CYBERSECURITY": ["security+", "cissp", "ceh", "oscp", "ccna security"],
-            "BIOTECH": ["bioinformatics", "clinical", "gcp", "biostatistics"],
-            "AGRITECH": ["precision agriculture", "iot", "sustainability", "gis"],
-            "AQUATECH": ["aquaculture", "marine", "water quality", "environmental"],
-            "SPACETECH": ["aerospace", "systems engineering", "satellite", "space"],
-            "RENEWABLE": ["renewable energy", "solar", "wind", "energy management", "leed"]
-        }
-        
-        relevant_keywords = industry_certs.get(industry, [])
+        relevant_keywords = INDUSTRY_CERTS.get(industry, [])
         cert_text = " ".join(certifications).lower()
         
         matches = sum(1 for keyword in relevant_keywords if keyword in cert_text)
         return min(matches / 3, 1.0)  # Cap at 3 relevant certs
     
-    def _calculate_learning_curve(self, user_skills: Dict, industry: str) -> float:
+    def _calculate_learning_curve(self, skill_mask: int, industry: str) -> float:
         """Calculate learning curve difficulty (inverse - higher score = easier learning)"""
-        requirements = self.industry_requirements.get(industry, {})
-        essential_skills = requirements.get("essential_skills", [])
-        
-        # Flatten user skills
-        all_user_skills = []
-        for category, skills in user_skills.items():
-            all_user_skills.extend([s.lower() for s in skills])
-        
         # Check for foundational skills that make learning easier
-        foundational_skills = ["programming", "data analysis", "mathematics", "problem solving"]
-        foundation_score = sum(1 for skill in foundational_skills if skill in all_user_skills)
-        foundation_score = foundation_score / len(foundational_skills)
+        foundation_score = sum(1 for skill_id in self._foundational_ids if skill_mask >> skill_id & 1)
+        foundation_score = foundation_score / len(FOUNDATIONAL_SKILLS)
         
         # Check existing match with essential skills
-        skill_match = self._calculate_skill_match(user_skills, industry)
+        skill_match = self._calculate_skill_match(skill_mask, industry)
         
         # Learning curve score (higher = easier to learn)
         learning_score = (foundation_score * 0.4 + skill_match * 0.6)
@@ -296,19 +607,7 @@ class ReadinessCalculator:
     
     def _calculate_market_readiness(self, industry: str) -> float:
         """Calculate market demand and readiness"""
-        # Simplified market scores based on current trends
-        market_scores = {
-            "AI": 0.95,
-            "CYBERSECURITY": 0.9,
-            "RENEWABLE": 0.85,
-            "BLOCKCHAIN": 0.8,
-            "BIOTECH": 0.8,
-            "SPACETECH": 0.75,
-            "AGRITECH": 0.75,
-            "AQUATECH": 0.7
-        }
-        
-        return market_scores.get(industry, 0.7)
+        return MARKET_SCORES.get(industry, 0.7)
     
     def _get_readiness_level(self, score: float) -> str:
         """Convert score to readiness level"""
@@ -340,7 +639,7 @@ class ReadinessCalculator:
             return "18-24 months"
     
     def _generate_recommendations(self, skill_score: float, exp_score: float, 
-                                learning_score: float, user_skills: Dict, industry: str) -> List[str]:
+                                learning_score: float, skill_mask: int, industry: str) -> List[str]:
         """Generate personalized recommendations"""
         recommendations = []
         
@@ -354,14 +653,9 @@ class ReadinessCalculator:
             recommendations.append("Strengthen foundational skills in programming and mathematics")
         
         # Industry-specific recommendations
-        requirements = self.industry_requirements.get(industry, {})
-        essential_skills = requirements.get("essential_skills", [])
-        
-        all_user_skills = []
-        for category, skills in user_skills.items():
-            all_user_skills.extend([s.lower() for s in skills])
+        essential_skills = self._skill_ids.get(industry, {}).get("essential_skills", [])
         
-        missing_essentials = [s for s in essential_skills if s.lower() not in all_user_skills]
+        missing_essentials = [s for s, skill_id in essential_skills if not skill_mask >> skill_id & 1]
         if missing_essentials:
             recommendations.append(f"Priority skills to learn: {', '.join(missing_essentials[:3])}")
         
@@ -398,53 +692,33 @@ class ReadinessCalculator:
         
         return strengths
     
-    def _identify_gaps(self, user_skills: Dict, industry: str) -> List[str]:
+    def _identify_gaps(self, skill_mask: int, industry: str) -> List[str]:
         """Identify skill gaps"""
-        requirements = self.industry_requirements.get(industry, {})
-        essential_skills = requirements.get("essential_skills", [])
-        preferred_skills = requirements.get("preferred_skills", [])
-        
-        all_user_skills = []
-        for category, skills in user_skills.items():
-            all_user_skills.extend([s.lower() for s in skills])
+        skill_ids = self._skill_ids.get(industry, {})
+        essential_skills = skill_ids.get("essential_skills", [])
+        preferred_skills = skill_ids.get("preferred_skills", [])
         
         gaps = []
         
         # Essential skill gaps
-        essential_gaps = [s for s in essential_skills if s.lower() not in all_user_skills]
+        essential_gaps = [s for s, skill_id in essential_skills if not skill_mask >> skill_id & 1]
         if essential_gaps:
             gaps.extend([f"Essential: {skill}" for skill in essential_gaps[:3]])
         
         # Preferred skill gaps
-        preferred_gaps = [s for s in preferred_skills if s.lower() not in all_user_skills]
+        preferred_gaps = [s for s, skill_id in preferred_skills if not skill_mask >> skill_id & 1]
         if preferred_gaps:
             gaps.extend([f"Preferred: {skill}" for skill in preferred_gaps[:2]])
         
         return gaps[:5]
     
-    def _generate_next_steps(self, score: float, industry: str) -> List[str]:
+    def _generate_next_steps(self, score: float, industry: str) -> Tuple[str, ...]:
         """Generate immediate next steps"""
         if score >= 0.8:
-            return [
-                "Update resume highlighting relevant skills",
-                "Apply for entry-level positions in the industry",
-                "Join industry-specific communities and forums"
-            ]
+            return NEXT_STEPS["ready"]
         elif score >= 0.6:
-            return [
-                "Complete 1-2 industry-relevant certifications",
-                "Build 2-3 portfolio projects",
-                "Attend industry meetups and conferences"
-            ]
+            return NEXT_STEPS["nearly"]
         elif score >= 0.4:
-            return [
-                "Enroll in comprehensive online courses",
-                "Start with beginner projects",
-                "Find a mentor in the field"
-            ]
+            return NEXT_STEPS["developing"]
         else:
-            return [
-                "Build foundational skills through MOOCs",
-                "Join study groups or bootcamps",
-                "Create a structured learning plan"
-            ]
+            return NEXT_STEPS["foundation"]
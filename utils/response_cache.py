@@ -0,0 +1,194 @@
+"""
+Response Cache
+Two-tier (in-memory LRU + optional SQLite) cache for AI advisor responses
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Case-fold and collapse whitespace so trivially different prompts share a key"""
+    return " ".join(prompt.casefold().split())
+
+
+def make_cache_key(prompt: str, model: str, params: Optional[Dict] = None) -> str:
+    """Stable key over the normalized prompt, model and sampling parameters"""
+    material = json.dumps({"prompt": normalize_prompt(prompt), "model": model,
+                           "params": params or {}}, sort_keys=True)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class MemoryLRUCache:
+    def __init__(self, max_entries: int = 256, ttl_seconds: Optional[float] = 86400):
+        """In-process LRU tier with per-entry expiry"""
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl_seconds: Optional[float] = None):
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires_at = time.time() + ttl if ttl else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache:
+    def __init__(self, path: str, max_entries: int = 10000, ttl_seconds: Optional[float] = 7 * 86400,
+                 touch_interval_seconds: float = 3600):
+        """
+        On-disk tier shared across processes and restarts
+
+        Args:
+            path: Database file
+            max_entries: Rows kept; the least recently used beyond this are evicted
+            ttl_seconds: Default entry lifetime (None or 0 never expires)
+            touch_interval_seconds: A hit refreshes accessed_at only when the stored
+                value is at least this old, so most reads stay read-only
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.touch_interval_seconds = touch_interval_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "expires_at REAL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, expires_at, accessed_at FROM responses WHERE key = ?",
+                                     (key,)).fetchone()
+            if row is None:
+                return None
+            value, expires_at, accessed_at = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            # Recency only needs to be coarse for eviction, so skip the write transaction on most hits
+            if now - accessed_at >= self.touch_interval_seconds:
+                self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+                self._conn.commit()
+            return value
+
+    def set(self, key: str, value: str, ttl_seconds: Optional[float] = None):
+        now = time.time()
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires_at = now + ttl if ttl else None
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                               (key, value, expires_at, now))
+            # Evict least recently used rows beyond the size cap
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM responses "
+                "ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)", (self.max_entries,))
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+class ResponseCache:
+    def __init__(self, memory: Optional[MemoryLRUCache] = None, disk: Optional[SQLiteCache] = None):
+        """
+        Cache advisor responses in a memory tier backed by an optional disk tier
+
+        Args:
+            memory: In-process LRU tier (created with defaults if omitted)
+            disk: Optional persistent tier consulted on memory misses
+        """
+        self.memory = memory if memory is not None else MemoryLRUCache()
+        self.disk = disk
+        self._counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "sets": 0}
+        self._lock = threading.Lock()
+
+    def _count(self, name: str):
+        with self._lock:
+            self._counters[name] += 1
+
+    def get(self, prompt: str, model: str, params: Optional[Dict] = None) -> Optional[str]:
+        """Cached response for a prompt, or None"""
+        key = make_cache_key(prompt, model, params)
+        value = self.memory.get(key)
+        if value is not None:
+            self._count("memory_hits")
+            return value
+
+        if self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self._count("disk_hits")
+                self.memory.set(key, value)
+                return value
+
+        self._count("misses")
+        return None
+
+    def set(self, prompt: str, model: str, value: str, params: Optional[Dict] = None):
+        """Store a response in every tier"""
+        key = make_cache_key(prompt, model, params)
+        self.memory.set(key, value)
+        if self.disk is not None:
+            self.disk.set(key, value)
+        self._count("sets")
+
+    def clear(self):
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters and tier sizes"""
+        with self._lock:
+            stats = dict(self._counters)
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["memory_hits"] + stats["disk_hits"]) / lookups, 3) if lookups else 0.0
+        stats["memory_entries"] = len(self.memory)
+        stats["disk_entries"] = len(self.disk) if self.disk is not None else 0
+        return stats
@@ -0,0 +1,168 @@
+"""
+Result Export
+Columnar Arrow/Parquet export of bulk readiness and transition results
+"""
+
+from typing import List, Optional, Sequence
+import sys
+import os
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import FUTURE_INDUSTRIES
+from utils.results import COMPONENT_NAMES, ReadinessResult, TransitionResult
+
+# Fixed dictionaries so every batch of a file shares one encoding
+READINESS_LEVELS = ("Foundation Building", "Early Stage", "Developing Readiness", "Nearly Ready",
+                    "Ready to Transition")
+DIFFICULTY_LEVELS = ("Very Challenging", "Challenging", "Moderate", "Easy")
+
+# Extensions written as Arrow IPC files (memory-mappable, zero-copy reads)
+ARROW_EXTENSIONS = (".arrow", ".feather", ".ipc")
+
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError("Arrow/Parquet output requires pyarrow (pip install pyarrow)")
+    return pa
+
+
+def result_schema():
+    """Arrow schema of one exported profile x industry row"""
+    pa = _pyarrow()
+    category = pa.dictionary(pa.int8(), pa.string())
+    return pa.schema(
+        [("profile_id", pa.string()), ("industry", category),
+         ("overall_score", pa.float32()), ("readiness_level", category)] +
+        [(name, pa.float32()) for name in COMPONENT_NAMES] +
+        [("time_to_ready", pa.string()), ("months_to_ready", pa.float32()), ("gaps", pa.list_(pa.string())),
+         ("transition_score", pa.float32()), ("difficulty", category), ("estimated_duration", pa.string()),
+         ("skill_gaps", pa.list_(pa.string()))]
+    )
+
+
+def _categorical(values: Sequence[str], levels: Sequence[str]):
+    """Dictionary array over a fixed level list"""
+    pa = _pyarrow()
+    index = {level: code for code, level in enumerate(levels)}
+    try:
+        codes = np.fromiter((index[value] for value in values), dtype=np.int8, count=len(values))
+    except KeyError as exc:
+        raise ValueError(f"{exc.args[0]!r} is not one of {list(levels)}") from None
+    return pa.DictionaryArray.from_arrays(pa.array(codes, pa.int8()), pa.array(list(levels), pa.string()))
+
+
+def _string_lists(lists: Sequence[Sequence[str]]):
+    """List<string> column built from flat values and offsets"""
+    pa = _pyarrow()
+    offsets = np.zeros(len(lists) + 1, dtype=np.int32)
+    np.cumsum([len(values) for values in lists], out=offsets[1:])
+    flat = pa.array([value for values in lists for value in values], pa.string())
+    return pa.ListArray.from_arrays(pa.array(offsets, pa.int32()), flat)
+
+
+def build_record_batch(profile_ids: Sequence, industries: Sequence[str],
+                       readiness: Sequence[ReadinessResult], transitions: Sequence[TransitionResult]):
+    """
+    Assemble one Arrow record batch from per-pair result objects
+
+    Args:
+        profile_ids: Profile ID per row (stored as strings)
+        industries: Target industry per row
+        readiness: ReadinessResult per row
+        transitions: TransitionResult per row
+
+    Returns:
+        pyarrow.RecordBatch in result_schema()
+    """
+    pa = _pyarrow()
+    rows = len(readiness)
+
+    # Component scores are already packed as int16 tenths; unpack them in one buffer
+    tenths = np.frombuffer(b"".join(r.component_scores.tenths.tobytes() for r in readiness),
+                           dtype=np.int16).reshape(rows, len(COMPONENT_NAMES))
+    components = tenths.astype(np.float32) / np.float32(10)
+
+    months = np.array([np.nan if r.months_to_ready is None else r.months_to_ready for r in readiness],
+                      dtype=np.float32)
+    columns = [
+        pa.array([str(profile_id) for profile_id in profile_ids], pa.string()),
+        _categorical(industries, list(FUTURE_INDUSTRIES)),
+        pa.array(np.array([r.overall_score for r in readiness], dtype=np.float32)),
+        _categorical([r.readiness_level for r in readiness], READINESS_LEVELS),
+        *[pa.array(np.ascontiguousarray(components[:, i])) for i in range(len(COMPONENT_NAMES))],
+        pa.array([r.time_to_ready for r in readiness], pa.string()),
+        pa.array(months),
+        _string_lists([r.gaps for r in readiness]),
+        pa.array(np.array([t.transition_score for t in transitions], dtype=np.float32)),
+        _categorical([t.difficulty for t in transitions], DIFFICULTY_LEVELS),
+        pa.array([t.estimated_duration for t in transitions], pa.string()),
+        _string_lists([t.skill_gaps for t in transitions])
+    ]
+    return pa.RecordBatch.from_arrays(columns, schema=result_schema())
+
+
+def infer_format(path: str) -> str:
+    """Output format implied by a file extension"""
+    lowered = path.lower()
+    if lowered.endswith(".parquet"):
+        return "parquet"
+    if lowered.endswith(ARROW_EXTENSIONS):
+        return "arrow"
+    return "jsonl"
+
+
+class ArrowResultWriter:
+    def __init__(self, path: str, output_format: str = "parquet", compression: str = "zstd"):
+        """
+        Write record batches incrementally
+
+        Args:
+            path: Output file
+            output_format: "parquet" (one row group per batch) or "arrow" (IPC file)
+            compression: Parquet codec; Arrow IPC files stay uncompressed so reads are zero-copy
+        """
+        pa = _pyarrow()
+        schema = result_schema()
+        if output_format == "parquet":
+            import pyarrow.parquet as pq
+            self._writer = pq.ParquetWriter(path, schema, compression=compression, use_dictionary=True)
+        else:
+            self._writer = pa.ipc.new_file(path, schema)
+        self.output_format = output_format
+
+    def write(self, batch):
+        if batch is not None and batch.num_rows:
+            self._writer.write_batch(batch)
+
+    def close(self):
+        self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_results(path: str, columns: Optional[List[str]] = None):
+    """
+    Memory-map an exported file as a pyarrow Table
+
+    Arrow IPC files are read zero-copy; Parquet is decoded from a memory map and
+    restores the stored schema, so categorical columns stay dictionary-encoded
+    (pandas categoricals). Float32 score columns convert to NumPy/pandas without copying
+    (table.column(name).to_numpy(), table.to_pandas(split_blocks=True)).
+    """
+    pa = _pyarrow()
+    if infer_format(path) == "arrow":
+        table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+        return table.select(columns) if columns else table
+
+    import pyarrow.parquet as pq
+    return pq.read_table(path, columns=columns, memory_map=True)
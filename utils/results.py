@@ -0,0 +1,128 @@
+"""
+Result Objects
+Compact, immutable readiness and transition results shared by the scoring engines
+"""
+
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+
+COMPONENT_NAMES = ("skill_match", "experience", "education", "projects",
+                   "certifications", "learning_curve", "market_readiness")
+
+# Distinct tuples kept by shared_tuple before the table is reset
+SHARED_TUPLE_LIMIT = 65536
+
+_shared: Dict[Tuple, Tuple] = {}
+
+
+def shared_tuple(values: Iterable) -> Tuple:
+    """Tuple of values, reusing one instance for every equal tuple built so far"""
+    values = tuple(values)
+    shared = _shared.get(values)
+    if shared is None:
+        if len(_shared) >= SHARED_TUPLE_LIMIT:
+            _shared.clear()
+        shared = _shared[values] = values
+    return shared
+
+
+@dataclass(frozen=True, slots=True)
+class ComponentScores:
+    """Component percentages packed as int16 tenths (exact for scores rounded to 0.1)"""
+    tenths: array
+
+    @classmethod
+    def from_percentages(cls, percentages: Iterable[float]) -> "ComponentScores":
+        """Pack percentages given in COMPONENT_NAMES order"""
+        return cls(array("h", [round(value * 10) for value in percentages]))
+
+    def to_dict(self) -> Dict[str, float]:
+        return {name: value / 10 for name, value in zip(COMPONENT_NAMES, self.tenths)}
+
+
+# Read-only percentage attribute per component (scores.skill_match, ...)
+for _index, _name in enumerate(COMPONENT_NAMES):
+    setattr(ComponentScores, _name, property(lambda self, index=_index: self.tenths[index] / 10))
+
+
+@dataclass(frozen=True, slots=True)
+class ReadinessResult:
+    overall_score: float
+    readiness_level: str
+    component_scores: ComponentScores
+    time_to_ready: str
+    months_to_ready: Optional[float]
+    recommendations: Tuple[str, ...]
+    strengths: Tuple[str, ...]
+    gaps: Tuple[str, ...]
+    next_steps: Tuple[str, ...]
+
+    def to_dict(self) -> Dict:
+        """Nested dict in the shape calculate_readiness_score used to return"""
+        return {
+            "overall_score": self.overall_score,
+            "readiness_level": self.readiness_level,
+            "component_scores": self.component_scores.to_dict(),
+            "time_to_ready": self.time_to_ready,
+            "months_to_ready": self.months_to_ready,
+            "recommendations": list(self.recommendations),
+            "strengths": list(self.strengths),
+            "gaps": list(self.gaps),
+            "next_steps": list(self.next_steps)
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class PathStep:
+    step: int
+    title: str
+    duration: str
+    skills: Tuple[str, ...]
+    resources: Tuple[str, ...]
+
+    @classmethod
+    def from_dict(cls, step: Mapping) -> "PathStep":
+        return cls(step["step"], step["title"], step["duration"],
+                   shared_tuple(step["skills"]), shared_tuple(step["resources"]))
+
+    def to_dict(self) -> Dict:
+        return {"step": self.step, "title": self.title, "duration": self.duration,
+                "skills": list(self.skills), "resources": list(self.resources)}
+
+
+@dataclass(frozen=True, slots=True)
+class TransitionResult:
+    transition_score: float
+    difficulty: str
+    estimated_duration: str
+    career_path: Tuple[PathStep, ...]
+    transferable_skills: Tuple[str, ...]
+    skill_gaps: Tuple[str, ...]
+    success_factors: Tuple[str, ...]
+    potential_roles: Tuple[str, ...]
+    # How the free-text title was resolved (role None when unrecognised)
+    resolved_role: Optional[str] = None
+    matched_title: Optional[str] = None
+    role_confidence: float = 0.0
+
+    def with_role_match(self, role: Optional[str], title: Optional[str], confidence: float) -> "TransitionResult":
+        """Copy sharing every field but the role resolution (cheaper than dataclasses.replace)"""
+        return TransitionResult(self.transition_score, self.difficulty, self.estimated_duration, self.career_path,
+                                self.transferable_skills, self.skill_gaps, self.success_factors,
+                                self.potential_roles, role, title, confidence)
+
+    def to_dict(self) -> Dict:
+        """Nested dict in the shape map_career_transition used to return"""
+        return {
+            "transition_score": self.transition_score,
+            "difficulty": self.difficulty,
+            "estimated_duration": self.estimated_duration,
+            "career_path": [step.to_dict() for step in self.career_path],
+            "transferable_skills": list(self.transferable_skills),
+            "skill_gaps": list(self.skill_gaps),
+            "success_factors": list(self.success_factors),
+            "potential_roles": list(self.potential_roles),
+            "role_match": {"role": self.resolved_role, "title": self.matched_title,
+                           "confidence": self.role_confidence}
+        }
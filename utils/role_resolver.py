@@ -0,0 +1,232 @@
+"""
+Role Resolver
+Maps free-text job titles to the canonical roles used by the scoring engines
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# Titles that mean each canonical role (keys match CareerMapper's transition matrix)
+ROLE_SYNONYMS = {
+    "accountant": [
+        "accountant", "cpa", "certified public accountant", "chartered accountant", "aca", "acca",
+        "bookkeeper", "auditor", "internal auditor", "tax accountant", "tax advisor", "controller",
+        "financial controller", "accounts payable clerk", "accounts receivable clerk", "payroll specialist",
+        "financial analyst", "finance manager", "cfo", "chief financial officer", "treasury analyst"
+    ],
+    "software_developer": [
+        "software developer", "software engineer", "swe", "sde", "programmer", "coder",
+        "web developer", "frontend developer", "front end developer", "backend developer",
+        "back end developer", "full stack developer", "fullstack engineer", "mobile developer",
+        "ios developer", "android developer", "application developer", "devops engineer",
+        "site reliability engineer", "sre", "game developer", "qa engineer", "test automation engineer",
+        "cto", "chief technology officer", "tech lead", "engineering manager"
+    ],
+    "data_analyst": [
+        "data analyst", "business analyst", "bi analyst", "business intelligence analyst",
+        "reporting analyst", "data scientist", "analytics engineer", "data engineer",
+        "quantitative analyst", "quant", "statistician", "insights analyst", "operations analyst",
+        "product analyst", "marketing analyst"
+    ],
+    "engineer": [
+        "engineer", "mechanical engineer", "electrical engineer", "civil engineer", "chemical engineer",
+        "industrial engineer", "manufacturing engineer", "process engineer", "structural engineer",
+        "aerospace engineer", "systems engineer", "hardware engineer", "electronics engineer",
+        "project engineer", "design engineer", "field engineer", "maintenance engineer", "technician",
+        "pe", "professional engineer"
+    ],
+    "teacher": [
+        "teacher", "educator", "instructor", "lecturer", "professor", "tutor", "trainer",
+        "school teacher", "math teacher", "science teacher", "high school teacher", "teaching assistant",
+        "curriculum developer", "instructional designer", "principal teacher", "faculty member"
+    ],
+    "healthcare_professional": [
+        "healthcare professional", "nurse", "registered nurse", "rn", "nurse practitioner", "np",
+        "doctor", "physician", "md", "surgeon", "pharmacist", "physiotherapist", "physical therapist",
+        "medical technologist", "lab technician", "clinician", "paramedic", "dentist", "radiographer",
+        "medical assistant", "caregiver", "clinical research coordinator"
+    ],
+    "marketing_professional": [
+        "marketing professional", "marketer", "marketing manager", "digital marketer",
+        "digital marketing specialist", "seo specialist", "content marketer", "content strategist",
+        "social media manager", "brand manager", "growth marketer", "product marketing manager",
+        "marketing coordinator", "communications manager", "pr specialist", "public relations manager",
+        "copywriter", "cmo", "chief marketing officer", "sales manager"
+    ],
+    "researcher": [
+        "researcher", "research scientist", "scientist", "research associate", "research assistant",
+        "postdoc", "postdoctoral researcher", "postdoctoral fellow", "phd student", "phd candidate",
+        "lab scientist", "principal investigator", "pi", "research fellow", "r&d engineer",
+        "research engineer", "biologist", "chemist", "physicist"
+    ]
+}
+
+# Seniority and grade words ignored when matching titles
+SENIORITY_WORDS = frozenset({
+    "senior", "sr", "junior", "jr", "lead", "principal", "staff", "head", "chief", "associate",
+    "assistant", "entry", "level", "mid", "intern", "trainee", "graduate", "i", "ii", "iii", "iv"
+})
+
+# Job-family and cross-functional words that say nothing about the role on their own
+# ("HR manager" is not a "brand manager", a "project manager" is not a "project engineer")
+GENERIC_WORDS = frozenset({
+    "manager", "management", "mgr", "specialist", "officer", "coordinator", "director", "consultant",
+    "executive", "administrator", "admin", "representative", "rep", "professional", "member", "worker",
+    "expert", "advisor", "adviser", "supervisor", "partner", "vp", "president", "project", "program", "programme"
+})
+
+# Dice similarity below which a title is treated as unknown
+MIN_CONFIDENCE = 0.5
+
+# Fuzzy candidates checked for a shared distinctive word, best first
+MAX_CANDIDATES = 32
+
+
+@lru_cache(maxsize=8192)
+def normalize_title(title: str) -> str:
+    """Lowercase, keep letters/digits/&, and drop seniority words unless nothing else is left"""
+    words = re.sub(r"[^a-z0-9&+#]+", " ", title.lower()).split()
+    kept = [word for word in words if word not in SENIORITY_WORDS]
+    return " ".join(kept or words)
+
+
+def distinctive_words(normalized: str) -> Tuple[str, ...]:
+    """Words of a normalized title that are neither seniority nor generic job-family words"""
+    return tuple(word for word in normalized.split() if word not in SENIORITY_WORDS and word not in GENERIC_WORDS)
+
+
+def within_one_edit(a: str, b: str) -> bool:
+    """Whether two words differ by at most one insertion, deletion, substitution or adjacent swap"""
+    if a == b:
+        return True
+    if abs(len(a) - len(b)) > 1:
+        return False
+    prefix = 0
+    while prefix < min(len(a), len(b)) and a[prefix] == b[prefix]:
+        prefix += 1
+    if len(a) == len(b):
+        return (a[prefix + 1:] == b[prefix + 1:] or
+                (a[prefix + 2:] == b[prefix + 2:] and a[prefix:prefix + 2] == b[prefix:prefix + 2][::-1]))
+    shorter, longer = (a, b) if len(a) < len(b) else (b, a)
+    return shorter[prefix:] == longer[prefix + 1:]
+
+
+def title_trigrams(normalized: str) -> List[str]:
+    """Distinct character trigrams of a normalized title, padded at the ends"""
+    padded = f"  {normalized} "
+    return list(dict.fromkeys(padded[i:i + 3] for i in range(len(padded) - 2)))
+
+
+class RoleResolver:
+    def __init__(self, synonyms: Optional[Dict[str, Iterable[str]]] = None, cache_size: int = 4096):
+        """
+        Index synonym titles for fuzzy lookup
+
+        Args:
+            synonyms: Canonical role -> titles meaning that role (defaults to ROLE_SYNONYMS)
+            cache_size: Resolved titles kept in the LRU cache
+        """
+        synonyms = ROLE_SYNONYMS if synonyms is None else synonyms
+        self.roles: List[str] = list(synonyms)
+
+        self.titles: List[str] = []
+        role_codes: List[int] = []
+        self._exact: Dict[str, int] = {}
+        for code, role in enumerate(self.roles):
+            for title in [role.replace("_", " "), *synonyms[role]]:
+                key = normalize_title(title)
+                if key and key not in self._exact:
+                    self._exact[key] = len(self.titles)
+                    self.titles.append(title)
+                    role_codes.append(code)
+        self._role_codes = np.array(role_codes, dtype=np.int32)
+
+        # Trigram postings: title indices containing each trigram, ascending
+        postings: Dict[str, List[int]] = {}
+        gram_counts = np.empty(len(self.titles), dtype=np.float64)
+        for key, index in self._exact.items():
+            grams = title_trigrams(key)
+            gram_counts[index] = len(grams)
+            for gram in grams:
+                postings.setdefault(gram, []).append(index)
+        self._postings = {gram: np.array(ids, dtype=np.int32) for gram, ids in postings.items()}
+        self._gram_counts = gram_counts
+        self._words: List[Tuple[str, ...]] = [()] * len(self.titles)
+        self._joined: List[str] = [""] * len(self.titles)
+        for key, index in self._exact.items():
+            self._words[index] = distinctive_words(key)
+            self._joined[index] = key.replace(" ", "")
+
+        self._resolve_cached = lru_cache(maxsize=cache_size)(self._resolve)
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def resolve(self, title: str) -> Dict:
+        """
+        Resolve a free-text job title to a canonical role
+
+        Args:
+            title: Job title as entered ("Sr. Software Engineer", "CPA")
+
+        Returns:
+            role, matched synonym title and confidence (trigram Dice similarity,
+            1.0 for an exact match); role is None below MIN_CONFIDENCE, when no
+            close title shares a distinctive word (within one typo) with the
+            query, and for titles made only of seniority/generic words
+        """
+        return dict(self._resolve_cached(title or ""))
+
+    def canonical_role(self, title: str) -> str:
+        """Canonical role for a title, or its underscored form when unknown"""
+        role = self._resolve_cached(title or "")["role"]
+        return role if role is not None else (title or "").lower().replace(" ", "_")
+
+    def _resolve(self, title: str) -> Dict:
+        key = normalize_title(title.replace("_", " "))
+        index = self._exact.get(key)
+        if index is not None:
+            return self._match(index, 1.0)
+
+        grams = title_trigrams(key)
+        hits = [self._postings[gram] for gram in grams if gram in self._postings]
+        words = distinctive_words(key)
+        if not key or not hits or not words:
+            return {"role": None, "title": None, "confidence": 0.0}
+
+        # Dice coefficient over trigram sets: 2|A∩B| / (|A| + |B|)
+        overlap = np.bincount(np.concatenate(hits), minlength=len(self.titles))
+        dice = 2.0 * overlap / (len(grams) + self._gram_counts)
+        best = int(dice.argmax())
+        confidence = round(float(dice[best]), 3)
+        if confidence < MIN_CONFIDENCE:
+            return {"role": None, "title": self.titles[best], "confidence": confidence}
+
+        # Shared generic words ("manager", "intern") lift Dice on their own, so a
+        # match also needs a distinctive word in common, allowing one typo (or
+        # the whole title within one typo, for a dropped or misplaced space)
+        joined = key.replace(" ", "")
+        candidates = np.flatnonzero(dice >= MIN_CONFIDENCE)
+        if len(candidates) > MAX_CANDIDATES:
+            candidates = candidates[np.argpartition(-dice[candidates], MAX_CANDIDATES)[:MAX_CANDIDATES]]
+        for index in candidates[np.lexsort((candidates, -dice[candidates]))]:
+            if (within_one_edit(joined, self._joined[index]) or
+                    any(within_one_edit(word, other) for word in words for other in self._words[index])):
+                return self._match(int(index), round(float(dice[index]), 3))
+        return {"role": None, "title": self.titles[best], "confidence": confidence}
+
+    def _match(self, index: int, confidence: float) -> Dict:
+        return {"role": self.roles[self._role_codes[index]], "title": self.titles[index],
+                "confidence": confidence}
+
+    def clear_cache(self):
+        self._resolve_cached.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def get_role_resolver() -> RoleResolver:
+    """Process-wide resolver over ROLE_SYNONYMS"""
+    return RoleResolver()
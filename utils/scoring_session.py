@@ -0,0 +1,201 @@
+"""
+Scoring Session
+Incrementally maintained readiness components for one profile being edited
+"""
+
+from collections import Counter
+from typing import Dict, List, Optional, Set
+import sys
+import os
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.readiness_score import FOUNDATIONAL_SKILLS, ReadinessCalculator
+from utils.results import COMPONENT_NAMES
+from utils.skill_vocabulary import SkillVocabulary, normalize_skill
+
+# Profile fields other than skills, each feeding one cached component
+SCALAR_FIELDS = ("experience_years", "current_role", "education_level", "projects", "certifications")
+
+
+class ScoringSession:
+    def __init__(self, calculator: Optional[ReadinessCalculator] = None, industries: Optional[List[str]] = None):
+        """
+        Start an empty profile whose scores are updated edit by edit
+
+        Args:
+            calculator: Readiness engine whose requirements and formulas are used
+            industries: Industries scored (defaults to every readiness industry)
+        """
+        self.calculator = calculator or ReadinessCalculator()
+        self.vocabulary = self.calculator.vocabulary
+        self.industries = list(industries or self.calculator.industry_requirements)
+
+        # Requirement skill ID -> [(column, essential weight, preferred weight)]
+        weights: Dict[int, Dict[int, List[int]]] = {}
+        for column, industry in enumerate(self.industries):
+            skill_ids = self.calculator._skill_ids.get(industry, {})
+            for kind, slot in (("essential_skills", 0), ("preferred_skills", 1)):
+                for _, skill_id in skill_ids.get(kind, []):
+                    weights.setdefault(skill_id, {}).setdefault(column, [0, 0])[slot] += 1
+        self._requirements = {skill_id: [(column, e, p) for column, (e, p) in columns.items()]
+                              for skill_id, columns in weights.items()}
+        self._foundational = Counter(self.calculator._foundational_ids)
+        self._essential_totals = [len(self.calculator._skill_ids.get(i, {}).get("essential_skills", []))
+                                  for i in self.industries]
+        self._preferred_totals = [len(self.calculator._skill_ids.get(i, {}).get("preferred_skills", []))
+                                  for i in self.industries]
+        self._market = [self.calculator._calculate_market_readiness(i) for i in self.industries]
+
+        # Skill state: user skill -> (entries, satisfied IDs), and how many skills satisfy each ID
+        self._skills: Dict[str, List] = {}
+        self._satisfied: Counter = Counter()
+        self._essential_hits = [0] * len(self.industries)
+        self._preferred_hits = [0] * len(self.industries)
+        self._foundation_hits = 0
+
+        self.profile = {"skills": {"general": []}, "experience_years": 0, "education_level": "",
+                        "current_role": "", "projects": [], "certifications": []}
+        self._experience = 0.0
+        self._education: List[float] = []
+        self._projects: List[float] = []
+        self._certifications: List[float] = []
+        self._scores: Optional[Dict[str, np.ndarray]] = None
+        for field in SCALAR_FIELDS:
+            self._refresh(field)
+
+    def add_skill(self, name: str):
+        """Add one skill; only the requirement columns it satisfies are touched"""
+        key = normalize_skill(name)
+        entry = self._skills.get(key)
+        if entry is not None:
+            entry[0] += 1
+        else:
+            satisfied = SkillVocabulary.ids_of_mask(self.vocabulary.mask([name]))
+            self._skills[key] = [1, satisfied]
+            for skill_id in satisfied:
+                self._satisfied[skill_id] += 1
+                if self._satisfied[skill_id] == 1:
+                    self._count(skill_id, 1)
+        self.profile["skills"]["general"].append(name)
+        self._scores = None
+
+    def remove_skill(self, name: str):
+        """Remove one occurrence of a skill (no-op when the profile does not have it)"""
+        key = normalize_skill(name)
+        entry = self._skills.get(key)
+        if entry is None:
+            return
+        entry[0] -= 1
+        if entry[0] == 0:
+            del self._skills[key]
+            for skill_id in entry[1]:
+                self._satisfied[skill_id] -= 1
+                if self._satisfied[skill_id] == 0:
+                    del self._satisfied[skill_id]
+                    self._count(skill_id, -1)
+
+        names = self.profile["skills"]["general"]
+        names.pop(next(i for i, held in enumerate(names) if normalize_skill(held) == key))
+        self._scores = None
+
+    def set_field(self, field: str, value):
+        """Change one non-skill input, recomputing only the component it feeds"""
+        if field not in SCALAR_FIELDS:
+            raise ValueError(f"unknown profile field {field!r}")
+        self.profile[field] = list(value) if field in ("projects", "certifications") else value
+        self._refresh(field)
+        self._scores = None
+
+    def update(self, profile: Dict) -> Set[str]:
+        """
+        Bring the session in line with a full profile, applying only the differences
+
+        Args:
+            profile: Profile in the shape calculate_readiness_score expects
+
+        Returns:
+            Names of the inputs that changed ("skills" and/or SCALAR_FIELDS entries)
+        """
+        changed = set()
+        wanted = Counter(name for names in profile.get("skills", {}).values() for name in names)
+        held = Counter(self.profile["skills"]["general"])
+        for name, count in (held - wanted).items():
+            for _ in range(count):
+                self.remove_skill(name)
+        for name, count in (wanted - held).items():
+            for _ in range(count):
+                self.add_skill(name)
+        if wanted != held:
+            changed.add("skills")
+
+        defaults = {"experience_years": 0, "education_level": "", "current_role": ""}
+        for field in SCALAR_FIELDS:
+            value = profile.get(field, defaults.get(field, []))
+            current = self.profile[field]
+            if (list(value) if field in ("projects", "certifications") else value) != current:
+                self.set_field(field, value)
+                changed.add(field)
+        return changed
+
+    def scores(self) -> Dict[str, np.ndarray]:
+        """Current scores in the shape of ReadinessCalculator.score_matrices for one profile (reused until the next edit)"""
+        if self._scores is not None:
+            return self._scores
+        weights = self.calculator.weights
+        foundation = self._foundation_hits / len(FOUNDATIONAL_SKILLS)
+        columns = {name: [] for name in ("overall", *COMPONENT_NAMES)}
+        for column in range(len(self.industries)):
+            essential_total = self._essential_totals[column]
+            preferred_total = self._preferred_totals[column]
+            essential_score = self._essential_hits[column] / essential_total if essential_total else 0
+            preferred_score = self._preferred_hits[column] / preferred_total if preferred_total else 0
+            skill_match = essential_score * 0.6 + preferred_score * 0.4
+            learning_curve = foundation * 0.4 + skill_match * 0.6
+            market = self._market[column]
+
+            final = (
+                skill_match * weights["current_skills_match"] +
+                self._experience * weights["transferable_skills"] +
+                learning_curve * weights["learning_curve"] +
+                market * weights["market_demand"]
+            )
+            bonus = (self._education[column] + self._projects[column] + self._certifications[column]) / 3 * 0.1
+
+            values = (min(final + bonus, 1.0), skill_match, self._experience, self._education[column],
+                      self._projects[column], self._certifications[column], learning_curve, market)
+            for name, value in zip(columns, values):
+                columns[name].append(value)
+
+        scores = {name: np.array([values], dtype=float) for name, values in columns.items()}
+        skills = np.zeros((1, len(self.vocabulary)))
+        skills[0, list(self._satisfied)] = 1.0
+        scores["skills"] = skills
+        self._scores = scores
+        return scores
+
+    def _count(self, skill_id: int, step: int):
+        """Adjust requirement hit counts when a skill ID becomes (un)satisfied"""
+        for column, essential, preferred in self._requirements.get(skill_id, ()):
+            self._essential_hits[column] += essential * step
+            self._preferred_hits[column] += preferred * step
+        self._foundation_hits += self._foundational.get(skill_id, 0) * step
+
+    def _refresh(self, field: str):
+        """Recompute the cached component fed by one scalar input"""
+        calculator, profile = self.calculator, self.profile
+        if field in ("experience_years", "current_role"):
+            self._experience = calculator._calculate_experience_score(profile["experience_years"],
+                                                                      profile["current_role"], "")
+        elif field == "education_level":
+            self._education = [calculator._calculate_education_score(profile["education_level"], industry)
+                               for industry in self.industries]
+        elif field == "projects":
+            self._projects = [calculator._calculate_project_score(profile["projects"], industry)
+                              for industry in self.industries]
+        else:
+            self._certifications = [calculator._calculate_certification_score(profile["certifications"], industry)
+                                    for industry in self.industries]
@@ -0,0 +1,326 @@
+"""
+Skill Prerequisite Graph
+Per-industry prerequisite DAG over dataset skills with budget-aware critical-path scheduling
+"""
+
+import math
+import threading
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import LEARNING_SCHEDULE
+from utils.data_loader import INDUSTRY_SKILLS_CSV, file_mtime, industry_key, load_industry_skills
+from utils.skill_vocabulary import SkillVocabulary, get_vocabulary, normalize_skill
+
+# Learning order implied by skill_category: a skill depends on every skill of
+# the nearest lower tier present in the same industry
+CATEGORY_TIERS = {
+    "Foundation": 0,
+    "Programming": 1,
+    "Operating System": 1,
+    "Knowledge": 1,
+    "Core Knowledge": 2,
+    "Tools": 2,
+    "Platform": 2,
+    "Technology": 2,
+    "Practical": 2,
+    "Framework": 3,
+    "Specialization": 4
+}
+DEFAULT_TIER = 2
+
+# Prerequisites within a tier (skill -> skills to learn first), applied where both exist
+EXPLICIT_PREREQUISITES = {
+    "Deep Learning": ["Machine Learning"],
+    "Penetration Testing": ["Network Security"],
+    "Ethical Hacking": ["Network Security"],
+    "Incident Response": ["SIEM"],
+    "Genomics": ["Bioinformatics"],
+    "Precision Agriculture": ["GIS"],
+    "Remote Sensing": ["GIS"],
+    "Aquaculture Systems": ["Water Quality Analysis"],
+    "Energy Storage": ["Power Electronics"]
+}
+
+WEEKS_PER_MONTH = 4.345
+
+# Distinct missing-skill sets whose schedules are kept per graph
+SCHEDULE_CACHE_SIZE = 4096
+
+
+def format_months(months: float) -> str:
+    """Readable time to readiness ("Ready now", "1 month", "7 months")"""
+    if months <= 0:
+        return "Ready now"
+    whole = math.ceil(months)
+    return "1 month" if whole == 1 else f"{whole} months"
+
+
+class LearningSchedule:
+    def __init__(self, graph: "SkillGraph", remaining: Set[int], week: float = 0.0,
+                 progress: Optional[Dict[int, float]] = None, started: Optional[Dict[int, float]] = None):
+        """
+        Schedule of the skills still to learn, re-plannable as skills complete
+
+        Args:
+            graph: Prerequisite graph the schedule runs over
+            remaining: Node indices not yet learned
+            week: Week the schedule starts from
+            progress: Hours still needed by skills already part-learned (others need all their hours)
+            started: Week each part-learned skill was started
+        """
+        self.graph = graph
+        self.remaining = set(remaining)
+        self.start_week = week
+        self.progress = dict(progress or {})
+        self.started = dict(started or {})
+        self.entries, self.total_weeks, _, _ = graph._simulate(self.remaining, week, self.progress, self.started)
+
+    @property
+    def months_to_ready(self) -> float:
+        return round(self.total_weeks / WEEKS_PER_MONTH, 1)
+
+    @property
+    def time_to_ready(self) -> str:
+        return format_months(self.months_to_ready)
+
+    def complete(self, skill: str, week: Optional[float] = None) -> "LearningSchedule":
+        """
+        Re-plan after a skill is finished (early, late or out of order)
+
+        The plan is played forward to that week so skills learned alongside it
+        keep their progress, then only the remaining subgraph is simulated
+        again; the graph and its critical-path priorities are reused. Skills the
+        plan had finished by then stay in the schedule, due at that week.
+
+        Args:
+            skill: Skill just learned
+            week: Week it was finished (defaults to its planned end)
+
+        Returns:
+            New schedule for the skills still remaining, starting at that week
+        """
+        node = self.graph.node(skill)
+        if week is None:
+            week = next((entry["end_week"] for entry in self.entries if entry["node"] == node), self.start_week)
+        week = max(week, self.start_week)
+        _, _, left, started = self.graph._simulate(self.remaining, self.start_week, self.progress,
+                                                   self.started, until=week)
+        remaining = self.remaining - {node}
+        progress = {other: left.get(other, 0.0) for other in remaining if other in started}
+        return LearningSchedule(self.graph, remaining, week, progress,
+                                {other: started[other] for other in progress})
+
+    def critical_path(self) -> List[str]:
+        """Longest prerequisite chain, in learning-hours, among the remaining skills"""
+        return self.graph.critical_path(self.remaining)
+
+    def to_dict(self) -> Dict:
+        return {
+            "schedule": [{key: value for key, value in entry.items() if key != "node"} for entry in self.entries],
+            "total_weeks": self.total_weeks,
+            "months_to_ready": self.months_to_ready,
+            "time_to_ready": self.time_to_ready,
+            "critical_path": self.critical_path()
+        }
+
+
+class SkillGraph:
+    def __init__(self, industry: str, skills: Iterable[Dict], vocabulary: Optional[SkillVocabulary] = None,
+                 weekly_hours: float = None, max_hours_per_skill: float = None):
+        """
+        Build an industry's prerequisite DAG
+
+        Args:
+            industry: Engine industry key
+            skills: Rows with skill_name, skill_category and learning_hours
+            vocabulary: Vocabulary used to map user skill masks onto nodes
+            weekly_hours: Study hours available per week
+            max_hours_per_skill: Most hours per week one skill can absorb, so a
+                larger budget is spread over skills learned side by side
+        """
+        self.industry = industry
+        self.vocabulary = vocabulary or get_vocabulary()
+        self.weekly_hours = weekly_hours or LEARNING_SCHEDULE["weekly_hours"]
+        self.max_hours_per_skill = max_hours_per_skill or LEARNING_SCHEDULE["max_hours_per_skill"]
+
+        self.names: List[str] = []
+        self.hours: List[float] = []
+        self.tiers: List[int] = []
+        index: Dict[str, int] = {}
+        for row in skills:
+            key = normalize_skill(row["skill_name"])
+            if key in index:
+                continue
+            index[key] = len(self.names)
+            self.names.append(row["skill_name"])
+            self.hours.append(float(row["learning_hours"]))
+            self.tiers.append(CATEGORY_TIERS.get(row["skill_category"], DEFAULT_TIER))
+        self._index = index
+        self.vocab_ids = [self.vocabulary.intern(name) for name in self.names]
+
+        self.prerequisites: List[Set[int]] = [set() for _ in self.names]
+        present = sorted(set(self.tiers))
+        for node, tier in enumerate(self.tiers):
+            lower = [t for t in present if t < tier]
+            if lower:
+                self.prerequisites[node].update(i for i, t in enumerate(self.tiers) if t == lower[-1])
+        for skill, before in EXPLICIT_PREREQUISITES.items():
+            node = index.get(normalize_skill(skill))
+            if node is not None:
+                self.prerequisites[node].update(index[normalize_skill(b)] for b in before
+                                                if normalize_skill(b) in index)
+
+        self.dependents: List[Set[int]] = [set() for _ in self.names]
+        for node, before in enumerate(self.prerequisites):
+            for prerequisite in before:
+                self.dependents[prerequisite].add(node)
+
+        self.order = self._topological_order()
+        # Critical-path priority: hours on the longest chain starting at each skill
+        self.bottom_level = [0.0] * len(self.names)
+        for node in reversed(self.order):
+            tail = max((self.bottom_level[d] for d in self.dependents[node]), default=0.0)
+            self.bottom_level[node] = self.hours[node] + tail
+
+        self._schedules: Dict[int, LearningSchedule] = {}
+        self._lock = threading.Lock()
+
+    def _topological_order(self) -> List[int]:
+        """Kahn's algorithm; raises ValueError on a prerequisite cycle"""
+        pending = [len(before) for before in self.prerequisites]
+        ready = [node for node, count in enumerate(pending) if count == 0]
+        order = []
+        while ready:
+            node = ready.pop()
+            order.append(node)
+            for dependent in self.dependents[node]:
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    ready.append(dependent)
+        if len(order) != len(self.names):
+            cycle = [self.names[node] for node, count in enumerate(pending) if count]
+            raise ValueError(f"Prerequisite cycle in {self.industry}: {', '.join(cycle)}")
+        return order
+
+    def node(self, skill: str) -> Optional[int]:
+        return self._index.get(normalize_skill(skill))
+
+    def missing_code(self, skill_mask: int) -> int:
+        """Bit i set when node i is not covered by a vocabulary skill mask"""
+        code = 0
+        for node, skill_id in enumerate(self.vocab_ids):
+            if not skill_mask >> skill_id & 1:
+                code |= 1 << node
+        return code
+
+    def schedule(self, remaining_code: int) -> LearningSchedule:
+        """Schedule for the nodes set in remaining_code, cached per code"""
+        schedule = self._schedules.get(remaining_code)
+        if schedule is None:
+            remaining = {node for node in range(len(self.names)) if remaining_code >> node & 1}
+            schedule = LearningSchedule(self, remaining)
+            with self._lock:
+                if len(self._schedules) >= SCHEDULE_CACHE_SIZE:
+                    self._schedules.clear()
+                self._schedules[remaining_code] = schedule
+        return schedule
+
+    def schedule_for_mask(self, skill_mask: int) -> LearningSchedule:
+        """Schedule for everything a vocabulary skill mask does not cover"""
+        return self.schedule(self.missing_code(skill_mask))
+
+    def schedule_for_skills(self, known_skills: Iterable[str]) -> LearningSchedule:
+        """Schedule for everything not in a list of known skill names"""
+        return self.schedule_for_mask(self.vocabulary.mask(known_skills))
+
+    def _simulate(self, remaining: Set[int], week: float, progress: Optional[Dict[int, float]] = None,
+                  started: Optional[Dict[int, float]] = None, until: Optional[float] = None):
+        """
+        Run the schedule: each week the budget goes to ready skills in
+        critical-path order, at most max_hours_per_skill each
+
+        Args:
+            remaining: Nodes still to learn
+            week: Start week
+            progress: Hours still needed by part-learned nodes (others need their full hours)
+            started: Start week of part-learned nodes
+            until: Stop at this week instead of running to the end
+
+        Returns:
+            (entries in start order, total weeks from the start week,
+             hours left per unfinished node, start week per started node)
+        """
+        left = {node: self.hours[node] for node in remaining}
+        left.update((node, hours) for node, hours in (progress or {}).items() if node in left)
+        started = dict(started or {})
+        entries = []
+        now = week
+        while left and (until is None or now < until):
+            ready = [node for node in left if not (self.prerequisites[node] & left.keys())]
+            # Skills already due (no hours left) finish first, then critical-path order
+            ready.sort(key=lambda node: (left[node] > 1e-9, -self.bottom_level[node], self.names[node]))
+            budget = self.weekly_hours
+            rates = {}
+            for node in ready:
+                if budget <= 0:
+                    break
+                rates[node] = min(self.max_hours_per_skill, budget)
+                budget -= rates[node]
+                started.setdefault(node, now)
+
+            step = min(left[node] / rate for node, rate in rates.items())
+            if until is not None:
+                step = min(step, until - now)
+            now += step
+            for node, rate in rates.items():
+                left[node] -= rate * step
+                if left[node] <= 1e-9:
+                    del left[node]
+                    entries.append({
+                        "node": node,
+                        "skill": self.names[node],
+                        "hours": self.hours[node],
+                        "start_week": round(started[node], 1),
+                        "end_week": round(now, 1)
+                    })
+        entries.sort(key=lambda entry: (entry["start_week"], entry["end_week"]))
+        return entries, round(now - week, 1), left, started
+
+    def critical_path(self, remaining: Optional[Set[int]] = None) -> List[str]:
+        """Longest chain by learning hours through the remaining nodes"""
+        remaining = set(range(len(self.names))) if remaining is None else remaining
+        best: Dict[int, float] = {}
+        successor: Dict[int, Optional[int]] = {}
+        for node in reversed(self.order):
+            if node not in remaining:
+                continue
+            nxt = max((d for d in self.dependents[node] if d in remaining), key=lambda d: best[d], default=None)
+            best[node] = self.hours[node] + (best[nxt] if nxt is not None else 0.0)
+            successor[node] = nxt
+        if not best:
+            return []
+        node = max(best, key=best.get)
+        path = []
+        while node is not None:
+            path.append(self.names[node])
+            node = successor[node]
+        return path
+
+
+def get_skill_graph(industry: str, path: str = INDUSTRY_SKILLS_CSV) -> SkillGraph:
+    """Process-wide prerequisite graph for an industry, rebuilt when the dataset changes"""
+    return _graph(industry, path, file_mtime(path))
+
+
+@lru_cache(maxsize=32)
+def _graph(industry: str, path: str, mtime_ns: int) -> SkillGraph:
+    skills = load_industry_skills(path)
+    rows = skills[skills["industry"].astype(str).map(industry_key) == industry]
+    return SkillGraph(industry, rows[["skill_name", "skill_category", "learning_hours"]]
+                      .astype({"skill_name": object, "skill_category": object}).to_dict("records"))
@@ -0,0 +1,143 @@
+"""
+Skill Heatmap
+Industry x skill requirement matrix and vectorized profile match encoding for heatmaps
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.data_loader import INDUSTRY_SKILLS_CSV, file_mtime, load_industry_skills
+from utils.skill_vocabulary import SkillVocabulary, get_vocabulary
+
+# Cell weight per importance level when weighting is on (0 means not required)
+IMPORTANCE_WEIGHTS = {"Essential": 3, "Important": 2, "Optional": 1}
+
+# A profile is a list of skill names or a categorized skills dict
+Profile = Union[Iterable[str], Dict[str, List[str]]]
+
+
+class RequirementMatrix:
+    def __init__(self, industries: List[str], skills: List[str], weights: np.ndarray,
+                 vocabulary: Optional[SkillVocabulary] = None):
+        """
+        Which industries require which skills, and how strongly
+
+        Args:
+            industries: Row labels
+            skills: Column labels (requirement skill names)
+            weights: industries x skills importance weights, 0 where not required
+            vocabulary: Vocabulary used to match profile skills (shared one by default)
+        """
+        self.industries = list(industries)
+        self.skills = list(skills)
+        self.weights = np.asarray(weights, dtype=np.uint8)
+        self.weights.flags.writeable = False
+        self.required = self.weights > 0
+        self.required.flags.writeable = False
+        self.vocabulary = vocabulary or get_vocabulary()
+        # Interning keeps composite requirements ("R/Python") matched by their parts
+        self.skill_ids = np.array([self.vocabulary.intern(skill) for skill in self.skills], dtype=np.intp)
+
+    @property
+    def shape(self):
+        return self.weights.shape
+
+    def holdings(self, profiles: Sequence[Profile]) -> np.ndarray:
+        """
+        Which requirement skills each profile covers
+
+        Args:
+            profiles: Skill name lists or categorized skills dicts
+
+        Returns:
+            profiles x skills boolean matrix
+        """
+        names = [[name for names in profile.values() for name in names] if isinstance(profile, dict) else profile
+                 for profile in profiles]
+        if not names:
+            return np.zeros((0, len(self.skills)), dtype=bool)
+        width = int(self.skill_ids.max(initial=0)) + 1
+        row_bytes = -(-width // 8)
+        width_mask = (1 << width) - 1
+        bits = b"".join((self.vocabulary.mask(skills) & width_mask).to_bytes(row_bytes, "little")
+                        for skills in names)
+        packed = np.frombuffer(bits, dtype=np.uint8).reshape(len(names), row_bytes)
+        return np.unpackbits(packed, axis=1, count=width, bitorder="little")[:, self.skill_ids].astype(bool)
+
+    def match(self, profiles: Sequence[Profile], weighted: bool = False) -> np.ndarray:
+        """
+        Integer-encoded match matrix for one or more overlaid profiles
+
+        Cells are 0 where the industry does not require the skill, -w where no
+        profile has it (a gap) and w * holders where some do, with w the
+        importance weight (or 1 when unweighted). One unweighted profile gives
+        the familiar -1 / 0 / 1 grid.
+
+        Args:
+            profiles: Profiles to overlay
+            weighted: Scale cells by requirement importance
+
+        Returns:
+            industries x skills int8 matrix (int16 when the values need it)
+        """
+        holders = self.holdings(profiles).sum(axis=0, dtype=np.int32)
+        weights = (self.weights if weighted else self.required).astype(np.int32)
+        codes = np.where(holders > 0, weights * holders, -weights)
+        peak = int(weights.max(initial=0)) * max(len(profiles), 1)
+        return codes.astype(np.int8 if peak <= np.iinfo(np.int8).max else np.int16)
+
+
+def requirement_matrix(skills: pd.DataFrame, vocabulary: Optional[SkillVocabulary] = None) -> RequirementMatrix:
+    """
+    Requirement matrix from an industry_skills.csv-shaped frame
+
+    Duplicate (industry, skill) rows keep their highest importance; unknown
+    importance labels count as the lowest weight.
+
+    Args:
+        skills: Frame with industry, skill_name and importance columns
+        vocabulary: Vocabulary used to match profile skills
+
+    Returns:
+        RequirementMatrix with industries and skills in dataset order
+    """
+    industry_codes, industries = pd.factorize(skills["industry"].astype(str))
+    skill_codes, names = pd.factorize(skills["skill_name"].astype(str))
+    if "importance" in skills:
+        weights = skills["importance"].astype(str).map(IMPORTANCE_WEIGHTS).fillna(1).to_numpy(dtype=np.uint8)
+    else:
+        weights = np.ones(len(skills), dtype=np.uint8)
+    matrix = np.zeros((len(industries), len(names)), dtype=np.uint8)
+    np.maximum.at(matrix, (industry_codes, skill_codes), weights)
+    return RequirementMatrix(list(industries), list(names), matrix, vocabulary)
+
+
+def requirement_matrix_from_lists(requirements: Dict[str, List[str]],
+                                  vocabulary: Optional[SkillVocabulary] = None) -> RequirementMatrix:
+    """Unweighted requirement matrix from industry -> required skill names"""
+    frame = pd.DataFrame([(industry, skill) for industry, skills in requirements.items() for skill in skills],
+                         columns=["industry", "skill_name"])
+    return requirement_matrix(frame, vocabulary)
+
+
+def get_requirement_matrix(path: str = INDUSTRY_SKILLS_CSV) -> RequirementMatrix:
+    """Process-wide requirement matrix of the industry skills dataset, rebuilt when it changes"""
+    return _requirement_matrix(path, file_mtime(path))
+
+
+@lru_cache(maxsize=2)
+def _requirement_matrix(path: str, mtime_ns: int) -> RequirementMatrix:
+    return requirement_matrix(load_industry_skills(path))
+
+
+def clear_cache():
+    """Forget the cached requirement matrix"""
+    _requirement_matrix.cache_clear()
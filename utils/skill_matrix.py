@@ -0,0 +1,188 @@
+"""
+Skill Matrix
+Packed, memory-mappable profile x skill bitsets for population-scale scoring
+"""
+
+import json
+import struct
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import sys
+import os
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.readiness_score import EDUCATION_SCORES, FOUNDATIONAL_SKILLS, INDUSTRY_CERTS, ROLE_RELEVANCE
+from utils.role_resolver import get_role_resolver
+from utils.skill_vocabulary import SkillVocabulary, get_vocabulary
+
+# File layout: PREFIX (magic, version, header length, row count), a JSON header,
+# then fixed-width records starting on a DATA_ALIGNMENT boundary
+SKILL_MATRIX_MAGIC = b"SKMX"
+FORMAT_VERSION = 1
+PREFIX = struct.Struct("<4sHHIQ")
+ROWS_OFFSET = 12
+DATA_ALIGNMENT = 64
+
+# Extension used for packed population files
+SKILL_MATRIX_EXTENSION = ".skm"
+
+
+def record_dtype(row_bytes: int) -> np.dtype:
+    """One packed profile: skill bits (little bit order) plus the non-skill scoring inputs"""
+    return np.dtype([
+        ("skills", np.uint8, (row_bytes,)),
+        ("certifications", "<u8"),      # bit i set when cert_keywords[i] appears
+        ("experience_years", "<f4"),
+        ("projects", "<u2"),
+        ("role", "<i2"),                # index into roles, -1 when unknown
+        ("education", "i1")             # index into education_levels, len() when unknown
+    ], align=True)
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // DATA_ALIGNMENT) * DATA_ALIGNMENT
+
+
+class SkillMatrixWriter:
+    def __init__(self, path: str, vocabulary: Optional[SkillVocabulary] = None):
+        """
+        Stream profiles into a packed population file
+
+        Args:
+            path: Output file (conventionally .skm)
+            vocabulary: Skill vocabulary whose IDs become bit positions (the shared
+                industry_skills.csv vocabulary by default)
+        """
+        self.vocabulary = vocabulary or get_vocabulary()
+        # Foundational skills are scored but not listed in the dataset; give them columns too
+        for skill in FOUNDATIONAL_SKILLS:
+            self.vocabulary.intern(skill)
+        self.resolver = get_role_resolver()
+        self.width = len(self.vocabulary)
+        self.row_bytes = -(-self.width // 8)
+        self.dtype = record_dtype(self.row_bytes)
+        self.rows = 0
+
+        self.roles = list(dict.fromkeys([*self.resolver.roles, *ROLE_RELEVANCE]))
+        self._role_codes = {role: code for code, role in enumerate(self.roles)}
+        self.education_levels = list(EDUCATION_SCORES)
+        self.cert_keywords = sorted({keyword for keywords in INDUSTRY_CERTS.values() for keyword in keywords})
+
+        header = json.dumps({
+            "skills": [self.vocabulary.name(skill_id) for skill_id in range(self.width)],
+            "row_bytes": self.row_bytes,
+            "roles": self.roles,
+            "education_levels": self.education_levels,
+            "cert_keywords": self.cert_keywords
+        }).encode("utf-8")
+        self._handle = open(path, "wb")
+        self._handle.write(PREFIX.pack(SKILL_MATRIX_MAGIC, FORMAT_VERSION, 0, len(header), 0))
+        self._handle.write(header)
+        self._handle.write(b"\0" * (_aligned(PREFIX.size + len(header)) - PREFIX.size - len(header)))
+
+    def encode(self, profiles: Iterable[Dict]) -> np.ndarray:
+        """Pack profiles (calculate_readiness_score shape) into records"""
+        profiles = list(profiles)
+        records = np.zeros(len(profiles), dtype=self.dtype)
+        width_mask = (1 << self.width) - 1
+        levels = self.education_levels
+
+        # Skills the vocabulary learned after the writer opened have no column and are dropped
+        masks = (self.vocabulary.profile_mask(p.get("skills", {})) & width_mask for p in profiles)
+        bits = b"".join(mask.to_bytes(self.row_bytes, "little") for mask in masks)
+        records["skills"] = np.frombuffer(bits, dtype=np.uint8).reshape(len(profiles), self.row_bytes)
+
+        records["experience_years"] = [p.get("experience_years", 0) for p in profiles]
+        records["projects"] = [min(len(p.get("projects", [])), 0xFFFF) for p in profiles]
+        records["role"] = [self._role_codes.get(self.resolver.canonical_role(p.get("current_role", "")), -1)
+                           for p in profiles]
+        records["education"] = [
+            next((i for i, level in enumerate(levels) if level in p.get("education_level", "").lower()),
+                 len(levels))
+            for p in profiles
+        ]
+        records["certifications"] = [self._certification_bits(p.get("certifications", [])) for p in profiles]
+        return records
+
+    def _certification_bits(self, certifications: List[str]) -> int:
+        if not certifications:
+            return 0
+        cert_text = " ".join(certifications).lower()
+        return sum(1 << bit for bit, keyword in enumerate(self.cert_keywords) if keyword in cert_text)
+
+    def write(self, profiles: Iterable[Dict]) -> int:
+        """Append a batch of profiles; returns the number written"""
+        return self.write_records(self.encode(profiles))
+
+    def write_records(self, records: np.ndarray) -> int:
+        """Append already packed records (from encode() or another file's chunks)"""
+        if records.dtype != self.dtype:
+            raise ValueError(f"records must have dtype {self.dtype}, got {records.dtype}")
+        self._handle.write(np.ascontiguousarray(records).tobytes())
+        self.rows += len(records)
+        return len(records)
+
+    def close(self):
+        """Record the final row count in the prefix and close the file"""
+        if self._handle.closed:
+            return
+        self._handle.seek(ROWS_OFFSET)
+        self._handle.write(struct.pack("<Q", self.rows))
+        self._handle.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class SkillMatrix:
+    def __init__(self, path: str):
+        """
+        Memory-map a packed population file read-only
+
+        Args:
+            path: File written by SkillMatrixWriter
+        """
+        with open(path, "rb") as handle:
+            prefix = handle.read(PREFIX.size)
+            if len(prefix) < PREFIX.size or prefix[:4] != SKILL_MATRIX_MAGIC:
+                raise ValueError(f"{path} is not a skill matrix file")
+            _, version, _, header_length, rows = PREFIX.unpack(prefix)
+            if version != FORMAT_VERSION:
+                raise ValueError(f"{path} has unsupported skill matrix version {version}")
+            header = json.loads(handle.read(header_length).decode("utf-8"))
+
+        self.path = path
+        self.skills: List[str] = header["skills"]
+        self.roles: List[str] = header["roles"]
+        self.education_levels: List[str] = header["education_levels"]
+        self.cert_keywords: List[str] = header["cert_keywords"]
+        self.dtype = record_dtype(header["row_bytes"])
+        offset = _aligned(PREFIX.size + header_length)
+        if rows:
+            self.records = np.memmap(path, dtype=self.dtype, mode="r", offset=offset, shape=(rows,))
+        else:
+            self.records = np.zeros(0, dtype=self.dtype)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def chunks(self, chunk_rows: int = 8192) -> Iterator[Tuple[int, np.ndarray]]:
+        """(first row, records) views over consecutive slices of the mapped file"""
+        for start in range(0, len(self.records), chunk_rows):
+            yield start, self.records[start:start + chunk_rows]
+
+    def skill_bits(self, records: np.ndarray) -> np.ndarray:
+        """Unpack records into a rows x skills 0/1 uint8 matrix in file column order"""
+        return np.unpackbits(records["skills"], axis=1, count=len(self.skills), bitorder="little")
+
+    def vocabulary_ids(self, vocabulary: Optional[SkillVocabulary] = None) -> np.ndarray:
+        """Vocabulary ID of each file column (-1 for skills the vocabulary does not know)"""
+        vocabulary = vocabulary or get_vocabulary()
+        ids = [vocabulary.lookup(name) for name in self.skills]
+        return np.array([-1 if skill_id is None else skill_id for skill_id in ids], dtype=np.intp)
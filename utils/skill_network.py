@@ -0,0 +1,256 @@
+"""
+Skill Network
+Skill co-occurrence graphs with deterministic, vectorized force-directed layouts
+"""
+
+import threading
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.data_loader import INDUSTRY_SKILLS_CSV, file_mtime, load_industry_skills
+from utils.skill_vocabulary import normalize_skill
+
+LAYOUT_SEED = 42
+LAYOUT_ITERATIONS = 50
+
+# Node pairs evaluated per block of the O(n^2) repulsion step (bounds peak memory)
+REPULSION_BLOCK_PAIRS = 1 << 21
+
+# Distinct (skill set, seed) layouts kept in memory
+LAYOUT_CACHE_SIZE = 64
+
+# Layouts keyed on (graph key, seed, iterations); FIFO-evicted at LAYOUT_CACHE_SIZE
+_layouts: Dict[Tuple, np.ndarray] = {}
+_layouts_lock = threading.Lock()
+
+
+class SkillNetwork:
+    def __init__(self, names: List[str], source: np.ndarray, target: np.ndarray, weight: np.ndarray):
+        """
+        Undirected weighted skill graph
+
+        Args:
+            names: Node display names
+            source: Edge start node per edge (source < target)
+            target: Edge end node per edge
+            weight: Edge weight (e.g. industries the two skills share)
+        """
+        self.names = list(names)
+        self.source = np.asarray(source, dtype=np.int64)
+        self.target = np.asarray(target, dtype=np.int64)
+        self.weight = np.asarray(weight, dtype=float)
+        self.degree = (np.bincount(self.source, minlength=len(self.names)) +
+                       np.bincount(self.target, minlength=len(self.names)))
+        # Identity of the graph for layout caching
+        self.key = (tuple(self.names), self.source.tobytes(), self.target.tobytes(), self.weight.tobytes())
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.source)
+
+
+def build_network(names: List[str], source: np.ndarray, target: np.ndarray,
+                  weight: Optional[np.ndarray] = None) -> SkillNetwork:
+    """Network from raw node-index pairs; self loops are dropped and duplicate pairs summed"""
+    source, target = np.asarray(source, dtype=np.int64), np.asarray(target, dtype=np.int64)
+    weight = np.ones(len(source)) if weight is None else np.asarray(weight, dtype=float)
+    keep = source != target
+    low, high = np.minimum(source, target)[keep], np.maximum(source, target)[keep]
+    codes, inverse = np.unique(low * len(names) + high, return_inverse=True)
+    summed = np.bincount(inverse.ravel(), weights=weight[keep], minlength=len(codes))
+    return SkillNetwork(names, codes // len(names), codes % len(names), summed)
+
+
+def network_from_connections(skills: Iterable[str], connections: Dict[str, List[str]]) -> SkillNetwork:
+    """Network over the given skills with an edge for each connection between two of them"""
+    names = list(dict.fromkeys(skills))
+    index = {normalize_skill(name): node for node, name in enumerate(names)}
+    pairs = [(index[normalize_skill(skill)], index[normalize_skill(other)])
+             for skill, related in connections.items() if normalize_skill(skill) in index
+             for other in related if normalize_skill(other) in index]
+    source, target = (np.array(side, dtype=np.int64) for side in zip(*pairs)) if pairs else ([], [])
+    return build_network(names, source, target)
+
+
+def cooccurrence_network(skills: pd.DataFrame, group_column: str = "industry") -> SkillNetwork:
+    """
+    Skills linked by how many groups (industries) list both
+
+    Args:
+        skills: Frame with skill_name and group_column columns (industry_skills.csv layout)
+        group_column: Column whose groups define co-occurrence
+
+    Returns:
+        SkillNetwork with one node per normalized skill name
+    """
+    keys = skills["skill_name"].astype(str).map(normalize_skill)
+    codes, uniques = pd.factorize(keys)
+    names = (skills["skill_name"].astype(str).groupby(codes).first().reindex(range(len(uniques))).tolist())
+    groups = pd.factorize(skills[group_column].astype(str))[0]
+
+    # Every pair of distinct skills within a group, generated group by group
+    order = np.argsort(groups, kind="stable")
+    bounds = np.flatnonzero(np.diff(groups[order])) + 1
+    sources, targets = [], []
+    for members in np.split(codes[order], bounds):
+        members = np.unique(members)
+        upper, lower = np.triu_indices(len(members), 1)
+        sources.append(members[upper])
+        targets.append(members[lower])
+    source = np.concatenate(sources) if sources else np.zeros(0, dtype=np.int64)
+    target = np.concatenate(targets) if targets else np.zeros(0, dtype=np.int64)
+    return build_network(names, source, target)
+
+
+def get_skill_network(path: str = INDUSTRY_SKILLS_CSV) -> SkillNetwork:
+    """Process-wide co-occurrence network of the industry skills dataset, rebuilt when it changes"""
+    return _network(path, file_mtime(path))
+
+
+@lru_cache(maxsize=2)
+def _network(path: str, mtime_ns: int) -> SkillNetwork:
+    return cooccurrence_network(load_industry_skills(path))
+
+
+def _adjacency_product(network: SkillNetwork, vectors: np.ndarray) -> np.ndarray:
+    """Weighted adjacency matrix times vectors (n x m), in O(edges)"""
+    result = np.zeros_like(vectors)
+    for column in range(vectors.shape[1]):
+        values = vectors[:, column]
+        result[:, column] = (
+            np.bincount(network.source, weights=network.weight * values[network.target], minlength=len(network)) +
+            np.bincount(network.target, weights=network.weight * values[network.source], minlength=len(network))
+        )
+    return result
+
+
+def spectral_layout(network: SkillNetwork, seed: int = LAYOUT_SEED, iterations: int = 100) -> np.ndarray:
+    """
+    Positions from the two leading non-trivial eigenvectors of the random-walk matrix
+
+    Orthogonal iteration with sparse (edge list) products, so the cost is
+    O(edges x iterations) with no dense n x n matrix.
+    """
+    n = len(network)
+    rng = np.random.default_rng(seed)
+    if n < 3 or network.edge_count == 0:
+        return rng.random((n, 2))
+
+    degree = np.bincount(network.source, weights=network.weight, minlength=n) + \
+        np.bincount(network.target, weights=network.weight, minlength=n)
+    degree = np.maximum(degree, 1e-9)
+    stationary = degree / degree.sum()
+
+    vectors = rng.standard_normal((n, 2))
+    for _ in range(iterations):
+        # Lazy walk (I + D^-1 A) / 2 keeps eigenvalues non-negative; project out the trivial one
+        vectors = (vectors + _adjacency_product(network, vectors) / degree[:, None]) / 2
+        vectors -= np.outer(np.ones(n), stationary @ vectors)
+        vectors, _ = np.linalg.qr(vectors)
+    return vectors
+
+
+def force_layout(network: SkillNetwork, seed: int = LAYOUT_SEED, iterations: int = LAYOUT_ITERATIONS,
+                 initial: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Fruchterman-Reingold layout, vectorized over complex positions
+
+    Repulsion for node i is k^2 * conj(sum_j 1 / (z_i - z_j)), evaluated in float32
+    blocks of rows so memory stays bounded; attraction runs over the edge list.
+
+    Args:
+        network: Graph to lay out
+        seed: Seed for the spectral start and tie-breaking jitter (same seed, same layout)
+        iterations: Cooling steps
+        initial: Starting positions (n x 2); spectral layout by default
+
+    Returns:
+        n x 2 positions scaled into [0, 1]
+    """
+    n = len(network)
+    if n == 0:
+        return np.zeros((0, 2))
+    if n == 1:
+        return np.full((1, 2), 0.5)
+
+    rng = np.random.default_rng(seed)
+    start = spectral_layout(network, seed) if initial is None else np.asarray(initial, dtype=float)
+    start = (start - start.min(axis=0)) / np.maximum(np.ptp(start, axis=0), 1e-12)
+    # Jitter separates nodes the spectral start puts on the same point (e.g. clique members)
+    z = (start[:, 0] + 1j * start[:, 1]) + 0.01 * (rng.random(n) + 1j * rng.random(n))
+
+    k = 1.0 / np.sqrt(n)
+    block = max(1, REPULSION_BLOCK_PAIRS // n)
+    temperature = 0.1
+    cooling = temperature / (iterations + 1)
+    for _ in range(iterations):
+        # Repulsion in float32 real arithmetic: sum_j d_ij / |d_ij|^2 == conj(sum_j 1 / d_ij)
+        x, y = z.real.astype(np.float32), z.imag.astype(np.float32)
+        displacement = np.empty(n, dtype=complex)
+        for first in range(0, n, block):
+            last = min(first + block, n)
+            dx = np.subtract.outer(x[first:last], x)
+            dy = np.subtract.outer(y[first:last], y)
+            inverse = dx * dx
+            inverse += dy * dy
+            inverse[np.arange(last - first), np.arange(first, last)] = np.inf
+            np.reciprocal(inverse, out=inverse)
+            displacement[first:last] = (np.einsum("ij,ij->i", dx, inverse) +
+                                        1j * np.einsum("ij,ij->i", dy, inverse)) * (k * k)
+
+        delta = z[network.source] - z[network.target]
+        pull = delta * np.abs(delta) / k * network.weight
+        displacement -= np.bincount(network.source, weights=pull.real, minlength=n) + \
+            1j * np.bincount(network.source, weights=pull.imag, minlength=n)
+        displacement += np.bincount(network.target, weights=pull.real, minlength=n) + \
+            1j * np.bincount(network.target, weights=pull.imag, minlength=n)
+
+        length = np.maximum(np.abs(displacement), 1e-12)
+        z += displacement / length * np.minimum(length, temperature)
+        temperature -= cooling
+
+    positions = np.column_stack([z.real, z.imag])
+    return (positions - positions.min(axis=0)) / np.maximum(np.ptp(positions, axis=0), 1e-12)
+
+
+def get_layout(network: SkillNetwork, seed: int = LAYOUT_SEED, iterations: int = LAYOUT_ITERATIONS) -> np.ndarray:
+    """
+    Force layout cached per (graph, seed, iterations)
+
+    Args:
+        network: Graph to lay out
+        seed: Layout seed
+        iterations: Cooling steps
+
+    Returns:
+        Read-only n x 2 positions in [0, 1], shared between callers
+    """
+    cache_key = (network.key, seed, iterations)
+    with _layouts_lock:
+        positions = _layouts.get(cache_key)
+    if positions is None:
+        positions = force_layout(network, seed, iterations)
+        positions.flags.writeable = False
+        with _layouts_lock:
+            if len(_layouts) >= LAYOUT_CACHE_SIZE:
+                _layouts.pop(next(iter(_layouts)))
+            _layouts[cache_key] = positions
+    return positions
+
+
+def clear_cache():
+    """Forget cached networks and layouts"""
+    _network.cache_clear()
+    with _layouts_lock:
+        _layouts.clear()
@@ -0,0 +1,156 @@
+"""
+Skill Vocabulary
+Interns every known skill to an integer ID so skill matching is a bitset test
+"""
+
+import threading
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.data_loader import INDUSTRY_SKILLS_CSV, load_industry_skills
+
+# Spellings that refer to the same skill (normalized form -> canonical form)
+SKILL_ALIASES = {
+    "web3.js": "web3",
+    "web3js": "web3",
+    "nodejs": "node.js",
+    "node": "node.js",
+    "js": "javascript",
+    "r programming": "r",
+    "cpp": "c++",
+    "ml": "machine learning",
+    "ai": "artificial intelligence",
+    "natural language processing": "nlp",
+    "data analytics": "data analysis",
+    "water quality analysis": "water quality",
+    "maths": "mathematics",
+    "math": "mathematics",
+    "stats": "statistics",
+}
+
+
+@lru_cache(maxsize=8192)
+def normalize_skill(name: str) -> str:
+    """Lowercase, trim and collapse whitespace, then resolve aliases"""
+    normalized = " ".join(name.lower().split())
+    return SKILL_ALIASES.get(normalized, normalized)
+
+
+class SkillVocabulary:
+    def __init__(self, skills: Iterable[str] = ()):
+        """Initialize vocabulary, interning any skills given up front"""
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        # Bits set when a user has a skill: its own bit plus any composite
+        # requirement it satisfies (e.g. "Python" satisfies "R/Python")
+        self._bits: List[int] = []
+        self._lock = threading.Lock()
+        for skill in skills:
+            self.intern(skill)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return normalize_skill(name) in self._ids
+
+    def intern(self, name: str) -> int:
+        """Return the ID for a skill, registering it if unseen"""
+        skill_id = self._ids.get(normalize_skill(name))
+        if skill_id is not None:
+            return skill_id
+        with self._lock:
+            return self._intern_locked(name)
+
+    def _intern_locked(self, name: str) -> int:
+        # The vocabulary is shared by every session, so registration and the
+        # composite-part bit updates all happen under the lock
+        key = normalize_skill(name)
+        skill_id = self._ids.get(key)
+        if skill_id is not None:
+            return skill_id
+        skill_id = len(self._names)
+        self._names.append(name.strip())
+        self._bits.append(1 << skill_id)
+
+        # Composite skills ("R/Python") are satisfied by any of their parts
+        if "/" in key:
+            for part in key.split("/"):
+                if part.strip():
+                    part_id = self._intern_locked(part)
+                    self._bits[part_id] |= 1 << skill_id
+
+        # Published last, so lock-free lookups never see a composite before its parts are linked
+        self._ids[key] = skill_id
+        return skill_id
+
+    def lookup(self, name: str) -> Optional[int]:
+        """Return the ID for a skill, or None if it is not in the vocabulary"""
+        return self._ids.get(normalize_skill(name))
+
+    def name(self, skill_id: int) -> str:
+        """Display name a skill was first interned with"""
+        return self._names[skill_id]
+
+    def mask(self, skills: Iterable[str]) -> int:
+        """Bitset of the known skills in an iterable of names"""
+        mask = 0
+        for skill in skills:
+            skill_id = self._ids.get(normalize_skill(skill))
+            if skill_id is not None:
+                mask |= self._bits[skill_id]
+        return mask
+
+    def profile_mask(self, user_skills: Dict[str, List[str]]) -> int:
+        """Bitset of the known skills in a categorized profile skills dict"""
+        mask = 0
+        for skills in user_skills.values():
+            mask |= self.mask(skills)
+        return mask
+
+    def ids(self, skills: Iterable[str]) -> FrozenSet[int]:
+        """Frozen set of IDs covered by an iterable of names"""
+        return frozenset(self.ids_of_mask(self.mask(skills)))
+
+    @staticmethod
+    def has(mask: int, skill_id: int) -> bool:
+        """O(1) membership test of a skill ID in a bitset"""
+        return (mask >> skill_id) & 1 == 1
+
+    @staticmethod
+    def ids_of_mask(mask: int) -> List[int]:
+        """Expand a bitset into the sorted skill IDs it contains"""
+        ids = []
+        while mask:
+            low = mask & -mask
+            ids.append(low.bit_length() - 1)
+            mask ^= low
+        return ids
+
+
+def _load_dataset_skills(path: str = INDUSTRY_SKILLS_CSV) -> List[str]:
+    """Skill names listed in the industry skills dataset"""
+    try:
+        return load_industry_skills(path)["skill_name"].tolist()
+    except FileNotFoundError:
+        return []
+
+
+_shared_vocabulary: Optional[SkillVocabulary] = None
+_shared_lock = threading.Lock()
+
+
+def get_vocabulary() -> SkillVocabulary:
+    """Process-wide vocabulary seeded from the industry skills dataset"""
+    global _shared_vocabulary
+    if _shared_vocabulary is None:
+        with _shared_lock:
+            if _shared_vocabulary is None:
+                skills = _load_dataset_skills()
+                _shared_vocabulary = SkillVocabulary(skills)
+    return _shared_vocabulary